@@ -0,0 +1,5 @@
+"""
+Benchmarks of the project. Each module can be run from the root directory
+of the project with `python -m bench.<module>`, and `python -m bench` runs the whole suite
+(`bench_suite.py`).
+"""
@@ -0,0 +1,4 @@
+"""Runs the whole benchmark suite (see `bench_suite.py`): `python -m bench`"""
+from .bench_suite import main
+
+main()
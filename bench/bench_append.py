@@ -0,0 +1,70 @@
+"""
+Compares the throughput of appending to the growable arrays against a
+Python `list` and against the previous two-pass approach of the loader
+(collecting the elements in an `LList` to learn their number, then copying
+them into an `ObjArr` of that exact capacity).
+
+Usage: `python -m bench.bench_append [--items 1000000]`
+"""
+import argparse
+
+from src.utilities.data_structures.intArr import IntArr
+from src.utilities.data_structures.lList import LList
+from src.utilities.data_structures.objArr import ObjArr
+from src.utilities.data_structures.strArr import StrArr
+from .timing import time_call
+
+
+def fill_list(values: list) -> list:
+    result: list = []
+    for value in values:
+        result.append(value)
+    return result
+
+
+def fill_by_append(array_type: type, values: list):
+    result = array_type(0)
+    for value in values:
+        result.append(value)
+    return result
+
+
+def fill_two_pass(values: list) -> ObjArr:
+    """The loader before the arrays could grow"""
+    rows: LList = LList()
+    for value in values:
+        rows.add(value)
+    result: ObjArr = ObjArr(len(rows))
+    k: int = 0
+    for value in rows:
+        result[k] = value
+        k += 1
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    numbers: list = list(range(args.items))
+    strings: list = [f"({i % 100000:05d}) Estación" for i in range(args.items)]
+    objects: list = [(i,) for i in range(args.items)]
+
+    cases: list = [
+        ("list.append (objects)", fill_list, objects),
+        ("ObjArr.append", lambda values: fill_by_append(ObjArr, values), objects),
+        ("LList + ObjArr (two passes)", fill_two_pass, objects),
+        ("list.append (ints)", fill_list, numbers),
+        ("IntArr.append", lambda values: fill_by_append(IntArr, values), numbers),
+        ("list.append (strings)", fill_list, strings),
+        ("StrArr.append", lambda values: fill_by_append(StrArr, values), strings),
+    ]
+    for name, function, values in cases:
+        result, seconds = time_call(function, values)
+        assert len(result) == args.items
+        print(f"{name:<28} {seconds:6.2f} s ({args.items / seconds:,.0f} items/s)")
+
+
+if __name__ == "__main__":
+    main()
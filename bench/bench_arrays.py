@@ -0,0 +1,66 @@
+"""
+Compares the per-element get/set and iteration speed of the pure Python
+arrays (with `ctypes`) against the compiled ones (`_arrays.pyx`, built with
+`python setup.py build_ext --inplace`).
+
+Usage: `python -m bench.bench_arrays [--items 1000000]`
+"""
+import argparse
+
+from src.utilities.data_structures import _backend, boolArr, intArr, objArr, strArr
+from .timing import time_call
+
+
+def set_all(arr, values: list) -> None:
+    for i, value in enumerate(values):
+        arr[i] = value
+
+
+def get_all(arr, items: int) -> None:
+    for i in range(items):
+        arr[i]
+
+
+def iterate(arr) -> None:
+    for _ in arr:
+        pass
+
+
+def measure(array_type: type, values: list) -> dict:
+    """Returns the seconds it takes to set, get and iterate over every element"""
+    arr = array_type(len(values))
+    _, set_seconds = time_call(set_all, arr, values)
+    _, get_seconds = time_call(get_all, arr, len(values))
+    _, iter_seconds = time_call(iterate, arr)
+    return {"set": set_seconds, "get": get_seconds, "iter": iter_seconds}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases: list = [
+        ("IntArr", intArr.PyIntArr, list(range(args.items))),
+        ("BoolArr", boolArr.PyBoolArr, [i % 3 == 0 for i in range(args.items)]),
+        ("StrArr", strArr.PyStrArr, [f"({i % 100000:05d}) Estación" for i in range(args.items)]),
+        ("ObjArr", objArr.PyObjArr, [(i,) for i in range(args.items)]),
+    ]
+    compiled = _backend.compiled
+    if compiled is None:
+        print("The compiled arrays are not built (python setup.py build_ext --inplace), only the pure Python ones are measured")
+    print(f"{'':<8} {'operation':<9} {'python':>9} {'compiled':>9} {'speedup':>8}  (ns per element)")
+    for name, python_type, values in cases:
+        python: dict = measure(python_type, values)
+        fast: dict = measure(getattr(compiled, name), values) if compiled is not None else None
+        for operation in ("set", "get", "iter"):
+            python_ns: float = python[operation] / args.items * 1e9
+            if fast is None:
+                print(f"{name:<8} {operation:<9} {python_ns:9.0f}")
+            else:
+                fast_ns: float = fast[operation] / args.items * 1e9
+                print(f"{name:<8} {operation:<9} {python_ns:9.0f} {fast_ns:9.0f} {python_ns / fast_ns:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Measures the indexed access to an `LList` in order (`llist[i]` for every
+`i`), which used to walk from the head on every access (quadratic in the
+number of nodes). With the cursor it takes about the same time per access
+at every size, i.e. the total grows linearly.
+
+Usage: `python -m bench.bench_llist [--sizes 10000 100000 1000000]`
+"""
+import argparse
+
+from src.utilities.data_structures.lList import LList
+from .timing import time_call
+
+
+def read_in_order(llist: LList) -> int:
+    total: int = 0
+    for i in range(len(llist)):
+        total += llist[i]
+    return total
+
+
+def pop_all(llist: LList) -> None:
+    for _ in range(len(llist)):
+        llist.pop_front()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'values':>9} {'extend':>9} {'llist[i]':>9} {'ns/access':>10} {'pop_front':>10}")
+    for size in args.sizes:
+        llist: LList = LList()
+        _, extend_seconds = time_call(llist.extend, range(size))
+        total, read_seconds = time_call(read_in_order, llist)
+        assert total == size * (size - 1) // 2
+        _, pop_seconds = time_call(pop_all, llist)
+        print(f"{size:>9} {extend_seconds:8.3f}s {read_seconds:8.3f}s {read_seconds / size * 1e9:10.0f} {pop_seconds:9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
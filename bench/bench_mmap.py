@@ -0,0 +1,40 @@
+"""
+Compares the chunked reader against the memory-mapped one on a synthetic
+validation file.
+
+Usage: `python -m bench.bench_mmap [--rows 5000000] [--start 0] [--end 24]`
+"""
+import argparse
+import os
+import tempfile
+
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.data_getter.synthetic import write_validation_file
+from src.utilities.objects.route_list import k16
+from .timing import time_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--end", type=int, default=24)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name: str = os.path.join(directory, "synthetic.csv")
+        _, seconds = time_call(write_validation_file, file_name, args.rows)
+        print(f"Generated {args.rows} rows ({os.path.getsize(file_name) / 2**20:.1f} MiB) in {seconds:.2f} s")
+
+        route = k16()
+        streamed, stream_seconds = time_call(create_data_array, file_name, route, args.start, args.end)
+        mapped, mmap_seconds = time_call(create_data_array, file_name, route, args.start, args.end, use_mmap=True)
+        assert len(streamed) == len(mapped)
+        print(f"Matching rows: {len(mapped)}")
+        print(f"chunked: {stream_seconds:.2f} s ({args.rows / stream_seconds:,.0f} rows/s)")
+        print(f"mmap:    {mmap_seconds:.2f} s ({args.rows / mmap_seconds:,.0f} rows/s)")
+        print(f"speedup: {stream_seconds / mmap_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Benchmark suite of the data structures and the data getter, meant to be
+run before every release to track regressions (see `--json`).
+
+- Structures: per-element set, get, iteration and `in` (a value that isn't
+  there, so the whole structure is scanned) of `IntArr`, `BoolArr`,
+  `StrArr`, `ObjArr` and `LList` at several sizes, next to the same
+  operations on a `list`, an `array.array` and a NumPy array (if it is
+  installed), plus the peak memory of building every structure.
+- Data getter: `create_data_array` (chunked and memory-mapped) and
+  `create_validations` on synthetic validation files (see `synthetic.py`)
+  of several sizes, next to a plain `str.split` of every row, with their
+  throughput and peak memory.
+
+Everything is generated with fixed seeds, and every timing is the best of
+`--repeat` runs. The peak memory is measured with `tracemalloc` in a
+separate run, so it doesn't slow the timed ones down.
+
+Usage: `python -m bench [--sizes 1000 100000 1000000] [--rows 10000 1000000 10000000]
+[--repeat 3] [--data-dir DIR] [--skip-structures] [--skip-loader] [--json results.json]`
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from array import array
+
+from src.utilities.data_getter import tokenizer
+from src.utilities.data_getter.data_array import create_data_array, create_validations
+from src.utilities.data_getter.synthetic import write_validation_file
+from src.utilities.data_structures import _backend
+from src.utilities.data_structures.boolArr import BoolArr
+from src.utilities.data_structures.intArr import IntArr
+from src.utilities.data_structures.lList import LList
+from src.utilities.data_structures.objArr import ObjArr
+from src.utilities.data_structures.strArr import StrArr
+from src.utilities.objects.route_list import k16
+from .timing import time_call
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def peak_memory(function) -> int:
+    """Returns the peak of memory (in bytes) allocated during a call"""
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+#*Structure operations. `create` returns an empty structure with room for
+#*`size` values, and `fill` stores them (in order)
+def set_all(structure, values: list) -> None:
+    for i, value in enumerate(values):
+        structure[i] = value
+
+
+def add_all(structure, values: list) -> None:
+    for value in values:
+        structure.add(value)
+
+
+def get_all(structure, size: int) -> None:
+    for i in range(size):
+        structure[i]
+
+
+def iterate(structure) -> None:
+    for _ in structure:
+        pass
+
+
+def structure_cases() -> list:
+    """
+    Returns the `(structure, kind, create, fill, missing)` of every case:
+    the values it holds, how to create it empty, how to store the values and
+    a value that isn't among them.
+    """
+    cases: list = [
+        ("IntArr", "int", IntArr, set_all, -1),
+        ("BoolArr", "bool", BoolArr, set_all, None),
+        ("StrArr", "str", StrArr, set_all, "missing"),
+        ("ObjArr", "object", ObjArr, set_all, (-1,)),
+        ("LList", "object", lambda size: LList(), add_all, (-1,)),
+        ("list", "int", lambda size: [0] * size, set_all, -1),
+        ("list", "bool", lambda size: [False] * size, set_all, None),
+        ("list", "str", lambda size: [""] * size, set_all, "missing"),
+        ("list", "object", lambda size: [None] * size, set_all, (-1,)),
+        ("array", "int", lambda size: array("i", bytes(4 * size)), set_all, -1),
+        ("array", "bool", lambda size: array("b", bytes(size)), set_all, None),
+    ]
+    if numpy is not None:
+        cases += [
+            ("numpy", "int", lambda size: numpy.zeros(size, dtype=numpy.int32), set_all, -1),
+            ("numpy", "bool", lambda size: numpy.zeros(size, dtype=numpy.bool_), set_all, None),
+        ]
+    return cases
+
+
+def structure_values(kind: str, size: int) -> list:
+    """Returns the values of a case (the same at every run)"""
+    if kind == "int":
+        return list(range(size))
+    if kind == "bool":
+        return [i % 3 == 0 for i in range(size)]
+    if kind == "str":
+        return [f"({i % 100000:05d})Estación" for i in range(size)]
+    return [(i,) for i in range(size)]
+
+
+def fill_and_return(create, fill, size: int, values: list):
+    """Creates a structure and stores the values (what `peak_memory` measures)"""
+    structure = create(size)
+    fill(structure, values)
+    return structure
+
+
+def bench_structures(sizes: list, repeat: int) -> list:
+    """Returns the results of every structure, size and operation"""
+    results: list = []
+    for size in sizes:
+        for name, kind, create, fill, missing in structure_cases():
+            values: list = structure_values(kind, size)
+            structure = create(size)
+            fill(structure, values)
+            if kind == "bool":
+                #*A value that isn't there (every position is set to True)
+                missing = False
+                structure = create(size)
+                fill(structure, [True] * size)
+            seconds: dict = {
+                "set": time_call(lambda: fill(create(size), values), repeat=repeat)[1],
+                "get": time_call(lambda: get_all(structure, size), repeat=repeat)[1],
+                "iterate": time_call(lambda: iterate(structure), repeat=repeat)[1],
+                "contains": time_call(lambda: missing in structure, repeat=repeat)[1],
+            }
+            memory: int = peak_memory(lambda: fill_and_return(create, fill, size, values))
+            for operation, elapsed in seconds.items():
+                results.append({
+                    "structure": name, "values": kind, "size": size, "operation": operation,
+                    "seconds": elapsed, "ns_per_element": elapsed / max(size, 1) * 1e9,
+                    "elements_per_second": size / elapsed if elapsed > 0 else None,
+                    "peak_bytes": memory,
+                })
+    return results
+
+
+def validation_file(directory: str, rows: int) -> str:
+    """Returns a synthetic file with `rows` rows, writing it if it doesn't exist yet"""
+    file_name: str = os.path.join(directory, f"synthetic_{rows}.csv")
+    if not os.path.exists(file_name):
+        write_validation_file(file_name, rows)
+    return file_name
+
+
+def split_baseline(file_name: str) -> list:
+    """The plainest loader: every row of the route's zones split with `str.split`"""
+    zones: set = set(k16().zone_names)
+    with open(file_name, encoding="utf-8") as file:
+        next(file)
+        return [fields for fields in (line.rstrip("\n").split(",") for line in file) if fields[2] in zones]
+
+
+def bench_loader(rows_list: list, repeat: int, directory: str) -> list:
+    """Returns the results of every loader and file size"""
+    route = k16()
+    loaders: list = [
+        ("str.split baseline", lambda file_name: split_baseline(file_name)),
+        ("create_data_array", lambda file_name: create_data_array(file_name, route, 0, 24)),
+        ("create_data_array (mmap)", lambda file_name: create_data_array(file_name, route, 0, 24, use_mmap=True)),
+        ("create_validations", lambda file_name: create_validations(file_name, route, 0, 24)),
+    ]
+    results: list = []
+    for rows in rows_list:
+        file_name: str = validation_file(directory, rows)
+        size: int = os.path.getsize(file_name)
+        for name, loader in loaders:
+            matching: int = len(loader(file_name))
+            elapsed: float = time_call(lambda: loader(file_name), repeat=repeat)[1]
+            results.append({
+                "loader": name, "rows": rows, "file_bytes": size, "matching_rows": matching,
+                "seconds": elapsed, "rows_per_second": rows / elapsed, "mib_per_second": size / 2**20 / elapsed,
+                "peak_bytes": peak_memory(lambda: loader(file_name)),
+            })
+    return results
+
+
+def environment() -> dict:
+    """Returns what the results depend on, to compare them between runs"""
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "compiled_arrays": _backend.compiled is not None,
+        "compiled_tokenizer": tokenizer.scan_rows is not tokenizer.py_scan_rows,
+        "numpy": None if numpy is None else numpy.__version__,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", help="Where the synthetic files are kept between runs (default is a temporary directory)")
+    parser.add_argument("--skip-structures", action="store_true")
+    parser.add_argument("--skip-loader", action="store_true")
+    parser.add_argument("--json", help="Writes the results to this file")
+    args = parser.parse_args()
+
+    report: dict = {"environment": environment(), "structures": [], "loader": []}
+    print(", ".join(f"{key}: {value}" for key, value in report["environment"].items()))
+    if not args.skip_structures:
+        report["structures"] = bench_structures(args.sizes, args.repeat)
+        print(f"\n{'structure':<8} {'values':<7} {'size':>9} {'operation':<9} {'ns/element':>11} {'peak MiB':>9}")
+        for result in report["structures"]:
+            print(f"{result['structure']:<8} {result['values']:<7} {result['size']:>9} {result['operation']:<9} "
+                  f"{result['ns_per_element']:11.1f} {result['peak_bytes'] / 2**20:9.2f}")
+    if not args.skip_loader:
+        if args.data_dir:
+            os.makedirs(args.data_dir, exist_ok=True)
+            report["loader"] = bench_loader(args.rows, args.repeat, args.data_dir)
+        else:
+            with tempfile.TemporaryDirectory() as directory:
+                report["loader"] = bench_loader(args.rows, args.repeat, directory)
+        print(f"\n{'loader':<25} {'rows':>9} {'matching':>9} {'seconds':>8} {'rows/s':>11} {'MiB/s':>7} {'peak MiB':>9}")
+        for result in report["loader"]:
+            print(f"{result['loader']:<25} {result['rows']:>9} {result['matching_rows']:>9} {result['seconds']:8.3f} "
+                  f"{result['rows_per_second']:11,.0f} {result['mib_per_second']:7.1f} {result['peak_bytes'] / 2**20:9.1f}")
+    if args.json:
+        with open(args.json, mode="w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
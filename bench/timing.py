@@ -0,0 +1,22 @@
+"""
+Timing helper shared by the benchmarks.
+"""
+import time
+
+
+def time_call(function, *args, repeat: int = 1, **kwargs) -> tuple:
+    """
+    Calls a function `repeat` times (default is once).
+
+    Returns
+    -------
+    tuple
+        The result of the last call and the seconds of the fastest one.
+    """
+    best: float = float("inf")
+    result = None
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        result = function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return result, best
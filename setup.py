@@ -1,6 +1,12 @@
 from setuptools import setup
 from Cython.Build import cythonize
 
+#*Compiled versions of the arrays (see src/utilities/data_structures/_backend.py)
+#*and of the tokenizer of the validation files (see src/utilities/data_getter/tokenizer.py).
+#*Build them in place with `python setup.py build_ext --inplace`
 setup(
-    ext_modules=cythonize("DS/arr.pyx"),
-)
\ No newline at end of file
+    ext_modules=cythonize([
+        "src/utilities/data_structures/_arrays.pyx",
+        "src/utilities/data_getter/_tokenizer.pyx",
+    ]),
+)
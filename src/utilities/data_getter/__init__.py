@@ -0,0 +1,15 @@
+from .aggregate import add_rows, aggregate_ridership, aggregate_validations
+from .chunked import create_data_array_parallel, split_ranges
+from .columnar import ColumnarDay, load_columnar, write_columnar
+from .data_array import create_data_array, create_data_array_where, create_validations, select_rows, select_where
+from .encoded import create_encoded_columns
+from .incremental import TailFollower
+from .mmap_reader import read_rows_mmap
+from .multi_day import create_data_arrays
+from .multi_route import RouteIndex, create_route_data_arrays
+from .offset_index import build_index, load_index, read_rows_indexed
+from .predicates import (Accesses, And, Devices, MinEntrances, MinExits, OnRoute, Or, Predicate, Stations, TimeRange,
+                         Zones, plan_scan)
+from .result_cache import ResultCache
+from .row_reader import filter_rows, iter_lines, read_lines, read_rows, scan_file
+from .tokenizer import py_scan_rows, scan_rows
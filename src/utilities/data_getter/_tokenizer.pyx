@@ -0,0 +1,107 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Compiled version of `tokenizer.py_scan_rows`: the rows of the buffer are
+walked byte by byte in C, and only the offsets of the matching rows go back
+to Python.
+
+Build it with `python setup.py build_ext --inplace`. The readers use it when
+the extension is built (see `tokenizer.py`).
+"""
+from libc.string cimport memchr
+
+from array import array
+
+cdef enum:
+    #*Distance from the first position of a row to its hour and its zone code
+    HOUR_OFFSET = 11
+    ZONE_OFFSET = 21
+    #*Distance from the first position of a row to the comma before its zone name
+    ZONE_NAME_OFFSET = 19
+    STATION_LENGTH = 5
+    ENTRANCES_FIELD = 6
+
+
+cdef inline int _two_digits(const unsigned char[::1] buffer, Py_ssize_t position, Py_ssize_t row_end) except -1:
+    """Returns the number written with the two digits at `position`"""
+    cdef unsigned char tens, units
+    if position + 2 > row_end:
+        raise ValueError("The row is too short")
+    tens = buffer[position]
+    units = buffer[position + 1]
+    if not (48 <= tens <= 57 and 48 <= units <= 57):
+        raise ValueError(f"Invalid number: {bytes(buffer[position:position + 2])!r}")
+    return (tens - 48) * 10 + units - 48
+
+
+cdef inline bint _has_station(const unsigned char[::1] buffer, Py_ssize_t position, const unsigned char[::1] stations):
+    """Checks whether the station code at `position` is one of `stations`"""
+    cdef Py_ssize_t i, j
+    for i in range(0, stations.shape[0], STATION_LENGTH):
+        for j in range(STATION_LENGTH):
+            if buffer[position + j] != stations[i + j]:
+                break
+        else:
+            return True
+    return False
+
+
+cdef inline bint _no_entrances(const unsigned char[::1] buffer, Py_ssize_t row_start, Py_ssize_t row_end) except -1:
+    """Checks whether the entrances field (the seventh one) of a row is `0`"""
+    cdef Py_ssize_t position = row_start
+    cdef int commas = 0
+    while commas < ENTRANCES_FIELD:
+        while position < row_end and buffer[position] != 44:
+            position += 1
+        if position == row_end:
+            raise IndexError("Index out of range")
+        position += 1
+        commas += 1
+    return position + 1 <= row_end and buffer[position] == 48 and (position + 1 == row_end or buffer[position + 1] == 44)
+
+
+def scan_rows(buffer, route, int start_time, int end_time, bint filter_stations = True, bint filter_entrances = True, Py_ssize_t start = 0, stop = None, bint final = True):
+    """
+    Finds the rows of a buffer that belong to a given route and time range
+    (see `tokenizer.py_scan_rows`).
+    """
+    cdef const unsigned char[::1] data = buffer
+    cdef Py_ssize_t end = data.shape[0] if stop is None else min(stop, data.shape[0])
+    cdef Py_ssize_t row_start = start, row_end, station
+    cdef const unsigned char *breakline
+    cdef int current_time, zone, zone_name_length
+    cdef int zone_name_lengths[100]
+    cdef const unsigned char[::1] stations
+    offsets = array("q")
+
+    #*The lookups of the route, as C tables
+    for zone in range(100):
+        zone_name_lengths[zone] = -1
+    for zone in route.zone_codes:
+        if 0 <= zone < 100:
+            zone_name_lengths[zone] = route.zone_name_length(zone)
+    codes = [code.encode("utf-8") for code in route.station_codes]
+    stations = b"".join(code for code in codes if len(code) == STATION_LENGTH)
+
+    while row_start < end:
+        breakline = <const unsigned char *>memchr(&data[row_start], 10, end - row_start)
+        if breakline != NULL:
+            row_end = breakline - &data[0]
+        elif final:
+            row_end = end #*The file doesn't end with a breakline
+        else:
+            break #*The row may continue in the next chunk
+        if row_end > row_start:
+            current_time = _two_digits(data, row_start + HOUR_OFFSET, row_end)
+            if current_time >= end_time:
+                return offsets, row_start, True
+            if current_time >= start_time:
+                zone = _two_digits(data, row_start + ZONE_OFFSET, row_end)
+                zone_name_length = zone_name_lengths[zone]
+                if zone_name_length != -1:
+                    station = row_start + ZONE_NAME_OFFSET + zone_name_length + 3
+                    if not filter_stations or (station + STATION_LENGTH <= row_end and _has_station(data, station, stations)):
+                        if not (filter_entrances and _no_entrances(data, row_start, row_end)):
+                            offsets.append(row_start)
+                            offsets.append(row_end)
+        row_start = row_end + 1
+    return offsets, min(row_start, end), False
@@ -0,0 +1,150 @@
+"""
+Ridership engine: sums the entrances and exits of every station of a route
+per time bucket, straight from the raw rows of the validation files.
+
+Unlike `create_data_array`, the rows are never split into a `StrArena`: the
+chunks of the files are filtered by `tokenizer.scan_rows` (through
+`row_reader.read_rows`), and the station, time, entrances and exits are read
+from the bytes of every matching row and added into the dense matrices of a
+`Ridership`. With the pure Python tokenizer, checking every row on its own
+while adding it is faster, so the rows are read one by one instead.
+"""
+from typing import Iterable
+
+from src.utilities.objects.ridership import Ridership
+from src.utilities.objects.route import Route
+from .row_reader import DEFAULT_CHUNK_SIZE, iter_lines, read_rows
+from .rows import parse_time, row_hour, row_station, row_zone
+from .tokenizer import py_scan_rows, scan_rows
+
+
+def aggregate_ridership(files, route: Route, start_time: int, end_time: int, bucket_minutes: int = 15, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Ridership:
+    """
+    Sums the entrances and exits of every station of a route per time bucket.
+
+    Parameters
+    ----------
+    files : str or iterable of str
+        The name of the validation file, or the names of several of them (e.g.
+        the days of a month), whose counts are added together.
+    route : Route
+        The route whose stations are counted. Every station is counted in the
+        first position it has in the route's station codes.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    bucket_minutes : int, optional
+        The width of every bucket in minutes (default is 15).
+    filter_entrances : bool, optional
+        If True, ignores the data entries where the number of entrances is 0,
+        along with their exits (default is True), just like
+        `create_data_array`.
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB).
+
+    Returns
+    -------
+    Ridership
+        The entrances and exits of every station per bucket.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time or the
+        width of the buckets is not positive.
+    """
+    ridership: Ridership = Ridership(route, start_time, end_time, bucket_minutes)
+    if isinstance(files, str):
+        files = [files]
+    for file_name in files:
+        if scan_rows is py_scan_rows:
+            _aggregate_file(ridership, iter_lines(file_name, chunk_size, start_time), route, end_time, filter_entrances)
+        else:
+            #*The raw rows (`bytes` returns them as they are) that pass the filters
+            add_rows(ridership, read_rows(file_name, route, start_time, end_time, True, filter_entrances, chunk_size, parse=bytes), route)
+    return ridership
+
+
+def _aggregate_file(ridership: Ridership, lines: Iterable, route: Route, end_time: int, filter_entrances: bool) -> None:
+    """Adds the rows of a file (already positioned at the window) to a Ridership"""
+    bucket_count: int = ridership.bucket_count
+    entrances = ridership.entrances
+    exits = ridership.exits
+    try:
+        for row in lines:
+            if row_hour(row) >= end_time:
+                #*The files are sorted by time, so there is nothing left to read
+                break
+            zone_name_length: int = route.zone_name_length(row_zone(row))
+            if zone_name_length == -1:
+                continue
+            station: int = route.station_index(row_station(row, zone_name_length))
+            if station == -1:
+                continue
+            _, row_entrances, row_exits = row.rsplit(b",", 2)
+            row_entrances: int = int(row_entrances)
+            if row_entrances == 0 and filter_entrances:
+                continue
+            bucket: int = ridership.bucket_of(parse_time(row[11:19]))
+            if bucket == -1:
+                continue
+            position: int = station * bucket_count + bucket
+            entrances[position] = entrances[position] + row_entrances
+            exits[position] = exits[position] + int(row_exits)
+    finally:
+        lines.close()
+
+
+def add_rows(ridership: Ridership, rows: Iterable, route: Route) -> None:
+    """
+    Adds raw rows that already passed the filters of the readers (e.g. the
+    ones found by `tokenizer.scan_rows`) to a Ridership. The rows of stations
+    that aren't part of the route or outside its window are ignored.
+    """
+    bucket_count: int = ridership.bucket_count
+    entrances = ridership.entrances
+    exits = ridership.exits
+    for row in rows:
+        zone_name_length: int = route.zone_name_length(row_zone(row))
+        station: int = -1 if zone_name_length == -1 else route.station_index(row_station(row, zone_name_length))
+        bucket: int = ridership.bucket_of(parse_time(row[11:19]))
+        if station == -1 or bucket == -1:
+            continue
+        _, row_entrances, row_exits = row.rsplit(b",", 2)
+        position: int = station * bucket_count + bucket
+        entrances[position] = entrances[position] + int(row_entrances)
+        exits[position] = exits[position] + int(row_exits)
+
+
+def aggregate_validations(validations: Iterable, route: Route, start_time: int, end_time: int, bucket_minutes: int = 15) -> Ridership:
+    """
+    Sums the entrances and exits of `Validation` records (e.g. the ones of
+    `create_validations`) per station of a route and time bucket, like
+    `aggregate_ridership`, without parsing any field again. The records of
+    other stations or outside the window are ignored.
+
+    Returns
+    -------
+    Ridership
+        The entrances and exits of every station per bucket.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time or the
+        width of the buckets is not positive.
+    """
+    ridership: Ridership = Ridership(route, start_time, end_time, bucket_minutes)
+    bucket_count: int = ridership.bucket_count
+    entrances = ridership.entrances
+    exits = ridership.exits
+    for validation in validations:
+        station: int = route.station_index(validation.station)
+        bucket: int = ridership.bucket_of(validation.time)
+        if station == -1 or bucket == -1:
+            continue
+        position: int = station * bucket_count + bucket
+        entrances[position] = entrances[position] + validation.entrances
+        exits[position] = exits[position] + validation.exits
+    return ridership
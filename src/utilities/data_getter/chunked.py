@@ -0,0 +1,140 @@
+"""
+Parallel parsing of a single (very large) validation file.
+
+The part of the file inside the time window is split into byte ranges that
+begin and end at the beginning of a row, and every range is parsed in its
+own process with `row_reader.scan_file`, the same scanner of the
+sequential reader. Since the ranges don't overlap and are concatenated in
+order, the result is exactly the one of `create_data_array`.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utilities.data_structures.objArr import ObjArr
+from src.utilities.objects.route import Route
+from .row_reader import DEFAULT_CHUNK_SIZE, scan_file
+from .time_seek import seek_time
+
+
+def split_ranges(file_name: str, parts: int, start_time: int = 0, end_time: int = 24) -> list:
+    """
+    Splits the rows of a file inside a time window into byte ranges of about
+    the same size.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to split.
+    parts : int
+        The number of ranges to split the file into (there may be fewer if
+        the window has fewer rows).
+    start_time : int, optional
+        The starting time of the window (inclusive, default is 0).
+    end_time : int, optional
+        The ending time of the window (exclusive, default is 24).
+
+    Returns
+    -------
+    list
+        The `(start, stop)` positions of every range, in order. Both are
+        the beginning of a row (or the end of the file).
+
+    Raises
+    ------
+    ValueError
+        If the number of parts is not positive.
+    """
+    if parts <= 0:
+        raise ValueError("The number of parts must be positive")
+    with open(file_name, mode="rb") as file:
+        first: int = seek_time(file, start_time)
+        last: int = seek_time(file, end_time)
+        boundaries: list = [first]
+        for part in range(1, parts):
+            position: int = first + (last - first) * part // parts
+            file.seek(position - 1)
+            file.readline() #*Resync to the beginning of the next row
+            position = min(file.tell(), last)
+            if position > boundaries[-1]:
+                boundaries.append(position)
+        if last > boundaries[-1]:
+            boundaries.append(last)
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)]
+
+
+def parse_range(file_name: str, start: int, stop: int, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True) -> ObjArr:
+    """
+    Parses the rows of a byte range of a file (see `split_ranges`), with
+    the same filters as `create_data_array`.
+
+    Returns
+    -------
+    ObjArr
+        An ObjArr containing the filtered data of the range.
+    """
+    data: ObjArr = ObjArr()
+    with open(file_name, mode="rb") as file:
+        file.seek(start)
+        for row_data in scan_file(file, route, start_time, end_time, filter_stations, filter_entrances, DEFAULT_CHUNK_SIZE, stop):
+            data.append(row_data)
+    data.shrink_to_fit()
+    return data
+
+
+def create_data_array_parallel(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, max_workers: int = None, parts: int = None) -> ObjArr:
+    """
+    Creates an ObjArr containing data parsed from a file, filtered by a given
+    route and time range (just like `create_data_array`), parsing byte ranges
+    of the file in parallel.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    route : Route
+        The route object containing zones and stations to filter the data.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    filter_stations: bool, optional
+        If True, filters out data that doesn't correspond to the route's stations (default is True).
+    filter_entrances : bool, optional
+        If True, filters out data entries where the number of entrances is 0 (default is True).
+    max_workers : int, optional
+        The number of processes to use (default is the number of CPUs). If
+        it is 1, the ranges are parsed one after the other in this process.
+    parts : int, optional
+        The number of ranges to split the file into (default is
+        `max_workers`).
+
+    Returns
+    -------
+    ObjArr
+        An ObjArr containing the filtered data.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time.
+    """
+    if end_time <= start_time:
+        raise ValueError("Ending time must be greater than starting time")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    ranges: list = split_ranges(file_name, parts or max_workers, start_time, end_time)
+    arguments: tuple = (route, start_time, end_time, filter_stations, filter_entrances)
+    if max_workers <= 1 or len(ranges) <= 1:
+        chunks: list = [parse_range(file_name, start, stop, *arguments) for start, stop in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(ranges))) as executor:
+            futures: list = [executor.submit(parse_range, file_name, start, stop, *arguments) for start, stop in ranges]
+            chunks: list = [future.result() for future in futures]
+
+    data: ObjArr = ObjArr(sum(len(chunk) for chunk in chunks))
+    k: int = 0
+    for chunk in chunks:
+        for row_data in chunk:
+            data[k] = row_data
+            k += 1
+    return data
@@ -0,0 +1,395 @@
+"""
+Columnar binary cache of a daily validation file.
+
+The file is parsed once and stored next to it (`<file>.col`) as fixed-width
+int32 columns: the time (in seconds since midnight), zone code, station
+code, device, entrances and exits of every row, plus the zone, station and
+access labels encoded as indices into dictionaries of their distinct
+values. Later loads map the cache into memory, so they are almost instant
+and give typed columns instead of millions of small strings.
+
+Layout: a header (see `HEADER_FORMAT`), the columns one after the other (in
+the order of `COLUMNS`, in the machine's native byte order) and the
+dictionaries, each one as its number of strings, the length of its UTF-8
+blob, the offsets of every string in the blob and the blob itself.
+"""
+import bisect
+import mmap
+import os
+import struct
+from array import array
+
+from src.utilities.data_structures.strArena import StrArena
+from src.utilities.objects.route import Route
+from .row_reader import iter_lines
+from .rows import parse_time
+
+COLUMNAR_SUFFIX: str = ".col"
+#*Magic number, version, size and modification time (in nanoseconds) of the
+#*source file, number of rows and date of the file (padded to 48 bytes, so
+#*the columns are aligned)
+HEADER_FORMAT: str = "<4sIQqQ10s6x"
+MAGIC: bytes = b"TMCL"
+VERSION: int = 1
+COLUMNS: tuple = ("times", "zones", "stations", "devices", "entrances", "exits",
+                  "zone_labels", "station_labels", "access_labels")
+DICTIONARIES: tuple = ("zone_labels", "station_labels", "access_labels")
+
+
+def _format_time(seconds: int) -> str:
+    """Converts seconds since midnight into a `HH:MM:SS` time"""
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def _encode(value: bytes, dictionary: dict) -> int:
+    """Returns the index of a value in its dictionary, adding it if it's new"""
+    code: int = dictionary.get(value)
+    if code is None:
+        code = len(dictionary)
+        dictionary[value] = code
+    return code
+
+
+def _code_of(label: bytes, length: int) -> int:
+    """Returns the code between the parentheses at the start of a label"""
+    try:
+        return int(label[1: 1 + length])
+    except ValueError:
+        return -1
+
+
+class ColumnarDay:
+    def __init__(self, cache_name: str) -> None:
+        """
+        Maps a columnar cache into memory.
+
+        Parameters
+        ----------
+        cache_name : str
+            The name of the cache file (see `write_columnar`).
+
+        Attributes
+        ----------
+        times, zones, stations, devices, entrances, exits : memoryview
+            The int32 columns. The times are seconds since midnight.
+        zone_labels, station_labels, access_labels : memoryview
+            The int32 indices of every row's labels in the dictionaries.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a columnar cache, was written by another
+            version or doesn't have the size its header implies.
+        """
+        with open(cache_name, mode="rb") as file:
+            self.__content: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header_size: int = struct.calcsize(HEADER_FORMAT)
+        if len(self.__content) < header_size:
+            self.__content.close()
+            raise ValueError(f"{cache_name} is not a columnar cache")
+        magic, version, source_size, source_mtime, rows, date = struct.unpack_from(HEADER_FORMAT, self.__content)
+        if magic != MAGIC or version != VERSION:
+            self.__content.close()
+            raise ValueError(f"{cache_name} is not a columnar cache (version {VERSION})")
+        self.__source_size: int = source_size
+        self.__source_mtime: int = source_mtime
+        self.__rows: int = rows
+        self.__date: str = date.decode("utf-8")
+
+        try:
+            self.__dictionaries: dict = self.__read_dictionaries(header_size + 4 * len(COLUMNS) * rows)
+        except ValueError as error:
+            self.__content.close()
+            raise ValueError(f"{cache_name} is not a complete columnar cache") from error
+
+        #*The sizes were checked, so every column has its `rows` values
+        view: memoryview = memoryview(self.__content)
+        self.__columns: dict = {}
+        position: int = header_size
+        for name in COLUMNS:
+            self.__columns[name] = view[position: position + 4 * rows].cast("i")
+            position += 4 * rows
+        view.release()
+
+
+    def __read_dictionaries(self, position: int) -> dict:
+        """
+        Reads the dictionaries, which start at `position` (right after the
+        columns).
+
+        Raises
+        ------
+        ValueError
+            If the file is shorter or longer than the sizes it declares (e.g.
+            it was cut while being written) or a dictionary is malformed.
+        """
+        size: int = len(self.__content)
+        dictionaries: dict = {}
+        for name in DICTIONARIES:
+            if position + 8 > size:
+                raise ValueError("The file ends before the dictionaries")
+            count, blob_length = struct.unpack_from("<II", self.__content, position)
+            position += 8
+            if position + 4 * (count + 1) + blob_length > size:
+                raise ValueError(f"The file ends before the {name} dictionary")
+            offsets: tuple = struct.unpack_from(f"<{count + 1}I", self.__content, position)
+            position += 4 * (count + 1)
+            if offsets[-1] != blob_length:
+                raise ValueError(f"The offsets of the {name} dictionary don't match its blob")
+            blob: bytes = self.__content[position: position + blob_length]
+            dictionaries[name] = StrArena.from_iterable(
+                blob[offsets[i]: offsets[i + 1]].decode("utf-8") for i in range(count)
+            )
+            position += blob_length
+        if position != size:
+            raise ValueError("The file has bytes after the dictionaries")
+        return dictionaries
+
+
+    @property
+    def times(self) -> memoryview:
+        """Getter for the int32 column of the times (seconds since midnight)"""
+        return self.__columns["times"]
+
+
+    @property
+    def zones(self) -> memoryview:
+        """Getter for the int32 column of the zone codes"""
+        return self.__columns["zones"]
+
+
+    @property
+    def stations(self) -> memoryview:
+        """Getter for the int32 column of the station codes"""
+        return self.__columns["stations"]
+
+
+    @property
+    def devices(self) -> memoryview:
+        """Getter for the int32 column of the devices"""
+        return self.__columns["devices"]
+
+
+    @property
+    def entrances(self) -> memoryview:
+        """Getter for the int32 column of the entrances"""
+        return self.__columns["entrances"]
+
+
+    @property
+    def exits(self) -> memoryview:
+        """Getter for the int32 column of the exits"""
+        return self.__columns["exits"]
+
+
+    @property
+    def zone_labels(self) -> memoryview:
+        """Getter for the int32 column of the indices of the zone labels"""
+        return self.__columns["zone_labels"]
+
+
+    @property
+    def station_labels(self) -> memoryview:
+        """Getter for the int32 column of the indices of the station labels"""
+        return self.__columns["station_labels"]
+
+
+    @property
+    def access_labels(self) -> memoryview:
+        """Getter for the int32 column of the indices of the access labels"""
+        return self.__columns["access_labels"]
+
+
+    @property
+    def date(self) -> str:
+        """Getter for the date of the rows"""
+        return self.__date
+
+
+    @property
+    def source_size(self) -> int:
+        """Getter for the size of the cached file"""
+        return self.__source_size
+
+
+    @property
+    def source_mtime(self) -> int:
+        """Getter for the modification time (in nanoseconds) of the cached file"""
+        return self.__source_mtime
+
+
+    def dictionary(self, name: str) -> StrArena:
+        """
+        Returns the distinct values of a label column (`zone_labels`,
+        `station_labels` or `access_labels`), so that
+        `day.dictionary("station_labels")[day.station_labels[i]]` is the
+        station of the i-th row.
+        """
+        return self.__dictionaries[name]
+
+
+    def is_current(self, file_name: str) -> bool:
+        """Checks whether the cache still describes the given file"""
+        stat: os.stat_result = os.stat(file_name)
+        return stat.st_size == self.__source_size and stat.st_mtime_ns == self.__source_mtime
+
+
+    def __len__(self) -> int:
+        """Returns the number of rows"""
+        return self.__rows
+
+
+    def row(self, index: int) -> StrArena:
+        """
+        Rebuilds a row as the loaders return it: [date, time, zone, station,
+        station access, device, entrances, exits].
+        """
+        if not 0 <= index < self.__rows:
+            raise IndexError("Index out of range")
+        return StrArena.from_iterable((
+            self.__date,
+            _format_time(self.__columns["times"][index]),
+            self.__dictionaries["zone_labels"][self.__columns["zone_labels"][index]],
+            self.__dictionaries["station_labels"][self.__columns["station_labels"][index]],
+            self.__dictionaries["access_labels"][self.__columns["access_labels"][index]],
+            str(self.__columns["devices"][index]),
+            str(self.__columns["entrances"][index]),
+            str(self.__columns["exits"][index]),
+        ))
+
+
+    def select(self, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True) -> array:
+        """
+        Returns the indices of the rows that belong to a given route and time
+        range (with the same semantics as `create_data_array`).
+
+        Returns
+        -------
+        array
+            The indices of the rows, in order.
+
+        Raises
+        ------
+        ValueError
+            If the ending time is not greater than the starting time.
+        """
+        if end_time <= start_time:
+            raise ValueError("Ending time must be greater than starting time")
+        times: memoryview = self.__columns["times"]
+        zones: memoryview = self.__columns["zones"]
+        stations: memoryview = self.__columns["stations"]
+        entrances: memoryview = self.__columns["entrances"]
+        zone_codes: set = set(route.zone_codes)
+        station_codes: set = {int(code) for code in route.station_codes}
+        #*The rows are sorted by time
+        first: int = bisect.bisect_left(times, start_time * 3600)
+        last: int = bisect.bisect_left(times, end_time * 3600, first)
+        selected: array = array("i")
+        for i in range(first, last):
+            if zones[i] not in zone_codes:
+                continue
+            if filter_stations and stations[i] not in station_codes:
+                continue
+            if filter_entrances and entrances[i] == 0:
+                continue
+            selected.append(i)
+        return selected
+
+
+    def close(self) -> None:
+        """Unmaps the cache. The columns can't be used afterwards"""
+        for column in self.__columns.values():
+            column.release()
+        self.__content.close()
+
+
+    def __enter__(self) -> "ColumnarDay":
+        return self
+
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def columnar_name_of(file_name: str) -> str:
+    """Returns the name of the columnar cache of a validation file"""
+    return file_name + COLUMNAR_SUFFIX
+
+
+def write_columnar(file_name: str) -> str:
+    """
+    Parses a validation file and writes its columnar cache next to it.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to cache.
+
+    Returns
+    -------
+    str
+        The name of the cache file.
+    """
+    stat: os.stat_result = os.stat(file_name)
+    columns: dict = {name: array("i") for name in COLUMNS}
+    dictionaries: dict = {name: {} for name in DICTIONARIES}
+    date: bytes = b""
+    for row in iter_lines(file_name):
+        fields: list = row.split(b",")
+        date = fields[0]
+        columns["times"].append(parse_time(fields[1]))
+        columns["zones"].append(_code_of(fields[2], 2))
+        columns["stations"].append(_code_of(fields[3], 5))
+        try:
+            columns["devices"].append(int(fields[5]))
+        except ValueError:
+            columns["devices"].append(-1) #*Not a numeric device
+        columns["entrances"].append(int(fields[6]))
+        columns["exits"].append(int(fields[7]))
+        columns["zone_labels"].append(_encode(fields[2], dictionaries["zone_labels"]))
+        columns["station_labels"].append(_encode(fields[3], dictionaries["station_labels"]))
+        columns["access_labels"].append(_encode(fields[4], dictionaries["access_labels"]))
+
+    cache_name: str = columnar_name_of(file_name)
+    with open(cache_name, mode="wb") as file:
+        file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, stat.st_size, stat.st_mtime_ns,
+                               len(columns["times"]), date[:10]))
+        for name in COLUMNS:
+            columns[name].tofile(file)
+        for name in DICTIONARIES:
+            values: list = list(dictionaries[name]) #*Dictionaries keep the insertion order
+            offsets: list = [0]
+            for value in values:
+                offsets.append(offsets[-1] + len(value))
+            file.write(struct.pack("<II", len(values), offsets[-1]))
+            file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            file.write(b"".join(values))
+    return cache_name
+
+
+def load_columnar(file_name: str) -> ColumnarDay:
+    """
+    Loads the columnar cache of a validation file, writing it first if it
+    doesn't exist or the file changed since it was written.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the validation file (not of the cache).
+
+    Returns
+    -------
+    ColumnarDay
+        The memory-mapped columns of the file.
+    """
+    cache_name: str = columnar_name_of(file_name)
+    if os.path.exists(cache_name):
+        try:
+            day: ColumnarDay = ColumnarDay(cache_name)
+        except ValueError:
+            pass #*Corrupted or from another version
+        else:
+            if day.is_current(file_name):
+                return day
+            day.close()
+    return ColumnarDay(write_columnar(file_name))
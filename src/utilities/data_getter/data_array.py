@@ -1,29 +1,101 @@
-from src.utilities.data_structures.lList import LList
+from typing import Callable, Iterator
+
 from src.utilities.data_structures.objArr import ObjArr
-from src.utilities.data_structures.strArr import StrArr
+from src.utilities.data_structures.strArena import StrArena
 from src.utilities.objects.route import Route
+from .mmap_reader import read_rows_mmap
+from .offset_index import OffsetIndex, load_index, read_rows_indexed
+from .predicates import And, MinEntrances, OnRoute, Predicate, TimeRange, plan_scan
+from .row_reader import DEFAULT_CHUNK_SIZE, read_rows
+from .rows import get_zone_name, parse_validation, split_row
+
 
-def get_zone_name(zone_code: str, route: Route) -> str:
+def select_rows(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False, parse: Callable = split_row) -> Iterator[StrArena]:
+    """
+    Returns the rows of a file filtered by a given route and time range, read
+    with the fastest reader available: the sidecar index if the file has one
+    (see `offset_index.build_index`), the memory map if `use_mmap` is True or
+    the chunked reader otherwise. The parameters are the ones of
+    `create_data_array`, plus `parse`, which turns every matching raw row
+    into the value yielded (default is `split_row`).
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time.
     """
-    Retrieves the index of the given zone code from the route's zone codes.
-    Args:
-        zone_code (str): The zone code to search for.
-        route (Route): The route object containing zone codes.
-    Returns:
-        str: The index of the zone code in the route's zone codes.
-    Raises:
-        ValueError: If the zone code is not found in the route's zone codes.
+    index: OffsetIndex = load_index(file_name)
+    if index is not None:
+        return read_rows_indexed(file_name, index, route, start_time, end_time, filter_stations, filter_entrances, parse)
+    if use_mmap:
+        return read_rows_mmap(file_name, route, start_time, end_time, filter_stations, filter_entrances, parse)
+    return read_rows(file_name, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, parse)
+
+
+def select_where(file_name: str, predicate: Predicate, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False, parse: Callable = split_row) -> Iterator[StrArena]:
     """
+    Returns the rows of a file that pass a predicate (see `predicates`). The
+    filters the readers apply by themselves (the hour window, the route or
+    zones and the rows without entrances, see `predicates.plan_scan`) are
+    passed down to `select_rows`, so the tokenizer (or the sidecar index)
+    rejects most rows without splitting them, and the rest of the predicate
+    is only checked on the rows that survive them, from its cheapest member.
 
-    for i in range(len(route.zone_codes)):
-        if int(zone_code) == route.zone_codes[i]:
-            return i
-    raise ValueError(f"Code {zone_code} not found in {route.zone_codes}")
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    predicate : Predicate
+        The filter of the rows, e.g. `TimeRange.hours(6, 9) & Zones({33})`.
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB). Ignored if `use_mmap` is True.
+    use_mmap : bool, optional
+        If True, scans a memory map of the file instead of reading it in chunks (default is False).
+    parse : callable, optional
+        Turns every matching raw row into the value yielded (default is
+        `split_row`; `parse_validation` gives `Validation` records instead).
+
+    Raises
+    ------
+    ValueError
+        If the chunk size is not positive.
+    """
+    plan: tuple = plan_scan(predicate)
+    if plan is None:
+        return iter(()) #*The time ranges don't overlap
+    route, start_time, end_time, filter_stations, filter_entrances, residual = plan
+    if residual is None:
+        return select_rows(file_name, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, use_mmap, parse)
+    rows: Iterator[bytes] = select_rows(file_name, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, use_mmap, bytes)
+    return (parse(row) for row in rows if residual.matches(row))
 
 
-def create_data_array(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True) -> ObjArr:
+def create_data_array_where(file_name: str, predicate: Predicate, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False) -> ObjArr:
+    """
+    Creates an ObjArr containing the rows of a file that pass a predicate
+    (see `select_where`), in the order of the file.
+
+    Raises
+    ------
+    ValueError
+        If the chunk size is not positive.
+    """
+    data: ObjArr = ObjArr()
+    for row_data in select_where(file_name, predicate, chunk_size, use_mmap):
+        data.append(row_data) #*Grows geometrically, so the rows are read once
+    data.shrink_to_fit()
+    return data
+
+
+def create_data_array(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False) -> ObjArr:
     """
     Creates an ObjArr containing data parsed from a file, filtered by a given route and time range.
+    It is the predicate `TimeRange.hours(start_time, end_time) & OnRoute(route, filter_stations)
+    & MinEntrances(1)` (the last one only if `filter_entrances` is True) of `create_data_array_where`.
+    The file is streamed (see `read_rows`), or scanned through a memory map if `use_mmap` is True
+    (see `read_rows_mmap`), so only the matching rows are kept in memory. If the file has a sidecar
+    index (see `offset_index.build_index`), only the rows it points to are read, and the index is
+    rebuilt first if the file changed since it was built.
     
     Parameters
     ----------
@@ -39,6 +111,10 @@ def create_data_array(file_name: str, route: Route, start_time: int, end_time: i
         If True, filters out data that doesn't correspond to the route's stations (default is True).
     filter_entrances : bool, optional
         If True, filters out data entries where the number of entrances is 0 (default is True).
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB). Ignored if `use_mmap` is True.
+    use_mmap : bool, optional
+        If True, scans a memory map of the file instead of reading it in chunks (default is False).
     Returns
     -------
     ObjArr
@@ -48,85 +124,31 @@ def create_data_array(file_name: str, route: Route, start_time: int, end_time: i
     ValueError
         If the ending time is not greater than the starting time.
     """
-    with open(file_name, mode="r", encoding="utf-8") as file:
-        #*Group all the data into a single string to avoid using lists
-        content: str = file.read() #!Can we use built-in strings?
-
-    if end_time <= start_time:
-        raise ValueError("Ending time must be greater than starting time")
-    EOF_reached: bool = False
-    row_start: int = 89
-    row_end: int = 90
-    line_indices_list: LList = LList()
-    current_time: int = 0
-    while not EOF_reached:
-        #! Take start_time into account
-        current_time: int = int(content[row_start + 11: row_start + 13]) #*24-hour format
-        current_zone: str = int(content[row_start + 21 : row_start + 23]) #*Two-digit format
-        try:
-            while content[row_end] != "\n":
-                if current_time > 0 and current_time >= end_time:
-                    EOF_reached = True
-                else:
-                    pass
-                row_end += 1
-        except IndexError:
-            EOF_reached = True
-        if start_time <= current_time < end_time:
-            if current_zone in route.zone_codes:
-                if filter_stations == True:
-                    zone_name_length: int = len(route.zone_names[get_zone_name(current_zone, route)])
-                    #*19 is the distance from the first position of a row to the second comma,
-                    #*and three is to account for the comma and the parenthesis that follow
-                    #*each zone name
-                    station_code: int = content[row_start + 19 + zone_name_length + 3: row_start + 19 + zone_name_length + 8]
-                    if station_code in route.station_codes:
-                        line_indices_list.add(row_start)
-                        line_indices_list.add(row_end)
-                        # print(content[row_start: row_end])
-                    else:
-                        pass
-                else:
-                    line_indices_list.add(row_start)
-                    line_indices_list.add(row_end)
-        else:
-            pass
-        row_start = row_end + 1
-        #*We can safely say each row will have more than 50 chrs
-        row_end += 50
-
-    data: ObjArr = ObjArr(len(line_indices_list)//2) #*Since there are an even number of end and start indices
-    #*It will look like this: [date, time, zone, station, station access, device, entrances, exits]
-    i: int = 0
-    j: int = 0
-    k: int = 0
-    col_start: int = 0
-    col_end: int = 0
-    row_data: StrArr = StrArr(8)
-    # print(line_indices_list)
-
-    while i + 1 <  len(line_indices_list):
-        while (content[line_indices_list[i] + col_end] != "," and content[line_indices_list[i] + col_end] != "\n"):
-            col_end += 1
-        row_data[j] = content[line_indices_list[i] + col_start: line_indices_list[i] + col_end]
-        j += 1
-        if j == 8:
-            #*Reached the last row
-            if row_data[6] == "0" and filter_entrances == True:
-                #*Ignore data entries where the number of entrances is 0
-                pass
-            else:
-                # print(row_data)
-                data[k] = row_data
-                k += 1
-            row_data = StrArr(8) #*To avoid having a reference to the same array (shallow copy)
-            col_start = 0
-            col_end = col_start + 7 #* Just to make it a bit more efficient, since the time will always be in the Hours:Minutes:Seconds format
-            i += 2 #* Go to the next start-index
-            j = 0
-        else:
-            col_end += 1 #* Go one position past the comma
-            col_start = col_end
+    predicate: Predicate = And(TimeRange.hours(start_time, end_time), OnRoute(route, filter_stations))
+    if filter_entrances:
+        predicate &= MinEntrances(1)
+    return create_data_array_where(file_name, predicate, chunk_size, use_mmap)
 
 
+def create_validations(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False) -> ObjArr:
+    """
+    Loads the data of a file filtered by a given route and time range (just
+    like `create_data_array`) as `Validation` records, whose time, codes and
+    counts are parsed into integers once, while reading the file.
+
+    Returns
+    -------
+    ObjArr
+        An ObjArr containing a `Validation` for every row, in the order of
+        the file.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time.
+    """
+    data: ObjArr = ObjArr()
+    for validation in select_rows(file_name, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, use_mmap, parse_validation):
+        data.append(validation)
+    data.shrink_to_fit()
     return data
@@ -0,0 +1,80 @@
+"""
+Loads the rows of a validation file as encoded columns instead of an ObjArr
+of rows: the labels (date, zone, station, access and device), which only
+have a few hundred distinct values, become `CatArr`s of int32 codes, and the
+time, entrances and exits become `IntArr`s, so every row takes a few dozen
+bytes instead of an object with its own copy of every string.
+"""
+from array import array
+
+from src.utilities.data_structures.catArr import CatArr
+from src.utilities.data_structures.intArr import IntArr
+from src.utilities.objects.route import Route
+from .data_array import select_rows
+from .row_reader import DEFAULT_CHUNK_SIZE
+from .rows import parse_time
+
+#*The name of every column and the field of the row it comes from
+CATEGORICAL_COLUMNS: dict = {"dates": 0, "zones": 2, "stations": 3, "accesses": 4, "devices": 5}
+INTEGER_COLUMNS: dict = {"entrances": 6, "exits": 7}
+
+
+def create_encoded_columns(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False) -> dict:
+    """
+    Loads the data of a file filtered by a given route and time range (just
+    like `create_data_array`) as encoded columns.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    route : Route
+        The route object containing zones and stations to filter the data.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    filter_stations: bool, optional
+        If True, filters out data that doesn't correspond to the route's stations (default is True).
+    filter_entrances : bool, optional
+        If True, filters out data entries where the number of entrances is 0 (default is True).
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB). Ignored if `use_mmap` is True.
+    use_mmap : bool, optional
+        If True, scans a memory map of the file instead of reading it in chunks (default is False).
+
+    Returns
+    -------
+    dict
+        The columns, all of them with one value per row and in the order of
+        the file: `dates`, `zones`, `stations`, `accesses` and `devices`
+        (CatArr), `times` (IntArr, in seconds since midnight), `entrances`
+        and `exits` (IntArr).
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time.
+    """
+    #*The codes are collected in standard arrays and copied into the IntArr
+    #*and CatArr columns at once at the end
+    lookups: dict = {name: {} for name in CATEGORICAL_COLUMNS}
+    codes: dict = {name: array("i") for name in (*CATEGORICAL_COLUMNS, "times", *INTEGER_COLUMNS)}
+    for row_data in select_rows(file_name, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, use_mmap):
+        for name, field in CATEGORICAL_COLUMNS.items():
+            value: str = row_data[field]
+            lookup: dict = lookups[name]
+            code: int = lookup.get(value, -1)
+            if code == -1:
+                code = lookup[value] = len(lookup)
+            codes[name].append(code)
+        codes["times"].append(parse_time(row_data[1]))
+        for name, field in INTEGER_COLUMNS.items():
+            codes[name].append(int(row_data[field]))
+
+    columns: dict = {}
+    for name in CATEGORICAL_COLUMNS:
+        columns[name] = CatArr.from_codes(codes[name], lookups[name]) #*Dictionaries keep the insertion order
+    for name in ("times", *INTEGER_COLUMNS):
+        columns[name] = IntArr.from_buffer(codes[name], copy=True)
+    return columns
@@ -0,0 +1,252 @@
+"""
+Incremental (tail-follow) reader of a validation file that is still being
+written, e.g. the one of the current day.
+
+`TailFollower` remembers the position of the first byte it hasn't processed
+yet (always the beginning of a row) and the ridership of the rows it has
+processed, so every `refresh` only reads the rows appended since the last
+one. The bytes after the last breakline are a row that is still being
+written, so they are left for the next call (unless `final` is True).
+
+With a `checkpoint_name`, the position, the ridership and what identifies
+the file are written there after every refresh, so another process can
+resume from it. The whole checkpoint (header and counts) is in the machine's
+native byte order, since it is a local file.
+"""
+import os
+import struct
+import zlib
+
+from src.utilities.data_structures.objArr import ObjArr
+from src.utilities.objects.ridership import Ridership
+from src.utilities.objects.route import Route
+from .aggregate import add_rows
+from .row_reader import DEFAULT_CHUNK_SIZE
+from .rows import split_row
+from .tokenizer import scan_rows
+
+#*Bytes at the beginning of the file compared on every refresh, to notice when
+#*it is replaced by another one (e.g. the next day) or truncated
+PREFIX_LENGTH: int = 4096
+#*Magic number, version, position, matching rows, whether a row after the
+#*window was found, length and CRC-32 of the prefix, CRC-32 of the query
+#*and number of counts of the ridership (native byte order, like the counts)
+HEADER_FORMAT: str = "=4sIQQ?IIIQ"
+MAGIC: bytes = b"TMTF"
+VERSION: int = 1
+
+
+class TailFollower:
+    def __init__(self, file_name: str, route: Route, start_time: int = 0, end_time: int = 24, filter_stations: bool = True, filter_entrances: bool = True, bucket_minutes: int = 15, chunk_size: int = DEFAULT_CHUNK_SIZE, checkpoint_name: str = None) -> None:
+        """
+        Initializes the reader of a growing file, positioned at its beginning
+        or where its checkpoint left it.
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the file to follow.
+        route : Route
+            The route object containing zones and stations to filter the data.
+        start_time : int, optional
+            The starting time for filtering data (inclusive, default is 0).
+        end_time : int, optional
+            The ending time for filtering data (exclusive, default is 24).
+        filter_stations: bool, optional
+            If True, filters out data that doesn't correspond to the route's stations (default is True).
+        filter_entrances : bool, optional
+            If True, filters out data entries where the number of entrances is 0 (default is True).
+        bucket_minutes : int, optional
+            The width of the buckets of the ridership in minutes (default is 15).
+        chunk_size : int, optional
+            The number of bytes read from the file at a time (default is 1 MiB).
+        checkpoint_name : str, optional
+            Where the progress is stored after every refresh (default is None,
+            only in memory). If it already has the progress of the same file
+            and query, reading continues from there.
+
+        Attributes
+        ----------
+        __offset : int
+            The position of the first byte not processed yet, which is always
+            the beginning of a row (or of the header).
+        __finished : bool
+            Whether a row at or after `end_time` was found, so nothing else
+            can match (the files are sorted by time).
+        __prefix_length : int
+            The number of bytes at the beginning of the file (already
+            processed, so they can't change) identified by `__prefix_crc`.
+
+        Raises
+        ------
+        ValueError
+            If the ending time is not greater than the starting time, the
+            width of the buckets or the chunk size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.__file_name: str = file_name
+        self.__route: Route = route
+        self.__start_time: int = start_time
+        self.__end_time: int = end_time
+        self.__filter_stations: bool = filter_stations
+        self.__filter_entrances: bool = filter_entrances
+        self.__bucket_minutes: int = bucket_minutes
+        self.__chunk_size: int = chunk_size
+        self.__checkpoint_name: str = checkpoint_name
+        #*Identifies the query, so a checkpoint of another one isn't used
+        self.__query_crc: int = zlib.crc32(repr((route.identifier, tuple(route.station_codes), tuple(route.zone_names), start_time,
+                                                 end_time, bool(filter_stations), bool(filter_entrances), bucket_minutes)).encode("utf-8"))
+        self.reset()
+        if checkpoint_name is not None:
+            self.__load_checkpoint()
+
+
+    @property
+    def offset(self) -> int:
+        """Getter for the position of the first byte not processed yet"""
+        return self.__offset
+
+
+    @property
+    def rows(self) -> int:
+        """Getter for the number of matching rows processed so far"""
+        return self.__rows
+
+
+    @property
+    def finished(self) -> bool:
+        """Getter for whether the window is over (a later row was found)"""
+        return self.__finished
+
+
+    @property
+    def ridership(self) -> Ridership:
+        """Getter for the entrances and exits of the rows processed so far"""
+        return self.__ridership
+
+
+    def reset(self) -> None:
+        """Forgets the progress, so the next refresh reads the file from the beginning"""
+        self.__offset: int = 0
+        self.__rows: int = 0
+        self.__finished: bool = False
+        self.__prefix_length: int = 0
+        self.__prefix_crc: int = 0
+        self.__ridership: Ridership = Ridership(self.__route, self.__start_time, self.__end_time, self.__bucket_minutes)
+
+
+    def refresh(self, final: bool = False) -> ObjArr:
+        """
+        Processes the rows appended to the file since the last refresh. If the
+        file was truncated or replaced since then, it is read again from the
+        beginning (and the ridership starts over).
+
+        Parameters
+        ----------
+        final : bool, optional
+            If True, the file is complete, so the bytes after its last
+            breakline are its last row (default is False, they are left for
+            the next refresh since the row may still be being written).
+
+        Returns
+        -------
+        ObjArr
+            The columns of the new matching rows: [date, time, zone, station,
+            station access, device, entrances, exits], in the order of the
+            file. They are also added to `ridership`.
+        """
+        data: ObjArr = ObjArr()
+        with open(self.__file_name, mode="rb") as file:
+            if not self.__is_same_file(file):
+                self.reset()
+            if not self.__finished:
+                file.seek(self.__offset)
+                if self.__offset == 0:
+                    header: bytes = file.readline()
+                    if not header.endswith(b"\n"):
+                        return data #*The header is still being written
+                    self.__offset = len(header)
+                self.__read(file, data, final)
+            self.__update_prefix(file)
+        if self.__checkpoint_name is not None:
+            self.__save_checkpoint()
+        return data
+
+
+    def __read(self, file, data: ObjArr, final: bool) -> None:
+        """Processes the rows of an open file from the offset to its end"""
+        pending: bytes = b""
+        while True:
+            chunk: bytes = file.read(self.__chunk_size)
+            at_end: bool = not chunk
+            if pending:
+                #*The last row of the previous chunk was cut in half
+                chunk = pending + chunk
+            offsets, position, finished = scan_rows(chunk, self.__route, self.__start_time, self.__end_time, self.__filter_stations,
+                                                    self.__filter_entrances, final=at_end and final)
+            rows: list = [chunk[offsets[i]:offsets[i + 1]] for i in range(0, len(offsets), 2)]
+            add_rows(self.__ridership, rows, self.__route)
+            data.extend(split_row(row) for row in rows)
+            self.__rows += len(rows)
+            #*Every chunk begins at the offset, so it moves to the first row left
+            self.__offset += position
+            if finished:
+                self.__finished = True
+                return
+            if at_end:
+                return
+            pending = chunk[position:]
+
+
+    def __is_same_file(self, file) -> bool:
+        """Checks whether the file still has the bytes already processed"""
+        if os.fstat(file.fileno()).st_size < self.__offset:
+            return False
+        file.seek(0)
+        return zlib.crc32(file.read(self.__prefix_length)) == self.__prefix_crc
+
+
+    def __update_prefix(self, file) -> None:
+        """Identifies the file by its first (processed) bytes"""
+        if self.__prefix_length < min(self.__offset, PREFIX_LENGTH):
+            self.__prefix_length = min(self.__offset, PREFIX_LENGTH)
+            file.seek(0)
+            self.__prefix_crc = zlib.crc32(file.read(self.__prefix_length))
+
+
+    def __save_checkpoint(self) -> None:
+        """Writes the progress to the checkpoint (under another name first, then renamed)"""
+        temporary: str = f"{self.__checkpoint_name}.{os.getpid()}.tmp"
+        with open(temporary, mode="wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, self.__offset, self.__rows, self.__finished,
+                                   self.__prefix_length, self.__prefix_crc, self.__query_crc, len(self.__ridership.entrances)))
+            file.write(self.__ridership.entrances.as_memoryview())
+            file.write(self.__ridership.exits.as_memoryview())
+        os.replace(temporary, self.__checkpoint_name)
+
+
+    def __load_checkpoint(self) -> None:
+        """Continues from the checkpoint, if it has the progress of the same query"""
+        try:
+            with open(self.__checkpoint_name, mode="rb") as file:
+                content: bytes = file.read()
+            magic, version, offset, rows, finished, prefix_length, prefix_crc, query_crc, counts = \
+                struct.unpack_from(HEADER_FORMAT, content)
+        except (OSError, struct.error):
+            return #*There is no (valid) checkpoint yet
+        header_size: int = struct.calcsize(HEADER_FORMAT)
+        #*Bytes of the entrances (or the exits), written as the memory of the arrays
+        counts_size: int = counts * self.__ridership.entrances.as_memoryview().itemsize
+        if (magic, version, query_crc, counts) != (MAGIC, VERSION, self.__query_crc, len(self.__ridership.entrances)) \
+                or len(content) != header_size + 2 * counts_size:
+            return
+        counts_view: memoryview = memoryview(content)[header_size:].cast("i")
+        self.__ridership.entrances.copy_from(counts_view[:counts])
+        self.__ridership.exits.copy_from(counts_view[counts:])
+        self.__offset, self.__rows, self.__finished = offset, rows, finished
+        self.__prefix_length, self.__prefix_crc = prefix_length, prefix_crc
+
+
+    def __repr__(self) -> str:
+        return f"TailFollower of {self.__file_name} at byte {self.__offset} ({self.__rows} rows{', finished' if self.__finished else ''})"
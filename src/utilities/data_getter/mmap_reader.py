@@ -0,0 +1,120 @@
+"""
+Memory-mapped reader for the daily validation files.
+
+The file is mapped into memory and scanned in place. Instead of walking it
+row by row, `mmap.find` looks for the zone names of the route (which always
+sit right after the time of a row), so the rows of every other zone are
+skipped without even being visited. The rows before the time window are
+skipped too, with a binary search (see `time_seek`). The time and station
+filters read the mapped bytes directly, and only the rows that survive them
+are copied out and decoded. Since most of the rows of a day file don't belong to the
+requested route, this avoids touching the bulk of the file from Python.
+
+That only pays off with the pure Python tokenizer: the compiled one (see
+`tokenizer`) checks every row faster than the candidate rows can be checked
+from Python, so with it the whole map is scanned by `scan_rows` instead. The
+routes whose zones have no names, only their codes (e.g. `(33)`, see
+`predicates.zone_route`), can't be looked up by name either, so they are
+always scanned that way.
+"""
+import heapq
+import mmap
+import os
+from typing import Callable, Iterator
+
+from src.utilities.data_structures.strArena import StrArena
+from src.utilities.objects.route import Route
+from .rows import accept_row, no_entrances, row_hour, split_row
+from .time_seek import seek_time
+from .tokenizer import py_scan_rows, scan_rows
+
+#*Distance from the first position of a row to the comma before its zone
+ZONE_OFFSET: int = 19
+
+
+def read_rows_mmap(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, parse: Callable = split_row) -> Iterator[StrArena]:
+    """
+    Yields the rows of a file that belong to a given route and time range,
+    one at a time, scanning a memory map of the file.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    route : Route
+        The route object containing zones and stations to filter the data.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    filter_stations: bool, optional
+        If True, filters out data that doesn't correspond to the route's stations (default is True).
+    filter_entrances : bool, optional
+        If True, filters out data entries where the number of entrances is 0 (default is True).
+    parse : callable, optional
+        Turns every matching raw row into the value yielded (default is
+        `split_row`; `parse_validation` gives `Validation` records instead).
+
+    Yields
+    ------
+    StrArena
+        The columns of the next matching row: [date, time, zone, station,
+        station access, device, entrances, exits], or what `parse` returns.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time.
+    """
+    if end_time <= start_time:
+        raise ValueError("Ending time must be greater than starting time")
+    return _read_rows_mmap(file_name, route, start_time, end_time, filter_stations, filter_entrances, parse)
+
+
+def _read_rows_mmap(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool, filter_entrances: bool, parse: Callable) -> Iterator[StrArena]:
+    with open(file_name, mode="rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return #*Empty files can't be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            #*Skip the header and every row before the window
+            first_row: int = seek_time(content, start_time)
+            if scan_rows is not py_scan_rows or any(zone_name.endswith(")") for zone_name in route.zone_names):
+                #*The compiled tokenizer is faster than finding the zones, and
+                #*if only the code of a zone is known its name can't be found
+                offsets, _, _ = scan_rows(content, route, start_time, end_time, filter_stations, filter_entrances, first_row)
+                for i in range(0, len(offsets), 2):
+                    yield parse(content[offsets[i]:offsets[i + 1]])
+                return
+            zone_rows: list = [
+                _find_zone_rows(content, b"," + zone_name.encode("utf-8") + b",", first_row)
+                for zone_name in route.zone_names
+            ]
+            for row_start in heapq.merge(*zone_rows):
+                current_time: int = row_hour(content, row_start)
+                if current_time >= end_time:
+                    #*The files are sorted by time, so there is nothing left to read
+                    break
+                if current_time < start_time or not accept_row(content, route, filter_stations, row_start):
+                    continue
+                row_end: int = content.find(b"\n", row_start)
+                if row_end == -1:
+                    row_end = len(content) #*The file doesn't end with a breakline
+                row: bytes = content[row_start:row_end]
+                if not (filter_entrances and no_entrances(row)):
+                    #*Data entries where the number of entrances is 0 are ignored
+                    yield parse(row)
+
+
+def _find_zone_rows(content: mmap.mmap, zone_token: bytes, start: int) -> Iterator[int]:
+    """
+    Yields (in order) the first position of every row after `start` whose
+    zone is `zone_token` (the zone name between commas).
+    """
+    position: int = content.find(zone_token, start + ZONE_OFFSET)
+    while position != -1:
+        row_start: int = position - ZONE_OFFSET
+        if content[row_start - 1] == 10:
+            #*Only if the zone name is found in the zone column (right after
+            #*a breakline and a row's date and time)
+            yield row_start
+        position = content.find(zone_token, position + 1)
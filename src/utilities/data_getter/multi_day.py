@@ -0,0 +1,90 @@
+"""
+Loads the data of several daily validation files at once, parsing every
+file in its own process so that analysing a month takes about as long as
+the slowest days instead of the sum of all of them.
+"""
+import glob
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utilities.data_structures.objArr import ObjArr
+from src.utilities.objects.route import Route
+from .data_array import create_data_array
+
+
+def _row_order(row_data) -> tuple:
+    """Sorting key of a row: its date and its time"""
+    return row_data[0], row_data[1]
+
+
+def resolve_files(files) -> list:
+    """
+    Returns the sorted names of the files to load.
+
+    Parameters
+    ----------
+    files : str or iterable of str
+        A glob pattern (e.g. `data/202502*.csv`) or the names of the files.
+    """
+    if isinstance(files, str):
+        return sorted(glob.glob(files))
+    return sorted(files)
+
+
+def create_data_arrays(files, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, max_workers: int = None) -> ObjArr:
+    """
+    Creates an ObjArr containing the data of several files, filtered by a
+    given route and time range, parsing the files in parallel (each one with
+    `create_data_array`).
+
+    Parameters
+    ----------
+    files : str or iterable of str
+        A glob pattern (e.g. `data/202502*.csv`) or the names of the files.
+    route : Route
+        The route object containing zones and stations to filter the data.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    filter_stations: bool, optional
+        If True, filters out data that doesn't correspond to the route's stations (default is True).
+    filter_entrances : bool, optional
+        If True, filters out data entries where the number of entrances is 0 (default is True).
+    max_workers : int, optional
+        The number of processes to use (default is the number of CPUs). If
+        it is 1, the files are parsed one after the other in this process.
+
+    Returns
+    -------
+    ObjArr
+        An ObjArr containing the filtered data of every file, ordered by date
+        and time.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time.
+    """
+    if end_time <= start_time:
+        raise ValueError("Ending time must be greater than starting time")
+    file_names: list = resolve_files(files)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(file_names))
+    arguments: tuple = (route, start_time, end_time, filter_stations, filter_entrances)
+    if max_workers <= 1:
+        days: list = [create_data_array(file_name, *arguments) for file_name in file_names]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures: list = [executor.submit(create_data_array, file_name, *arguments) for file_name in file_names]
+            days: list = [future.result() for future in futures]
+
+    data: ObjArr = ObjArr(sum(len(day) for day in days))
+    k: int = 0
+    #*Every day is already sorted by time, so merging them is enough
+    for row_data in heapq.merge(*days, key=_row_order):
+        data[k] = row_data
+        k += 1
+    return data
@@ -0,0 +1,214 @@
+"""
+Loads the data of several routes out of a single pass over a daily
+validation file, instead of one pass per route.
+
+The routes are merged into a single "union" route (every zone and station
+of any of them), which the readers use to filter the rows as usual, and an
+inverted index (`RouteIndex`) maps the zone and station codes of every
+matching row to the routes that serve them, so the row is parsed once and
+shared by all of them.
+"""
+from typing import Callable
+
+from src.utilities.data_structures.objArr import ObjArr
+from src.utilities.data_structures.strArr import StrArr
+from src.utilities.objects.route import Route
+from .data_array import select_rows
+from .row_reader import DEFAULT_CHUNK_SIZE
+from .rows import row_station, row_zone, split_row
+
+
+class RouteIndex:
+    def __init__(self, routes) -> None:
+        """
+        Initializes the inverted index of several routes.
+
+        Parameters
+        ----------
+        routes : iterable of Route
+            The routes to index. Their identifiers must be unique.
+
+        Attributes
+        ----------
+        __zone_routes : dict
+            Maps every zone code to the positions (in `routes`) of the routes
+            that have it.
+        __station_routes : dict
+            Maps every zone code to a list of `(zone name length, stations)`,
+            one per distinct zone name of that code (usually only one), where
+            `stations` maps the (encoded) code of every station to the
+            positions of the routes that have both the zone and the station.
+        __union_route : Route
+            A route with every zone and station of the routes.
+
+        Raises
+        ------
+        ValueError
+            If there are no routes or two of them have the same identifier.
+        """
+        self.__routes: tuple = tuple(routes)
+        if not self.__routes:
+            raise ValueError("At least one route is needed")
+        identifiers: list = [route.identifier for route in self.__routes]
+        if len(set(identifiers)) != len(identifiers):
+            raise ValueError("The identifiers of the routes must be unique")
+
+        zone_routes: dict = {}
+        station_routes: dict = {}
+        for position, route in enumerate(self.__routes):
+            for zone_code in route.zone_codes:
+                if position in zone_routes.setdefault(zone_code, []):
+                    continue #*The zone is repeated in the route
+                zone_routes[zone_code].append(position)
+                length: int = route.zone_name_length(zone_code)
+                entries: list = station_routes.setdefault(zone_code, [])
+                stations: dict = next((entry for entry_length, entry in entries if entry_length == length), None)
+                if stations is None:
+                    stations = {}
+                    entries.append((length, stations))
+                for station_code in route.station_codes:
+                    served_by: list = stations.setdefault(station_code.encode("utf-8"), [])
+                    if position not in served_by:
+                        served_by.append(position)
+        #*Tuples, so every row gets the same (immutable) object of its key
+        self.__zone_routes: dict = {zone: tuple(positions) for zone, positions in zone_routes.items()}
+        self.__station_routes: dict = {
+            zone: [(length, {station: tuple(positions) for station, positions in stations.items()}) for length, stations in entries]
+            for zone, entries in station_routes.items()
+        }
+        self.__union_route: Route = self.__build_union_route()
+
+
+    def __build_union_route(self) -> Route:
+        """Returns a route with every zone and station of the routes (each one once)"""
+        zone_names: dict = {}
+        station_names: dict = {}
+        for route in self.__routes:
+            for zone_name in route.zone_names:
+                zone_names.setdefault(int(zone_name[1:3]), zone_name)
+            for station_code, station_name in zip(route.station_codes, route.station_names):
+                station_names.setdefault(station_code, station_name)
+        zones: StrArr = StrArr(0)
+        zones.extend(zone_names.values())
+        codes: StrArr = StrArr(0)
+        codes.extend(station_names.keys())
+        names: StrArr = StrArr(0)
+        names.extend(station_names.values())
+        return Route("+".join(route.identifier for route in self.__routes), codes, names, zones)
+
+
+    @property
+    def routes(self) -> tuple:
+        """Getter for the indexed routes, in the order they were given"""
+        return self.__routes
+
+
+    @property
+    def union_route(self) -> Route:
+        """Getter for the route with every zone and station of the routes"""
+        return self.__union_route
+
+
+    @property
+    def consistent_zone_names(self) -> bool:
+        """
+        Checks whether every zone code has the same name in every route, so
+        that the station of a row is at the same position for all of them
+        and the union route can also filter the stations.
+        """
+        return all(len(entries) == 1 for entries in self.__station_routes.values())
+
+
+    def routes_of(self, row: bytes, filter_stations: bool = True, start: int = 0) -> tuple:
+        """
+        Returns the positions (in `routes`) of the routes a raw row belongs to,
+        with the same criteria of `rows.accept_row` for every one of them.
+
+        Parameters
+        ----------
+        row : bytes
+            The raw row, without the breakline.
+        filter_stations : bool, optional
+            If True, the station of the row must also be one of the route's
+            stations (default is True).
+        start : int, optional
+            The position of the first byte of the row (default is 0).
+
+        Returns
+        -------
+        tuple
+            The positions of the routes, in increasing order (empty if the
+            row doesn't belong to any of them).
+        """
+        zone_code: int = row_zone(row, start)
+        if not filter_stations:
+            return self.__zone_routes.get(zone_code, ())
+        entries: list = self.__station_routes.get(zone_code)
+        if entries is None:
+            return ()
+        if len(entries) == 1:
+            length, stations = entries[0]
+            return stations.get(row_station(row, length, start), ())
+        positions: set = set()
+        for length, stations in entries:
+            positions.update(stations.get(row_station(row, length, start), ()))
+        return tuple(sorted(positions))
+
+
+    def __len__(self) -> int:
+        return len(self.__routes)
+
+
+def create_route_data_arrays(file_name: str, routes, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False, parse: Callable = split_row) -> dict:
+    """
+    Creates an ObjArr for every route with the data of a file filtered by
+    that route and a time range (the rows of `create_data_array` for each
+    route), reading the file only once regardless of the number of routes.
+
+    Every matching row is parsed once and the same object is stored in the
+    arrays of all the routes it belongs to.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    routes : iterable of Route
+        The routes to filter the data by. Their identifiers must be unique.
+    parse : callable, optional
+        Turns every matching raw row into the value stored (default is
+        `split_row`; `parse_validation` gives `Validation` records instead).
+
+    The rest of the parameters are the ones of `create_data_array`, except
+    that `use_mmap` is ignored if a zone code has different names in two of
+    the routes (see `RouteIndex.consistent_zone_names`).
+
+    Returns
+    -------
+    dict
+        Maps the identifier of every route to an ObjArr with its rows, in
+        the order of the file.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time, there are
+        no routes or two of them have the same identifier.
+    """
+    index: RouteIndex = RouteIndex(routes)
+    arrays: tuple = tuple(ObjArr() for _ in range(len(index)))
+
+    def parse_for_routes(row: bytes) -> tuple:
+        return index.routes_of(row, filter_stations), parse(row)
+
+    #*If a zone code has different names, its stations are at different
+    #*positions for some routes, so the union route can only filter the zones.
+    #*It only has the first name of every zone, which is the one the memory
+    #*map looks for, so the chunked reader is used instead
+    consistent: bool = index.consistent_zone_names
+    for positions, row_data in select_rows(file_name, index.union_route, start_time, end_time, filter_stations and consistent,
+                                           filter_entrances, chunk_size, use_mmap and consistent, parse_for_routes):
+        for position in positions:
+            arrays[position].append(row_data)
+    for data in arrays:
+        data.shrink_to_fit()
+    return {route.identifier: data for route, data in zip(index.routes, arrays)}
@@ -0,0 +1,311 @@
+"""
+Persistent offset index (sidecar file) of a daily validation file.
+
+For every hour, zone code and station code of the file, the index records
+the byte ranges of the rows that have them (consecutive rows with the same
+key are merged into a single range). With it, a query only reads the rows
+of its route and time window instead of scanning the whole file.
+
+The index is stored next to the file (`<file>.idx`) along with the size and
+modification time of the file it was built from, so it is rebuilt whenever
+the file changes. The arrays are stored in the machine's native byte order,
+since the index is a local cache and not a format to share. The loaded
+indexes are also kept in memory, so `load_index` only reads the sidecar file
+again when the file changes.
+"""
+import mmap
+import os
+import struct
+from array import array
+from typing import Callable, Iterator
+
+from src.utilities.data_structures.strArena import StrArena
+from src.utilities.objects.route import Route
+from .rows import accept_row, no_entrances, row_hour, row_zone, split_row
+
+INDEX_SUFFIX: str = ".idx"
+#*Magic number, version, size and modification time (in nanoseconds) of the
+#*source file, number of keys and number of byte ranges
+HEADER_FORMAT: str = "<4sIQqQQ"
+MAGIC: bytes = b"TMIX"
+VERSION: int = 1
+
+#*The indexes already loaded or built, by the absolute path of their file
+_loaded_indexes: dict = {}
+
+
+class OffsetIndex:
+    def __init__(self, source_size: int, source_mtime: int, keys: dict) -> None:
+        """
+        Initializes an index from the byte ranges of every key.
+
+        Parameters
+        ----------
+        source_size : int
+            The size in bytes of the indexed file.
+        source_mtime : int
+            The modification time of the indexed file, in nanoseconds.
+        keys : dict
+            Maps every (hour, zone code, station code) to the list of its
+            byte ranges, as consecutive `[start, end]` positions (the end is
+            the position of the row's breakline).
+        """
+        self.__source_size: int = source_size
+        self.__source_mtime: int = source_mtime
+        #*The directory has one entry per key, pointing to its first range
+        #*and the number of ranges it has
+        self.__key_hours: array = array("B")
+        self.__key_zones: array = array("B")
+        self.__key_stations: array = array("I")
+        self.__key_first: array = array("I")
+        self.__key_count: array = array("I")
+        self.__starts: array = array("Q")
+        self.__ends: array = array("Q")
+        for (hour, zone, station), ranges in sorted(keys.items()):
+            self.__key_hours.append(hour)
+            self.__key_zones.append(zone)
+            self.__key_stations.append(station)
+            self.__key_first.append(len(self.__starts))
+            self.__key_count.append(len(ranges) // 2)
+            self.__starts.extend(ranges[0::2])
+            self.__ends.extend(ranges[1::2])
+
+
+    @property
+    def source_size(self) -> int:
+        """Getter for the size of the indexed file"""
+        return self.__source_size
+
+
+    @property
+    def source_mtime(self) -> int:
+        """Getter for the modification time (in nanoseconds) of the indexed file"""
+        return self.__source_mtime
+
+
+    def __len__(self) -> int:
+        """Returns the number of byte ranges of the index"""
+        return len(self.__starts)
+
+
+    def is_current(self, file_name: str) -> bool:
+        """Checks whether the index still describes the given file"""
+        stat: os.stat_result = os.stat(file_name)
+        return stat.st_size == self.__source_size and stat.st_mtime_ns == self.__source_mtime
+
+
+    def ranges(self, route: Route, start_time: int, end_time: int, filter_stations: bool = True) -> list:
+        """
+        Returns the byte ranges of the rows of a route and time range, sorted
+        by position and with the contiguous ones merged.
+
+        Returns
+        -------
+        list
+            The `(start, end)` positions of every range (the end is
+            exclusive).
+        """
+        zone_codes: set = set(route.zone_codes)
+        station_codes: set = {int(code) for code in route.station_codes}
+        selected: list = []
+        for key in range(len(self.__key_hours)):
+            if not start_time <= self.__key_hours[key] < end_time:
+                continue
+            if self.__key_zones[key] not in zone_codes:
+                continue
+            if filter_stations and self.__key_stations[key] not in station_codes:
+                continue
+            first: int = self.__key_first[key]
+            last: int = first + self.__key_count[key]
+            selected.extend(zip(self.__starts[first:last], self.__ends[first:last]))
+        selected.sort()
+        merged: list = []
+        for start, end in selected:
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+            else:
+                merged.append((start, end))
+        return merged
+
+
+    def save(self, index_name: str) -> None:
+        """Writes the index into the given file"""
+        with open(index_name, mode="wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, self.__source_size, self.__source_mtime,
+                                   len(self.__key_hours), len(self.__starts)))
+            for column in (self.__key_hours, self.__key_zones, self.__key_stations, self.__key_first,
+                           self.__key_count, self.__starts, self.__ends):
+                column.tofile(file)
+
+
+    @classmethod
+    def load(cls, index_name: str) -> "OffsetIndex":
+        """
+        Reads an index written by `save`.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't an index or was written by another version.
+        """
+        with open(index_name, mode="rb") as file:
+            header: bytes = file.read(struct.calcsize(HEADER_FORMAT))
+            if len(header) < struct.calcsize(HEADER_FORMAT):
+                raise ValueError(f"{index_name} is not an offset index")
+            magic, version, source_size, source_mtime, key_count, range_count = struct.unpack(HEADER_FORMAT, header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{index_name} is not an offset index (version {VERSION})")
+            index: OffsetIndex = cls(source_size, source_mtime, {})
+            for column, count in ((index.__key_hours, key_count), (index.__key_zones, key_count),
+                                  (index.__key_stations, key_count), (index.__key_first, key_count),
+                                  (index.__key_count, key_count), (index.__starts, range_count),
+                                  (index.__ends, range_count)):
+                column.fromfile(file, count)
+        return index
+
+
+def index_name_of(file_name: str) -> str:
+    """Returns the name of the sidecar index of a validation file"""
+    return file_name + INDEX_SUFFIX
+
+
+def _row_key(content: mmap.mmap, row_start: int) -> tuple:
+    """Returns the (hour, zone code, station code) of the row at `row_start`"""
+    #*The station (e.g. `(02502)`) comes right after the comma that ends the
+    #*zone name
+    station_start: int = content.find(b",", row_start + 20) + 2
+    try:
+        station: int = int(content[station_start: station_start + 5])
+    except ValueError:
+        station = 0 #*Not a numeric station code
+    return row_hour(content, row_start), row_zone(content, row_start), station
+
+
+def build_index(file_name: str) -> OffsetIndex:
+    """
+    Builds the offset index of a validation file and writes it next to it.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to index.
+
+    Returns
+    -------
+    OffsetIndex
+        The index of the file.
+    """
+    stat: os.stat_result = os.stat(file_name)
+    keys: dict = {}
+    if stat.st_size > 0:
+        with open(file_name, mode="rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            size: int = len(content)
+            row_start: int = content.find(b"\n") + 1 #*Skip the header
+            if row_start == 0:
+                row_start = size
+            previous_key: tuple = None
+            previous_ranges: list = None
+            while row_start < size:
+                row_end: int = content.find(b"\n", row_start)
+                if row_end == -1:
+                    row_end = size
+                if row_end > row_start:
+                    key: tuple = _row_key(content, row_start)
+                    if key == previous_key and previous_ranges[-1] + 1 == row_start:
+                        previous_ranges[-1] = row_end #*Extend the last range of the key
+                    else:
+                        previous_ranges = keys.setdefault(key, [])
+                        previous_ranges.append(row_start)
+                        previous_ranges.append(row_end)
+                        previous_key = key
+                row_start = row_end + 1
+    index: OffsetIndex = OffsetIndex(stat.st_size, stat.st_mtime_ns, keys)
+    index.save(index_name_of(file_name))
+    _loaded_indexes[os.path.abspath(file_name)] = index
+    return index
+
+
+def load_index(file_name: str) -> OffsetIndex:
+    """
+    Loads the sidecar index of a validation file, rebuilding it if the file
+    changed since it was built. The index is kept in memory, so the next
+    calls return the same object (without reading the sidecar file) while
+    the size and modification time of the file stay the same.
+
+    Returns
+    -------
+    OffsetIndex
+        The index of the file, or `None` if the file has no index.
+    """
+    index_name: str = index_name_of(file_name)
+    path: str = os.path.abspath(file_name)
+    if not os.path.exists(index_name):
+        _loaded_indexes.pop(path, None)
+        return None
+    index: OffsetIndex = _loaded_indexes.get(path)
+    if index is not None and index.is_current(file_name):
+        return index #*Neither the file nor (then) its index changed
+    try:
+        index = OffsetIndex.load(index_name)
+    except (ValueError, EOFError):
+        return build_index(file_name) #*Corrupted or from another version
+    if not index.is_current(file_name):
+        return build_index(file_name)
+    _loaded_indexes[path] = index
+    return index
+
+
+def read_rows_indexed(file_name: str, index: OffsetIndex, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, parse: Callable = split_row) -> Iterator[StrArena]:
+    """
+    Yields the rows of a file that belong to a given route and time range,
+    one at a time, reading only the byte ranges that the index points to.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    index : OffsetIndex
+        The index of the file (see `load_index`).
+    route : Route
+        The route object containing zones and stations to filter the data.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    filter_stations: bool, optional
+        If True, filters out data that doesn't correspond to the route's stations (default is True).
+    filter_entrances : bool, optional
+        If True, filters out data entries where the number of entrances is 0 (default is True).
+    parse : callable, optional
+        Turns every matching raw row into the value yielded (default is
+        `split_row`; `parse_validation` gives `Validation` records instead).
+
+    Yields
+    ------
+    StrArena
+        The columns of the next matching row: [date, time, zone, station,
+        station access, device, entrances, exits], or what `parse` returns.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time.
+    """
+    if end_time <= start_time:
+        raise ValueError("Ending time must be greater than starting time")
+    return _read_rows_indexed(file_name, index.ranges(route, start_time, end_time, filter_stations),
+                              route, start_time, end_time, filter_stations, filter_entrances, parse)
+
+
+def _read_rows_indexed(file_name: str, ranges: list, route: Route, start_time: int, end_time: int, filter_stations: bool, filter_entrances: bool, parse: Callable) -> Iterator[StrArena]:
+    with open(file_name, mode="rb") as file:
+        for start, end in ranges:
+            file.seek(start)
+            for row in file.read(end - start).split(b"\n"):
+                #*The index already selected the rows, this only guards
+                #*against keys that share a code but not the zone name
+                if not row or not start_time <= row_hour(row) < end_time or not accept_row(row, route, filter_stations):
+                    continue
+                if not (filter_entrances and no_entrances(row)):
+                    #*Data entries where the number of entrances is 0 are ignored
+                    yield parse(row)
@@ -0,0 +1,399 @@
+"""
+Composable filters of the rows of the validation files.
+
+Every predicate checks a raw row (bytes, without the breakline) and they are
+combined with `&` and `|`, e.g.
+`TimeRange.hours(6, 9) & Zones({33, 11}) & (MinEntrances(5) | Devices({4010663}))`.
+Every predicate has a cost, given by how far into the row its field is:
+the time and the zone sit at fixed offsets, the station right after the
+zone name, and the rest of the fields have to be split out of the row. The
+members of an `And` or an `Or` are checked from the cheapest one, so most
+rows are rejected by the cheap checks.
+
+`plan_scan` splits a predicate into what the readers already filter (the
+hour window, the zones or the route of the tokenizer and the rows without
+entrances) and the rest, which is only checked on the rows that survive
+them (see `data_array.select_where`).
+"""
+from abc import ABC, abstractmethod
+
+from src.utilities.data_structures.strArr import StrArr
+from src.utilities.objects.route import Route
+from .rows import accept_row, parse_time, row_station, row_zone
+
+#*Relative cost of finding the field of every predicate in a row
+TIME_COST: int = 1
+ZONE_COST: int = 1
+STATION_COST: int = 2
+COUNT_COST: int = 2 #*Entrances and exits: the last fields, split from the end
+LABEL_COST: int = 3 #*Station access and device
+
+
+class Predicate(ABC):
+    """
+    Base class of the filters. The subclasses implement `matches` and give
+    their `cost`.
+    """
+    cost: int = 0
+
+
+    @abstractmethod
+    def matches(self, row: bytes) -> bool:
+        """Checks whether a raw row (without the breakline) passes the filter"""
+
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        """Returns a predicate that passes the rows both predicates pass"""
+        if not isinstance(other, Predicate):
+            return NotImplemented
+        return And(self, other)
+
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        """Returns a predicate that passes the rows any of the predicates pass"""
+        if not isinstance(other, Predicate):
+            return NotImplemented
+        return Or(self, other)
+
+
+class And(Predicate):
+    def __init__(self, *predicates: Predicate) -> None:
+        """
+        Initializes the conjunction of several predicates. The nested
+        conjunctions are flattened and the members are sorted by cost.
+
+        Raises
+        ------
+        TypeError
+            If a member is not a Predicate.
+        """
+        members: list = []
+        for predicate in predicates:
+            if not isinstance(predicate, Predicate):
+                raise TypeError("Only predicates can be combined")
+            members.extend(predicate.predicates if isinstance(predicate, And) else [predicate])
+        #*Stable, so the members of the same cost keep their order
+        self.__predicates: tuple = tuple(sorted(members, key=lambda member: member.cost))
+        self.cost: int = sum(member.cost for member in self.__predicates)
+
+
+    @property
+    def predicates(self) -> tuple:
+        """Getter for the members, from the cheapest one"""
+        return self.__predicates
+
+
+    def matches(self, row: bytes) -> bool:
+        for predicate in self.__predicates:
+            if not predicate.matches(row):
+                return False
+        return True
+
+
+    def __repr__(self) -> str:
+        return "(" + " & ".join(repr(predicate) for predicate in self.__predicates) + ")"
+
+
+class Or(Predicate):
+    def __init__(self, *predicates: Predicate) -> None:
+        """
+        Initializes the disjunction of several predicates. The nested
+        disjunctions are flattened and the members are sorted by cost.
+
+        Raises
+        ------
+        TypeError
+            If a member is not a Predicate.
+        """
+        members: list = []
+        for predicate in predicates:
+            if not isinstance(predicate, Predicate):
+                raise TypeError("Only predicates can be combined")
+            members.extend(predicate.predicates if isinstance(predicate, Or) else [predicate])
+        self.__predicates: tuple = tuple(sorted(members, key=lambda member: member.cost))
+        self.cost: int = sum(member.cost for member in self.__predicates)
+
+
+    @property
+    def predicates(self) -> tuple:
+        """Getter for the members, from the cheapest one"""
+        return self.__predicates
+
+
+    def matches(self, row: bytes) -> bool:
+        for predicate in self.__predicates:
+            if predicate.matches(row):
+                return True
+        return False
+
+
+    def __repr__(self) -> str:
+        return "(" + " | ".join(repr(predicate) for predicate in self.__predicates) + ")"
+
+
+class TimeRange(Predicate):
+    cost: int = TIME_COST
+
+
+    def __init__(self, start: int, end: int) -> None:
+        """
+        Initializes a filter of the rows from `start` (inclusive) to `end`
+        (exclusive), in seconds since midnight.
+
+        Raises
+        ------
+        ValueError
+            If the ending time is not greater than the starting time.
+        """
+        if end <= start:
+            raise ValueError("Ending time must be greater than starting time")
+        self.__start: int = start
+        self.__end: int = end
+
+
+    @classmethod
+    def hours(cls, start_time: int, end_time: int) -> "TimeRange":
+        """Returns the filter of the rows from one hour (inclusive) to another (exclusive)"""
+        if end_time <= start_time:
+            raise ValueError("Ending time must be greater than starting time")
+        return cls(start_time * 3600, end_time * 3600)
+
+
+    @property
+    def start(self) -> int:
+        """Getter for the starting time in seconds since midnight (inclusive)"""
+        return self.__start
+
+
+    @property
+    def end(self) -> int:
+        """Getter for the ending time in seconds since midnight (exclusive)"""
+        return self.__end
+
+
+    def matches(self, row: bytes) -> bool:
+        return self.__start <= parse_time(row[11:19]) < self.__end
+
+
+    def __repr__(self) -> str:
+        return f"TimeRange({self.__start}, {self.__end})"
+
+
+class Zones(Predicate):
+    cost: int = ZONE_COST
+
+
+    def __init__(self, codes) -> None:
+        """Initializes a filter of the rows of some zone codes (e.g. 33 for `(33)Zona B AutoNorte`)"""
+        self.__codes: frozenset = frozenset(int(code) for code in codes)
+
+
+    @property
+    def codes(self) -> frozenset:
+        """Getter for the zone codes"""
+        return self.__codes
+
+
+    def matches(self, row: bytes) -> bool:
+        return row_zone(row) in self.__codes
+
+
+    def __repr__(self) -> str:
+        return f"Zones({sorted(self.__codes)})"
+
+
+class Stations(Predicate):
+    cost: int = STATION_COST
+
+
+    def __init__(self, codes) -> None:
+        """Initializes a filter of the rows of some station codes (str like `"02502"` or int)"""
+        self.__codes: frozenset = frozenset(f"{int(code):05d}".encode("utf-8") for code in codes)
+
+
+    def matches(self, row: bytes) -> bool:
+        #*The zone name goes from the second comma (at 19) to the third one
+        return row_station(row, row.index(b",", 20) - 20) in self.__codes
+
+
+    def __repr__(self) -> str:
+        return f"Stations({sorted(code.decode('utf-8') for code in self.__codes)})"
+
+
+class Accesses(Predicate):
+    cost: int = LABEL_COST
+
+
+    def __init__(self, codes) -> None:
+        """Initializes a filter of the rows of some station access codes (e.g. 1 for `(1)Acceso Norte`)"""
+        self.__codes: frozenset = frozenset(int(code) for code in codes)
+
+
+    def matches(self, row: bytes) -> bool:
+        access: bytes = row.rsplit(b",", 4)[1]
+        return int(access[1:access.index(b")")]) in self.__codes
+
+
+    def __repr__(self) -> str:
+        return f"Accesses({sorted(self.__codes)})"
+
+
+class Devices(Predicate):
+    cost: int = LABEL_COST
+
+
+    def __init__(self, identifiers) -> None:
+        """Initializes a filter of the rows of some device identifiers"""
+        self.__identifiers: frozenset = frozenset(int(identifier) for identifier in identifiers)
+
+
+    def matches(self, row: bytes) -> bool:
+        return int(row.rsplit(b",", 3)[1]) in self.__identifiers
+
+
+    def __repr__(self) -> str:
+        return f"Devices({sorted(self.__identifiers)})"
+
+
+class MinEntrances(Predicate):
+    cost: int = COUNT_COST
+
+
+    def __init__(self, minimum: int) -> None:
+        """Initializes a filter of the rows with at least `minimum` entrances"""
+        self.__minimum: int = minimum
+
+
+    @property
+    def minimum(self) -> int:
+        """Getter for the minimum number of entrances"""
+        return self.__minimum
+
+
+    def matches(self, row: bytes) -> bool:
+        return int(row.rsplit(b",", 2)[1]) >= self.__minimum
+
+
+    def __repr__(self) -> str:
+        return f"MinEntrances({self.__minimum})"
+
+
+class MinExits(Predicate):
+    cost: int = COUNT_COST
+
+
+    def __init__(self, minimum: int) -> None:
+        """Initializes a filter of the rows with at least `minimum` exits"""
+        self.__minimum: int = minimum
+
+
+    def matches(self, row: bytes) -> bool:
+        return int(row.rsplit(b",", 1)[1]) >= self.__minimum
+
+
+    def __repr__(self) -> str:
+        return f"MinExits({self.__minimum})"
+
+
+class OnRoute(Predicate):
+    cost: int = STATION_COST
+
+
+    def __init__(self, route: Route, filter_stations: bool = True) -> None:
+        """
+        Initializes a filter of the rows of a route: the ones of its zones
+        and, if `filter_stations` is True, also of its stations (just like
+        `create_data_array`).
+        """
+        self.__route: Route = route
+        self.__filter_stations: bool = filter_stations
+
+
+    @property
+    def route(self) -> Route:
+        """Getter for the route"""
+        return self.__route
+
+
+    @property
+    def filter_stations(self) -> bool:
+        """Getter for whether the stations are also filtered"""
+        return self.__filter_stations
+
+
+    def matches(self, row: bytes) -> bool:
+        return accept_row(row, self.__route, self.__filter_stations)
+
+
+    def __repr__(self) -> str:
+        return f"OnRoute({self.__route.identifier}{'' if self.__filter_stations else ', zones only'})"
+
+
+def zone_route(codes) -> Route:
+    """
+    Returns a route with some zones and no stations, so the readers (with
+    `filter_stations=False`) only keep the rows of those zones. The names of
+    its zones are just their codes (e.g. `(33)`), since they are not needed
+    without the stations.
+    """
+    codes = sorted(set(codes))
+    zones: StrArr = StrArr(len(codes))
+    zones.extend(f"({code:02d})" for code in codes)
+    return Route("zones", StrArr(0), StrArr(0), zones)
+
+
+#*Every zone code (they have two digits), for the scans that don't filter zones
+_ALL_ZONES: range = range(100)
+
+
+def plan_scan(predicate: Predicate) -> tuple:
+    """
+    Splits a predicate into the filters the readers apply by themselves
+    (see `data_array.select_rows`) and the rest. Only the members of the
+    outermost conjunction can be pushed down: the time ranges give the hour
+    window, an `OnRoute` (or, without one, a `Zones`) gives the route the
+    tokenizer checks, and a `MinEntrances` of at least 1 drops the rows
+    without entrances.
+
+    Returns
+    -------
+    tuple
+        `(route, start_time, end_time, filter_stations, filter_entrances,
+        residual)`: the parameters of `select_rows` and the predicate the
+        rows it gives must still pass (None if there is nothing left to
+        check). It is None instead if no row can pass the time ranges.
+    """
+    members: tuple = predicate.predicates if isinstance(predicate, And) else (predicate,)
+    start: int = 0
+    end: int = 24 * 3600
+    route: Route = None
+    filter_stations: bool = False
+    filter_entrances: bool = False
+    residual: list = []
+    for member in members:
+        if isinstance(member, TimeRange):
+            start, end = max(start, member.start), min(end, member.end)
+        elif isinstance(member, OnRoute) and not isinstance(route, Route):
+            if isinstance(route, Zones):
+                residual.append(route) #*The route is pushed down instead
+            route, filter_stations = member.route, member.filter_stations
+        elif isinstance(member, Zones) and route is None:
+            route = member
+        elif isinstance(member, MinEntrances) and member.minimum >= 1:
+            filter_entrances = True
+            if member.minimum > 1:
+                residual.append(member)
+        else:
+            residual.append(member)
+    if isinstance(route, Zones):
+        route = zone_route(route.codes)
+    elif route is None:
+        route = zone_route(_ALL_ZONES)
+    if end <= start:
+        return None
+    start_time: int = start // 3600
+    end_time: int = -(-end // 3600)
+    if start % 3600 or end % 3600:
+        #*The readers work with whole hours, so the seconds are checked later
+        residual.append(TimeRange(start, end))
+    return route, start_time, end_time, filter_stations, filter_entrances, (And(*residual) if residual else None)
@@ -0,0 +1,258 @@
+"""
+Memoization of the results of `create_data_array`.
+
+The entries are identified by the file (its absolute path, size and
+modification time, so a changed file is never served from the cache), the
+route (its identifier, stations and zones) and the time range and filters.
+
+The memory tier keeps the rows already split and is an LRU bounded by an
+estimate of their bytes; every hit returns a new ObjArr with them, so the
+callers can't change the cached array (the rows themselves are shared). With
+a `directory`, every result is also written there as its raw rows (as they
+are in the file) compressed with zlib, so other processes or later runs only
+have to split them again instead of reading the CSV.
+"""
+import hashlib
+import os
+import struct
+import zlib
+from collections import OrderedDict
+
+from src.utilities.data_structures.objArr import ObjArr
+from src.utilities.objects.route import Route
+from .data_array import select_rows
+from .row_reader import DEFAULT_CHUNK_SIZE
+from .rows import split_row
+
+#*256 MiB of rows
+DEFAULT_MAX_BYTES: int = 1 << 28
+#*Approximate bytes of a row besides its fields: the StrArena, its ctypes
+#*block and offsets, and its reference in the ObjArr (measured with tracemalloc)
+ROW_OVERHEAD: int = 400
+CACHE_SUFFIX: str = ".rows"
+#*Magic number, version, number of rows and size of the (uncompressed) rows
+HEADER_FORMAT: str = "<4sIQQ"
+MAGIC: bytes = b"TMRC"
+VERSION: int = 1
+
+
+class ResultCache:
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: str = None) -> None:
+        """
+        Initializes an empty cache.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            The maximum number of bytes of rows kept in memory (default is
+            256 MiB), counting the bytes of their fields plus `ROW_OVERHEAD`
+            per row. The least recently used results are evicted first.
+        directory : str, optional
+            Where the results are also stored on disk (default is None, only
+            in memory). It is created if it doesn't exist.
+
+        Attributes
+        ----------
+        __entries : OrderedDict
+            Maps the key of every result kept in memory to its ObjArr of rows
+            and their bytes, from the least to the most recently used.
+        __nbytes : int
+            The (estimated) bytes of the rows kept in memory.
+
+        Raises
+        ------
+        ValueError
+            If the maximum number of bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("The maximum number of bytes can't be negative")
+        self.__max_bytes: int = max_bytes
+        self.__directory: str = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.__entries: OrderedDict = OrderedDict()
+        self.__nbytes: int = 0
+        self.__hits: int = 0
+        self.__disk_hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+
+    @property
+    def hits(self) -> int:
+        """Getter for the number of results found in memory"""
+        return self.__hits
+
+
+    @property
+    def disk_hits(self) -> int:
+        """Getter for the number of results found on disk (but not in memory)"""
+        return self.__disk_hits
+
+
+    @property
+    def misses(self) -> int:
+        """Getter for the number of results that had to be read from the CSV"""
+        return self.__misses
+
+
+    @property
+    def evictions(self) -> int:
+        """Getter for the number of results evicted from memory"""
+        return self.__evictions
+
+
+    @property
+    def nbytes(self) -> int:
+        """Getter for the (estimated) bytes of the rows kept in memory"""
+        return self.__nbytes
+
+
+    @property
+    def max_bytes(self) -> int:
+        """Getter for the maximum (estimated) bytes of the rows kept in memory"""
+        return self.__max_bytes
+
+
+    def stats(self) -> dict:
+        """Returns the counters of the cache (e.g. to log them)"""
+        return {"hits": self.__hits, "disk_hits": self.__disk_hits, "misses": self.__misses,
+                "evictions": self.__evictions, "entries": len(self.__entries), "nbytes": self.__nbytes}
+
+
+    def create_data_array(self, file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False) -> ObjArr:
+        """
+        Returns the rows of `data_array.create_data_array` for the same
+        parameters, from the cache if the query was already made over the
+        same (unchanged) file. `chunk_size` and `use_mmap` only matter when
+        the file has to be read, since they don't change the rows.
+
+        Returns
+        -------
+        ObjArr
+            A new ObjArr with the columns of every matching row. The rows are
+            shared with the cache, so they must not be modified.
+
+        Raises
+        ------
+        ValueError
+            If the ending time is not greater than the starting time.
+        FileNotFoundError
+            If the file doesn't exist.
+        """
+        key: tuple = cache_key(file_name, route, start_time, end_time, filter_stations, filter_entrances)
+        entry: tuple = self.__entries.get(key)
+        if entry is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+        else:
+            rows: list = self.__load(key)
+            if rows is not None:
+                self.__disk_hits += 1
+            else:
+                self.__misses += 1
+                rows = list(select_rows(file_name, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, use_mmap, bytes))
+                self.__store(key, rows)
+            data: ObjArr = ObjArr(len(rows))
+            data.extend(split_row(row) for row in rows)
+            entry = (data, sum(map(len, rows)) + ROW_OVERHEAD * len(rows))
+            self.__remember(key, entry)
+        result: ObjArr = ObjArr(len(entry[0]))
+        result.extend(entry[0])
+        return result
+
+
+    def __remember(self, key: tuple, entry: tuple) -> None:
+        """Keeps a result in memory, evicting the least recently used ones"""
+        if entry[1] > self.__max_bytes:
+            return #*It would evict everything else and still not fit
+        self.__entries[key] = entry
+        self.__nbytes += entry[1]
+        while self.__nbytes > self.__max_bytes:
+            _, (_, nbytes) = self.__entries.popitem(last=False)
+            self.__nbytes -= nbytes
+            self.__evictions += 1
+
+
+    def __path(self, key: tuple) -> str:
+        """Returns the name of the file of a result in the directory"""
+        return os.path.join(self.__directory, hashlib.sha1(repr(key).encode("utf-8")).hexdigest() + CACHE_SUFFIX)
+
+
+    def __store(self, key: tuple, rows: list) -> None:
+        """Writes the raw rows of a result to the directory (if there is one)"""
+        if self.__directory is None:
+            return
+        path: str = self.__path(key)
+        content: bytes = b"\n".join(rows)
+        #*Written under another name first, so nobody reads a half-written file
+        temporary: str = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, mode="wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(rows), len(content)))
+            file.write(zlib.compress(content, 1))
+        os.replace(temporary, path)
+
+
+    def __load(self, key: tuple) -> list:
+        """Returns the raw rows of a result stored in the directory, or None if it isn't there"""
+        if self.__directory is None:
+            return None
+        try:
+            with open(self.__path(key), mode="rb") as file:
+                content: bytes = file.read()
+            magic, version, rows_count, size = struct.unpack_from(HEADER_FORMAT, content)
+            if magic != MAGIC or version != VERSION:
+                return None
+            content = zlib.decompress(content[struct.calcsize(HEADER_FORMAT):])
+        except (OSError, struct.error, zlib.error):
+            return None #*Missing or corrupted, so it is read again
+        if len(content) != size:
+            return None
+        rows: list = content.split(b"\n") if rows_count else []
+        return rows if len(rows) == rows_count else None
+
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Removes every result kept in memory (the counters are kept).
+
+        Parameters
+        ----------
+        disk : bool, optional
+            If True, also removes the results stored in the directory
+            (default is False).
+        """
+        self.__entries.clear()
+        self.__nbytes = 0
+        if disk and self.__directory is not None:
+            for name in os.listdir(self.__directory):
+                if name.endswith(CACHE_SUFFIX):
+                    os.remove(os.path.join(self.__directory, name))
+
+
+    def __len__(self) -> int:
+        """Returns the number of results kept in memory"""
+        return len(self.__entries)
+
+
+    def __repr__(self) -> str:
+        return (f"ResultCache({len(self.__entries)} results, {self.__nbytes} of {self.__max_bytes} bytes, "
+                f"{self.__hits} hits, {self.__disk_hits} disk hits, {self.__misses} misses, {self.__evictions} evictions)")
+
+
+def cache_key(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool, filter_entrances: bool) -> tuple:
+    """
+    Returns what identifies the result of a query: the absolute path, size
+    and modification time (in nanoseconds) of the file, the identifier,
+    station codes and zone names of the route, and the rest of the
+    parameters.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file doesn't exist.
+    """
+    stat: os.stat_result = os.stat(file_name)
+    return (os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns,
+            route.identifier, tuple(route.station_codes), tuple(route.zone_names),
+            start_time, end_time, bool(filter_stations), bool(filter_entrances))
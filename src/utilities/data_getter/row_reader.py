@@ -0,0 +1,236 @@
+"""
+Streaming reader for the daily validation files.
+
+Instead of loading the whole file into memory, it is read in chunks of
+`chunk_size` bytes and the rows are yielded one at a time, so the peak
+memory is bounded by the chunk size (plus the longest row) rather than by
+the size of the file. Every chunk is scanned at once by the tokenizer (see
+`tokenizer.scan_rows`), which only returns the offsets of the matching rows.
+"""
+from typing import BinaryIO, Callable, Iterator
+
+from src.utilities.data_structures.strArena import StrArena
+from src.utilities.objects.route import Route
+from .rows import accept_row, row_hour, split_row
+from .time_seek import seek_time
+from .tokenizer import scan_rows
+
+#*1 MiB, big enough to amortize the system calls
+DEFAULT_CHUNK_SIZE: int = 1 << 20
+
+
+def iter_lines(file_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE, start_time: int = 0) -> Iterator[bytes]:
+    """
+    Yields the raw rows of a validation file (skipping the header), without
+    the breakline.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB).
+    start_time : int, optional
+        If given, the rows before this hour are skipped with a binary search
+        over the file (see `seek_time`) instead of being read (default is 0).
+
+    Yields
+    ------
+    bytes
+        The next row of the file.
+
+    Raises
+    ------
+    ValueError
+        If the chunk size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    return _iter_lines(file_name, chunk_size, start_time)
+
+
+def _skip_to(file: BinaryIO, start_time: int) -> None:
+    """Moves an open file to its first row at or after `start_time`"""
+    if start_time > 0:
+        file.seek(seek_time(file, start_time))
+    else:
+        file.readline() #*Skip the header
+
+
+def _iter_lines(file_name: str, chunk_size: int, start_time: int) -> Iterator[bytes]:
+    with open(file_name, mode="rb") as file:
+        _skip_to(file, start_time)
+        yield from read_lines(file, chunk_size)
+
+
+def read_lines(file: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE, stop: int = None) -> Iterator[bytes]:
+    """
+    Yields the rows of an open file, from its current position (which must
+    be the beginning of a row) up to `stop`, without the breakline.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        A file opened in binary mode.
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB).
+    stop : int, optional
+        The position where reading stops, which must be the beginning of a
+        row (default is the end of the file).
+
+    Yields
+    ------
+    bytes
+        The next row of the file.
+    """
+    remaining: int = -1 if stop is None else stop - file.tell()
+    pending: bytes = b""
+    while remaining != 0:
+        chunk: bytes = file.read(chunk_size if remaining < 0 else min(chunk_size, remaining))
+        if not chunk:
+            break
+        if remaining > 0:
+            remaining -= len(chunk)
+        if pending:
+            #*The last row of the previous chunk was cut in half
+            chunk = pending + chunk
+        row_start: int = 0
+        row_end: int = chunk.find(b"\n")
+        while row_end != -1:
+            if row_end > row_start:
+                yield chunk[row_start:row_end]
+            row_start = row_end + 1
+            row_end = chunk.find(b"\n", row_start)
+        pending = chunk[row_start:]
+    if pending:
+        #*The file doesn't end with a breakline
+        yield pending
+
+
+def read_rows(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, parse: Callable = split_row) -> Iterator[StrArena]:
+    """
+    Yields the rows of a file that belong to a given route and time range,
+    one at a time.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to read data from.
+    route : Route
+        The route object containing zones and stations to filter the data.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    filter_stations: bool, optional
+        If True, filters out data that doesn't correspond to the route's stations (default is True).
+    filter_entrances : bool, optional
+        If True, filters out data entries where the number of entrances is 0 (default is True).
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB).
+    parse : callable, optional
+        Turns every matching raw row into the value yielded (default is
+        `split_row`; `parse_validation` gives `Validation` records instead).
+
+    Yields
+    ------
+    StrArena
+        The columns of the next matching row: [date, time, zone, station,
+        station access, device, entrances, exits], or what `parse` returns.
+
+    Raises
+    ------
+    ValueError
+        If the ending time is not greater than the starting time or the
+        chunk size is not positive.
+    """
+    if end_time <= start_time:
+        raise ValueError("Ending time must be greater than starting time")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    return _read_rows(file_name, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, parse)
+
+
+def _read_rows(file_name: str, route: Route, start_time: int, end_time: int, filter_stations: bool, filter_entrances: bool, chunk_size: int, parse: Callable) -> Iterator[StrArena]:
+    with open(file_name, mode="rb") as file:
+        _skip_to(file, start_time)
+        yield from scan_file(file, route, start_time, end_time, filter_stations, filter_entrances, chunk_size, parse=parse)
+
+
+def scan_file(file: BinaryIO, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE, stop: int = None, parse: Callable = split_row) -> Iterator[StrArena]:
+    """
+    Yields the columns of the rows of an open file that belong to a given
+    route and time range, from its current position (which must be the
+    beginning of a row) up to `stop`. Every chunk is filtered at once by
+    `tokenizer.scan_rows`, so only the matching rows are sliced out of it.
+    It gives exactly the rows of `filter_rows` over `read_lines`.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        A file opened in binary mode.
+    chunk_size : int, optional
+        The number of bytes read from the file at a time (default is 1 MiB).
+    stop : int, optional
+        The position where reading stops, which must be the beginning of a
+        row (default is the end of the file).
+    parse : callable, optional
+        Turns every matching raw row into the value yielded (default is
+        `split_row`; `parse_validation` gives `Validation` records instead).
+
+    The rest of the parameters are the ones of `read_rows`.
+
+    Yields
+    ------
+    StrArena
+        The columns of the next matching row: [date, time, zone, station,
+        station access, device, entrances, exits], or what `parse` returns.
+    """
+    remaining: int = -1 if stop is None else stop - file.tell()
+    pending: bytes = b""
+    while True:
+        chunk: bytes = b"" if remaining == 0 else file.read(chunk_size if remaining < 0 else min(chunk_size, remaining))
+        if remaining > 0:
+            remaining -= len(chunk)
+        final: bool = not chunk
+        if pending:
+            #*The last row of the previous chunk was cut in half
+            chunk = pending + chunk
+        offsets, position, finished = scan_rows(chunk, route, start_time, end_time, filter_stations, filter_entrances, final=final)
+        for i in range(0, len(offsets), 2):
+            yield parse(chunk[offsets[i]:offsets[i + 1]])
+        if finished or final:
+            #*The files are sorted by time, so there is nothing left to read
+            return
+        pending = chunk[position:]
+
+
+def filter_rows(lines: Iterator[bytes], route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True) -> Iterator[StrArena]:
+    """
+    Yields the columns of the rows that belong to a given route and time
+    range, out of a sequence of raw rows sorted by time (e.g. the ones
+    yielded by `read_lines`). It is the row by row version of `scan_file`,
+    which gives exactly the same rows.
+
+    Yields
+    ------
+    StrArena
+        The columns of the next matching row: [date, time, zone, station,
+        station access, device, entrances, exits].
+    """
+    try:
+        for row in lines:
+            current_time: int = row_hour(row)
+            if current_time >= end_time:
+                #*The files are sorted by time, so there is nothing left to read
+                break
+            if current_time < start_time or not accept_row(row, route, filter_stations):
+                continue
+            row_data: StrArena = split_row(row)
+            if row_data[6] == "0" and filter_entrances:
+                #*Ignore data entries where the number of entrances is 0
+                continue
+            yield row_data
+    finally:
+        if hasattr(lines, "close"):
+            lines.close() #*Release the file as soon as we stop reading
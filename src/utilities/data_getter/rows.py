@@ -0,0 +1,152 @@
+"""
+Row-level helpers shared by every reader of the daily validation files.
+
+A row looks like
+`2025-02-11,17:00:00,(33)Zona B AutoNorte,(02502)Portal El Dorado,...`
+so the hour and the zone code always sit at fixed offsets, while the
+station code depends on the length of the zone name that precedes it.
+All the helpers work over the raw (undecoded) bytes of a row, so the
+readers only decode the rows that survive the filters. The `start`
+parameter lets them work directly over a bigger buffer (e.g. a memory
+mapped file) without slicing every row out of it.
+"""
+import sys
+
+from src.utilities.data_structures.strArena import StrArena
+from src.utilities.objects.route import Route
+from src.utilities.objects.validation import Validation
+
+#*The header (first line) will always be 88 characters long plus the breakline
+HEADER_LENGTH: int = 89
+#*[date, time, zone, station, station access, device, entrances, exits]
+ROW_FIELDS: int = 8
+
+
+def get_zone_name(zone_code: str, route: Route) -> int:
+    """
+    Retrieves the index of the given zone code from the route's zone codes.
+    Args:
+        zone_code (str): The zone code to search for.
+        route (Route): The route object containing zone codes.
+    Returns:
+        int: The index of the zone code in the route's zone codes.
+    Raises:
+        ValueError: If the zone code is not found in the route's zone codes.
+    """
+
+    zone_index: int = route.zone_index(int(zone_code))
+    if zone_index == -1:
+        raise ValueError(f"Code {zone_code} not found in {route.zone_codes}")
+    return zone_index
+
+
+def parse_time(time) -> int:
+    """Converts a `HH:MM:SS` time (str or bytes) into seconds since midnight"""
+    return int(time[0:2]) * 3600 + int(time[3:5]) * 60 + int(time[6:8])
+
+
+def row_hour(row: bytes, start: int = 0) -> int:
+    """Returns the hour of the row that begins at `start` (24-hour format)"""
+    return int(row[start + 11: start + 13])
+
+
+def row_zone(row: bytes, start: int = 0) -> int:
+    """Returns the zone code of the row that begins at `start` (two-digit format)"""
+    return int(row[start + 21: start + 23])
+
+
+def row_station(row: bytes, zone_name_length: int, start: int = 0) -> bytes:
+    """
+    Returns the (still encoded) station code of the row.
+
+    Parameters
+    ----------
+    row : bytes
+        The raw row, without the breakline.
+    zone_name_length : int
+        The length in bytes of the zone name of the row.
+    start : int, optional
+        The position of the first byte of the row (default is 0).
+    """
+    #*19 is the distance from the first position of a row to the second comma,
+    #*and three is to account for the comma and the parenthesis that follow
+    #*each zone name
+    return row[start + 19 + zone_name_length + 3: start + 19 + zone_name_length + 8]
+
+
+def accept_row(row: bytes, route: Route, filter_stations: bool = True, start: int = 0) -> bool:
+    """
+    Checks whether a row belongs to the given route. The time window is left
+    to the caller, since it is the one that knows when to stop reading.
+
+    Parameters
+    ----------
+    row : bytes
+        The raw row, without the breakline.
+    route : Route
+        The route object containing zones and stations to filter the data.
+    filter_stations : bool, optional
+        If True, the station of the row must also be one of the route's
+        stations (default is True).
+    start : int, optional
+        The position of the first byte of the row (default is 0).
+
+    Returns
+    -------
+    bool
+        True if the row belongs to the route, False otherwise.
+    """
+    zone_name_length: int = route.zone_name_length(row_zone(row, start))
+    if zone_name_length == -1:
+        return False
+    if not filter_stations:
+        return True
+    return route.has_station(row_station(row, zone_name_length, start))
+
+
+def split_row(row: bytes) -> StrArena:
+    """
+    Splits a raw row into its columns. The row itself becomes the arena of
+    the columns, so they are only decoded when they are read.
+
+    Returns
+    -------
+    StrArena
+        It will look like this: [date, time, zone, station, station access,
+        device, entrances, exits]
+    """
+    return StrArena.from_delimited(row, b",", ROW_FIELDS - 1)
+
+
+def no_entrances(row: bytes) -> bool:
+    """Checks whether the number of entrances of a raw row is 0"""
+    return row.split(b",", ROW_FIELDS - 1)[6] == b"0"
+
+
+#*Code of every zone, station and access label already parsed. There are only
+#*a few hundred of them, so every record shares the same int objects
+_LABEL_CODES: dict = {}
+
+
+def _label_code(label: bytes) -> int:
+    """Returns the code between the parentheses at the start of a label"""
+    code: int = _LABEL_CODES.get(label)
+    if code is None:
+        code = _LABEL_CODES[label] = int(label[1:label.index(b")")])
+    return code
+
+
+def parse_validation(row: bytes) -> Validation:
+    """
+    Parses a raw row into a `Validation`, with its time, codes and counts
+    as integers (so they are parsed only once). The date is interned, so
+    every row of a day shares the same string.
+
+    Raises
+    ------
+    ValueError
+        If a field isn't in the format of the validation files.
+    """
+    date, time, zone, station, access, device, entrances, exits = row.split(b",", ROW_FIELDS - 1)
+    return Validation(sys.intern(date.decode("utf-8")), parse_time(time), _label_code(zone), _label_code(station),
+                      _label_code(access), int(device), int(entrances), int(exits))
@@ -0,0 +1,121 @@
+"""
+Generates synthetic daily validation files with the same layout as the
+real ones, so the readers can be tested and benchmarked without the
+(private) TransMilenio data.
+"""
+import random
+
+HEADER: str = "Fecha_Transaccion,Tiempo,Linea,Estacion,Acceso_Estacion,Dispositivo,Entradas_E,Salidas_S"
+
+#*Zone name -> stations of the zone. Three of them are the zones of the K16
+#*route, with some of its stations and some that aren't part of it
+ZONES: dict = {
+    "(33)Zona B AutoNorte": [
+        "(02101)Toberin - Foundever",
+        "(02200)Alcalá – Colegio S. Tomás Dominicos",
+        "(02204)Pepe Sierra",
+        "(02103)Calle 161",
+        "(02300)Calle 100 - Marketmedios",
+    ],
+    "(38)Zona E NQS Central": [
+        "(07103)AV. CHILE",
+        "(07108)Av. El Dorado",
+        "(07110)Campín - UAN",
+    ],
+    "(11)Zona K Calle 26": [
+        "(02502)Portal El Dorado - C.C. NUESTRO BOGOTA",
+        "(06001)Modelia",
+        "(06100)Av. Rojas – UNISALESIANA",
+        "(06101)El Tiempo - Camara de Comercio de Bogota",
+        "(06102)Salitre El Greco",
+        "(06103)CAN - British Council",
+        "(06105)Quinta Paredes",
+        "(06107)Ciudad Universitaria",
+    ],
+    "(02)Zona A Caracas": [
+        "(09000)Cabecera Autopista Norte",
+        "(02001)Calle 76",
+        "(02004)Calle 63",
+    ],
+    "(04)Zona F Américas": [
+        "(05000)Portal de las Américas",
+        "(05100)Banderas",
+    ],
+    "(36)Zona G NQS Sur": [
+        "(08000)Portal Sur - JFK Coop. Financiera",
+        "(08100)General Santander",
+        "(08101)Alquería",
+        "(08102)NQS - Calle 38A Sur",
+    ],
+    "(03)Zona C Suba": [
+        "(03000)Portal de Suba",
+        "(03001)La Campiña",
+        "(03002)Suba - TV. 91",
+        "(03003)21 Ángeles",
+        "(03004)Gratamira",
+    ],
+    "(05)Zona D Calle 80": [
+        "(04000)Portal de la 80",
+        "(04001)Quirigua",
+        "(04002)Carrera 90",
+        "(04003)Avenida Cali",
+        "(04004)Granja - Carrera 77",
+    ],
+    "(06)Zona H Caracas Sur": [
+        "(07000)Portal Usme",
+        "(07001)Molinos",
+        "(07002)Consuelo",
+        "(07003)Socorro",
+        "(07004)Santa Lucía",
+    ],
+    "(12)Zona L Carrera 10": [
+        "(10000)Portal 20 de Julio",
+        "(10001)Country Sur",
+        "(10002)Avenida 1 de Mayo",
+        "(10003)Ciudad Jardín - UAN",
+    ],
+    "(14)Zona T Troncal Soacha": [
+        "(14000)San Mateo - C.C. Unisur",
+        "(14001)Terreros - Hospital Cardiovascular",
+        "(14002)León XIII",
+        "(14003)Despensa",
+    ],
+}
+
+ACCESSES: tuple = ("(0)Acceso Principal", "(1)Acceso Norte", "(2)Acceso Sur")
+
+
+def write_validation_file(file_name: str, rows: int, date: str = "2025-02-11", seed: int = 0) -> None:
+    """
+    Writes a synthetic validation file, sorted by time and spread evenly
+    over the whole day.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file to write.
+    rows : int
+        The number of rows (without the header) of the file.
+    date : str, optional
+        The date of every row (default is "2025-02-11").
+    seed : int, optional
+        The seed of the random generator, so the files are reproducible
+        (default is 0).
+    """
+    generator: random.Random = random.Random(seed)
+    stations: list = [(zone, station) for zone, zone_stations in ZONES.items() for station in zone_stations]
+    with open(file_name, mode="w", encoding="utf-8", newline="") as file:
+        file.write(HEADER + "\n")
+        batch: list = []
+        for i in range(rows):
+            seconds: int = i * 86400 // rows
+            zone, station = stations[generator.randrange(len(stations))]
+            batch.append(
+                f"{date},{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d},"
+                f"{zone},{station},{ACCESSES[generator.randrange(len(ACCESSES))]},"
+                f"{4010000 + generator.randrange(10000)},{generator.randrange(30)},{generator.randrange(30)}\n"
+            )
+            if len(batch) == 10000:
+                file.write("".join(batch))
+                batch = []
+        file.write("".join(batch))
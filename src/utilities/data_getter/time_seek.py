@@ -0,0 +1,78 @@
+"""
+Binary search over the byte offsets of a validation file.
+
+The rows of a day file are sorted by time, so the first row of a time
+window can be found by bisecting the file: every probe jumps to an offset,
+resyncs to the beginning of the next row and compares its hour. This way
+the readers only pay for the rows inside the window instead of for all the
+rows before it.
+"""
+import os
+from typing import BinaryIO
+
+from .rows import row_hour
+
+
+def _next_row(file: BinaryIO, position: int, size: int) -> tuple:
+    """
+    Returns the first position of the first row that begins at or after
+    `position`, along with its hour (or `None` if there are no rows left).
+    """
+    if position > 0:
+        file.seek(position - 1)
+        file.readline() #*Resync to the next breakline (if the previous byte is one, stays at `position`)
+        position = file.tell()
+    else:
+        file.seek(0)
+    if position >= size:
+        return size, None
+    row_start: bytes = file.read(13)
+    if len(row_start) < 13 or b"\n" in row_start:
+        return position, None #*Incomplete (or blank) row
+    return position, row_hour(row_start)
+
+
+def seek_time(file: BinaryIO, start_time: int) -> int:
+    """
+    Finds the first position of the first row whose hour is at least
+    `start_time`, using a binary search over the byte offsets of the file.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        A seekable file opened in binary mode, or a memory map of it.
+    start_time : int
+        The hour to look for (24-hour format).
+
+    Returns
+    -------
+    int
+        The position of the row, or the size of the file if every row is
+        before `start_time`. The position of the file is left unspecified.
+    """
+    file.seek(0, os.SEEK_END)
+    size: int = file.tell()
+    file.seek(0)
+    file.readline() #*Skip the header
+    low: int = file.tell()
+    high: int = size
+    #*The hour of the next row after a position never decreases as the
+    #*position increases, so we look for the first position whose next
+    #*row is already inside the window
+    while low < high:
+        middle: int = (low + high) // 2
+        _, current_time = _next_row(file, middle, size)
+        if current_time is None or current_time >= start_time:
+            high = middle
+        else:
+            low = middle + 1
+    return _next_row(file, low, size)[0]
+
+
+def find_time_offset(file_name: str, start_time: int) -> int:
+    """
+    Opens a validation file and returns the position of its first row whose
+    hour is at least `start_time` (see `seek_time`).
+    """
+    with open(file_name, mode="rb") as file:
+        return seek_time(file, start_time)
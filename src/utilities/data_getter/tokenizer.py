@@ -0,0 +1,84 @@
+"""
+Tokenizer of the daily validation files: scans a buffer of raw rows (a chunk
+of the file or a memory map), applies the time, zone, station and entrances
+filters, and returns the offsets of the rows that survive them, so the
+buffer is never split into rows from Python.
+
+`scan_rows` is the compiled version (`_tokenizer.pyx`, built with
+`python setup.py build_ext --inplace`) when it is available, or
+`py_scan_rows` otherwise. The pure Python version is the reference
+implementation: it applies the filters with the same helpers of the
+row-by-row readers (see `rows`), and both give exactly the same offsets.
+Setting the environment variable `TRANSMELO_PURE_PYTHON` forces it.
+"""
+import os
+from array import array
+
+from src.utilities.objects.route import Route
+from .rows import accept_row, row_hour, split_row
+
+
+def py_scan_rows(buffer, route: Route, start_time: int, end_time: int, filter_stations: bool = True, filter_entrances: bool = True, start: int = 0, stop: int = None, final: bool = True) -> tuple:
+    """
+    Finds the rows of a buffer that belong to a given route and time range.
+
+    Parameters
+    ----------
+    buffer : bytes, bytearray or mmap.mmap
+        The raw rows, separated by breaklines. `start` must be the beginning
+        of a row.
+    route : Route
+        The route object containing zones and stations to filter the data.
+    start_time : int
+        The starting time for filtering data (inclusive).
+    end_time : int
+        The ending time for filtering data (exclusive).
+    filter_stations: bool, optional
+        If True, filters out data that doesn't correspond to the route's stations (default is True).
+    filter_entrances : bool, optional
+        If True, filters out data entries where the number of entrances is 0 (default is True).
+    start : int, optional
+        The position where scanning starts (default is 0).
+    stop : int, optional
+        The position where scanning stops (default is the end of the buffer).
+    final : bool, optional
+        If True, the bytes after the last breakline are the last row of the
+        file (default is True). Otherwise they are left for the next call,
+        since the row may continue in the next chunk.
+
+    Returns
+    -------
+    tuple
+        `(offsets, position, finished)`: an `array("q")` with the first
+        position and the end (the breakline) of every matching row, one
+        after the other; the position where the next call must start; and
+        whether a row at or after `end_time` was found (since the files are
+        sorted by time, there is nothing left to read after it).
+    """
+    stop = len(buffer) if stop is None else stop
+    offsets: array = array("q")
+    row_start: int = start
+    while row_start < stop:
+        row_end: int = buffer.find(b"\n", row_start, stop)
+        if row_end == -1:
+            if not final:
+                break #*The row may continue in the next chunk
+            row_end = stop #*The file doesn't end with a breakline
+        if row_end > row_start:
+            current_time: int = row_hour(buffer, row_start)
+            if current_time >= end_time:
+                return offsets, row_start, True
+            if current_time >= start_time and accept_row(buffer, route, filter_stations, row_start):
+                if not (filter_entrances and split_row(buffer[row_start:row_end])[6] == "0"):
+                    offsets.append(row_start)
+                    offsets.append(row_end)
+        row_start = row_end + 1
+    return offsets, min(row_start, stop), False
+
+
+try:
+    if os.environ.get("TRANSMELO_PURE_PYTHON"):
+        raise ImportError("The pure Python tokenizer was requested")
+    from ._tokenizer import scan_rows
+except ImportError:
+    scan_rows = py_scan_rows
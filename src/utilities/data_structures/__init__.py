@@ -1,3 +1,6 @@
+from .bitArr import BitArr
 from .boolArr import BoolArr
+from .catArr import CatArr
 from .intArr import IntArr
-from .objArr import ObjArr
\ No newline at end of file
+from .objArr import ObjArr
+from .strArena import StrArena
@@ -0,0 +1,664 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Compiled versions of `IntArr`, `BoolArr`, `StrArr` and `ObjArr`, with the
+same API as the pure Python ones (which use `ctypes`). Every index is
+checked by hand, so the accesses themselves are plain C array accesses.
+
+Build it with `python setup.py build_ext --inplace`. The modules of the
+arrays use these classes when the extension is built (see `_backend.py`).
+"""
+from cpython.buffer cimport PyObject_GetBuffer
+from libc.stdint cimport INT32_MAX, INT32_MIN, int32_t
+from libc.string cimport memcpy, memmove, memset
+
+import sys
+from array import array
+
+#*Formats of the buffers whose memory already holds native int32 values
+INT32_FORMATS = ("i", "@i", "=i", "<i" if sys.byteorder == "little" else ">i")
+
+
+cdef inline int32_t _to_int32(object value):
+    """Converts an integer to int32 wrapping around, like `ctypes.c_int32`"""
+    cdef long long wide
+    try:
+        wide = value
+    except OverflowError:
+        wide = value & 0xFFFFFFFF
+    return <int32_t>wide
+
+
+cdef object _int_memory(Py_ssize_t capacity):
+    """Returns zero-initialized memory for `capacity` int32 values"""
+    if capacity < 0:
+        raise ValueError("Array length must be >= 0")
+    return memoryview(array("i", bytes(4 * capacity)))
+
+
+cdef object _byte_memory(Py_ssize_t capacity):
+    """Returns `capacity` zero-initialized bytes"""
+    if capacity < 0:
+        raise ValueError("Array length must be >= 0")
+    return memoryview(bytearray(capacity))
+
+
+cdef class IntArr:
+    cdef object _view #*memoryview (format `i`) that owns or shares the memory
+    cdef int32_t[::1] _data
+    cdef unsigned char[::1] _assigned #*A bit per position
+    cdef Py_ssize_t _capacity
+    cdef Py_ssize_t _size
+
+    def __init__(self, Py_ssize_t capacity = 0):
+        """
+        Initializes an integer array with a specified capacity (see the pure
+        Python `IntArr`).
+        """
+        self._set_memory(_int_memory(capacity))
+        self._assigned = _byte_memory((capacity + 7) >> 3)
+        self._size = 0
+
+    cdef void _set_memory(self, object view):
+        self._view = view
+        self._data = view
+        self._capacity = view.shape[0]
+
+    cdef inline bint _is_assigned(self, Py_ssize_t index):
+        return (self._assigned[index >> 3] >> (index & 7)) & 1
+
+    cdef void _assign_all(self):
+        """Marks every position as assigned"""
+        cdef Py_ssize_t nbytes = (self._capacity + 7) >> 3
+        self._assigned = _byte_memory(nbytes)
+        if nbytes > 0:
+            memset(&self._assigned[0], 0xFF, nbytes)
+            if self._capacity & 7:
+                #*Keep the bits after the last position unset
+                self._assigned[nbytes - 1] = (1 << (self._capacity & 7)) - 1
+        self._size = self._capacity
+
+    cdef Py_ssize_t _last_assigned(self):
+        cdef Py_ssize_t i = self._capacity - 1
+        while i >= 0 and not self._is_assigned(i):
+            i -= 1
+        return i
+
+    @property
+    def capacity(self):
+        """Getter for the number of positions allocated"""
+        return self._capacity
+
+    cdef void _resize(self, Py_ssize_t capacity):
+        """Moves the values to a new block of memory of the given capacity"""
+        cdef Py_ssize_t kept = min(capacity, self._capacity)
+        cdef object view = _int_memory(capacity)
+        cdef int32_t[::1] data = view
+        cdef unsigned char[::1] assigned = _byte_memory((capacity + 7) >> 3)
+        if kept > 0:
+            memcpy(&data[0], &self._data[0], kept * sizeof(int32_t))
+            memcpy(&assigned[0], &self._assigned[0], (kept + 7) >> 3)
+        self._set_memory(view)
+        self._assigned = assigned
+
+    def reserve(self, Py_ssize_t capacity):
+        """Makes sure the array can hold at least `capacity` values"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+    def shrink_to_fit(self):
+        """Frees the positions after the last assigned one"""
+        self._resize(self._last_assigned() + 1)
+
+    def append(self, value):
+        """
+        Assigns a value to the position right after the assigned ones,
+        doubling the capacity when the array is full.
+        """
+        if self._size == self._capacity:
+            self._resize(max(2 * self._capacity, 4))
+        self[self._size] = value
+
+    def extend(self, values):
+        """Appends every value of an iterable"""
+        if hasattr(values, "__len__"):
+            self.reserve(self._size + len(values))
+        for value in values:
+            self.append(value)
+
+    @classmethod
+    def from_buffer(cls, buffer, copy = False):
+        """
+        Creates an array over the memory of an object that supports the buffer
+        protocol, reading it as int32 values (see the pure Python `IntArr`).
+        """
+        cdef object view = memoryview(buffer).cast("B")
+        if view.nbytes % sizeof(int32_t) != 0:
+            raise ValueError("The size of the buffer must be a multiple of 4 bytes")
+        if copy:
+            view = memoryview(array("i", view.tobytes())).cast("B")
+        elif view.readonly:
+            raise TypeError("underlying buffer is not writable")
+        cdef IntArr arr = cls(0)
+        arr._set_memory(view.cast("i"))
+        arr._assign_all()
+        return arr
+
+    @classmethod
+    def from_numpy(cls, values):
+        """Creates an array with a (bulk) copy of the values of a NumPy array"""
+        import numpy #*Optional dependency, only needed for this conversion
+        return cls.from_buffer(numpy.ascontiguousarray(values, dtype=numpy.int32).ravel(), copy=True)
+
+    def as_memoryview(self):
+        """Returns a memoryview (format `i`) over the whole capacity of the array"""
+        return memoryview(self._view)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        #*Lends the buffer of the memoryview (which is the one released)
+        PyObject_GetBuffer(self._view, buffer, flags)
+
+    def to_numpy(self):
+        """
+        Returns a NumPy array (int32) over the memory of the array, without
+        copying it. Every position is considered assigned from now on.
+        """
+        import numpy #*Optional dependency, only needed for this conversion
+        self._assign_all()
+        return numpy.frombuffer(self.as_memoryview(), dtype=numpy.int32)
+
+    def __setitem__(self, index, value):
+        cdef Py_ssize_t start, stop
+        if isinstance(index, slice):
+            start, stop = self._slice_bounds(index)
+            values = _int32_view(value)
+            if len(values) != stop - start:
+                raise ValueError("The number of values must match the length of the slice")
+            self.copy_from(values, start)
+            return
+        if not isinstance(value, int):
+            raise TypeError("This array only supports integers.")
+        self._set(index, _to_int32(value))
+
+    cdef inline void _set(self, Py_ssize_t index, int32_t value) except *:
+        if not 0 <= index < self._capacity:
+            raise IndexError("Index out of range")
+        if not self._is_assigned(index):
+            self._size += 1
+            self._assigned[index >> 3] |= 1 << (index & 7)
+        self._data[index] = value
+
+    def __getitem__(self, index):
+        cdef Py_ssize_t start, stop, i
+        if isinstance(index, slice):
+            start, stop = self._slice_bounds(index)
+            return type(self).from_buffer(self._view[start:stop])
+        i = index
+        if 0 <= i < self._capacity:
+            return self._data[i]
+        raise IndexError("Index out of range")
+
+    cdef tuple _slice_bounds(self, slice index):
+        """Returns the first and last (exclusive) positions of a slice"""
+        start, stop, step = index.indices(self._size)
+        if step != 1:
+            raise ValueError("Only slices with step 1 are supported")
+        return start, max(start, stop)
+
+    def copy_from(self, source, Py_ssize_t start = 0):
+        """
+        Copies values into the array in bulk (a single memmove), from the
+        position `start` on (see the pure Python `IntArr`).
+        """
+        cdef const int32_t[::1] values = _int32_view(source)
+        cdef Py_ssize_t count = values.shape[0], i
+        if not 0 <= start <= self._capacity - count:
+            raise IndexError("Index out of range")
+        if count == 0:
+            return
+        memmove(&self._data[start], &values[0], count * sizeof(int32_t))
+        for i in range(start, start + count):
+            if not self._is_assigned(i):
+                self._size += 1
+                self._assigned[i >> 3] |= 1 << (i & 7)
+
+    def copy_to(self, destination, Py_ssize_t start = 0):
+        """
+        Copies the first `len(arr)` values in bulk into another IntArr or a
+        writable buffer, from its position `start` on.
+        """
+        if hasattr(destination, "copy_from") and hasattr(destination, "as_memoryview"):
+            destination.copy_from(self, start)
+            return
+        cdef int32_t[::1] target = memoryview(destination).cast("B").cast("i")
+        if not 0 <= start <= target.shape[0] - self._size:
+            raise IndexError("Index out of range")
+        if self._size > 0:
+            memmove(&target[start], &self._data[0], self._size * sizeof(int32_t))
+
+    def sum(self):
+        """Returns the sum of the first `len(arr)` values"""
+        cdef long long total = 0
+        cdef Py_ssize_t i
+        for i in range(self._size):
+            total += self._data[i]
+        return total
+
+    cdef Py_ssize_t _extreme(self, bint largest) except -1:
+        """Returns the (first) position of the smallest or largest value"""
+        cdef Py_ssize_t i, best = 0
+        if self._size == 0:
+            raise ValueError("The array is empty")
+        for i in range(1, self._size):
+            if (self._data[i] > self._data[best]) if largest else (self._data[i] < self._data[best]):
+                best = i
+        return best
+
+    def min(self):
+        """Returns the smallest of the first `len(arr)` values"""
+        return self._data[self._extreme(False)]
+
+    def max(self):
+        """Returns the largest of the first `len(arr)` values"""
+        return self._data[self._extreme(True)]
+
+    def argmax(self):
+        """Returns the (first) position of the largest of the first `len(arr)` values"""
+        return self._extreme(True)
+
+    def prefix_sums(self):
+        """
+        Returns a new array whose i-th value is the sum of the first i + 1
+        values of this one.
+        """
+        cdef IntArr result = type(self)(self._size)
+        cdef long long total = 0
+        cdef Py_ssize_t i
+        for i in range(self._size):
+            total += self._data[i]
+            result._data[i] = _checked_int32(total)
+        result._assign_all()
+        return result
+
+    cdef IntArr _elementwise(self, other, bint multiply):
+        """
+        Returns a new array with the values plus (or times) a scalar or the
+        value at the same position of another array.
+        """
+        cdef IntArr result = type(self)(self._size)
+        cdef const int32_t[::1] others
+        cdef long long scalar
+        cdef Py_ssize_t i
+        if isinstance(other, int):
+            scalar = other
+            if multiply and not -(1LL << 32) <= scalar <= (1LL << 32):
+                scalar = 1LL << 32 if scalar > 0 else -(1LL << 32) #*Every product but 0 overflows anyway
+            for i in range(self._size):
+                result._data[i] = _checked_int32(self._data[i] * scalar if multiply else self._data[i] + scalar)
+        else:
+            others = _int32_view(other)
+            if others.shape[0] != self._size:
+                raise ValueError("Both arrays must have the same length")
+            for i in range(self._size):
+                result._data[i] = _checked_int32(<long long>self._data[i] * others[i] if multiply else <long long>self._data[i] + others[i])
+        result._assign_all()
+        return result
+
+    def __add__(self, other):
+        return self._elementwise(other, False)
+
+    def __radd__(self, other):
+        return self._elementwise(other, False)
+
+    def __mul__(self, other):
+        return self._elementwise(other, True)
+
+    def __rmul__(self, other):
+        return self._elementwise(other, True)
+
+    def __iadd__(self, other):
+        self._overwrite(self._elementwise(other, False))
+        return self
+
+    def __imul__(self, other):
+        self._overwrite(self._elementwise(other, True))
+        return self
+
+    cdef void _overwrite(self, IntArr values):
+        """Copies the first `len(values)` values of another array over these"""
+        if values._size > 0:
+            memcpy(&self._data[0], &values._data[0], values._size * sizeof(int32_t))
+
+    def __repr__(self):
+        return "[" + ", ".join([str(self._data[i]) for i in range(self._size)]) + "]"
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(self._capacity):
+            if self._is_assigned(i):
+                yield self._data[i]
+
+    def __contains__(self, value):
+        cdef Py_ssize_t i
+        for i in range(self._capacity):
+            if self._is_assigned(i) and self._data[i] == value:
+                return True
+        return False
+
+    def __len__(self):
+        return self._size
+
+    def __reduce__(self):
+        values = [(i, self._data[i]) for i in range(self._capacity) if self._is_assigned(i)]
+        return (_rebuild_int_arr, (self._capacity, values))
+
+
+cdef inline int32_t _checked_int32(long long value) except? -1:
+    """Converts a result to int32, raising instead of wrapping around"""
+    if not INT32_MIN <= value <= INT32_MAX:
+        raise OverflowError("signed integer is greater than maximum" if value > 0 else "signed integer is less than minimum")
+    return <int32_t>value
+
+
+cdef object _int32_view(object values):
+    """
+    Returns a memoryview (format `i`) over the first `len(values)` positions
+    of an IntArr (of either implementation), over the memory of a buffer of
+    int32 values, or over a copy of the integers of any other buffer (e.g.
+    an int64 NumPy array) or of an iterable.
+    """
+    cdef object view
+    if isinstance(values, IntArr):
+        return (<IntArr>values)._view[:(<IntArr>values)._size]
+    if hasattr(values, "as_memoryview") and hasattr(values, "copy_from"):
+        return values.as_memoryview()[:len(values)]
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return memoryview(array("i", values))
+    if view.format in INT32_FORMATS or (view.itemsize == sizeof(int32_t) and view.format in ("l", "@l")):
+        return view.cast("B").cast("i")
+    #*Any other format is converted value by value instead of reinterpreting its bytes
+    return memoryview(array("i", view.tolist()))
+
+
+def _rebuild_int_arr(capacity, values):
+    """Rebuilds a pickled IntArr (see `IntArr.__reduce__`)"""
+    arr = IntArr(capacity)
+    for i, value in values:
+        arr[i] = value
+    return arr
+
+
+cdef class BoolArr:
+    cdef object _view #*memoryview (format `?`) that owns or shares the memory
+    cdef unsigned char[::1] _data
+    cdef Py_ssize_t _capacity
+
+    def __init__(self, Py_ssize_t capacity = 0):
+        """
+        Initializes a boolean array with a given capacity, with every
+        position set to False (see the pure Python `BoolArr`).
+        """
+        self._set_memory(_byte_memory(capacity))
+
+    cdef void _set_memory(self, object view):
+        self._data = view
+        self._view = view.cast("?")
+        self._capacity = view.shape[0]
+
+    @classmethod
+    def from_buffer(cls, buffer, copy = False):
+        """
+        Creates an array over the memory of an object that supports the buffer
+        protocol, reading every byte as a boolean.
+        """
+        cdef object view = memoryview(buffer).cast("B")
+        if copy:
+            view = memoryview(bytearray(view))
+        elif view.readonly:
+            raise TypeError("underlying buffer is not writable")
+        cdef BoolArr arr = cls(0)
+        arr._set_memory(view)
+        return arr
+
+    @classmethod
+    def from_numpy(cls, values):
+        """Creates an array with a (bulk) copy of the values of a NumPy array"""
+        import numpy #*Optional dependency, only needed for this conversion
+        return cls.from_buffer(numpy.ascontiguousarray(values, dtype=numpy.bool_).ravel(), copy=True)
+
+    def as_memoryview(self):
+        """Returns a memoryview (format `?`) over the array, without copying it"""
+        return memoryview(self._view)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        #*Lends the buffer of the memoryview (which is the one released)
+        PyObject_GetBuffer(self._view, buffer, flags)
+
+    def to_numpy(self):
+        """Returns a NumPy array (of booleans) over the memory of the array"""
+        import numpy #*Optional dependency, only needed for this conversion
+        return numpy.frombuffer(self.as_memoryview(), dtype=numpy.bool_)
+
+    def fill(self, value):
+        """Sets every position of the array to `value` at once"""
+        if self._capacity > 0:
+            memset(&self._data[0], 1 if value else 0, self._capacity)
+
+    def __setitem__(self, Py_ssize_t index, value):
+        if not isinstance(value, int) or value not in (0, 1):
+            raise TypeError("Incorrect type. Only supports booleans")
+        if not 0 <= index < self._capacity:
+            raise IndexError("Index out of range")
+        self._data[index] = 1 if value else 0
+
+    def __getitem__(self, Py_ssize_t index):
+        if 0 <= index < self._capacity:
+            return self._data[index] != 0
+        raise IndexError("Index out of range")
+
+    def __repr__(self):
+        return "[" + ", ".join([str(self._data[i] != 0) for i in range(self._capacity)]) + "]"
+
+    def __len__(self):
+        return self._capacity
+
+
+cdef class StrArr:
+    cdef list _arr #*The strings (None for the positions never set)
+    cdef Py_ssize_t _capacity
+    cdef Py_ssize_t _size
+
+    def __init__(self, Py_ssize_t capacity):
+        """
+        Initializes a new instance of an array of strings with a specified
+        capacity (see the pure Python `StrArr`).
+        """
+        if capacity < 0:
+            raise ValueError("Array length must be >= 0")
+        self._arr = [None] * capacity
+        self._capacity = capacity
+        self._size = 0
+
+    @property
+    def capacity(self):
+        """Getter for the number of positions allocated"""
+        return self._capacity
+
+    cdef void _resize(self, Py_ssize_t capacity):
+        self._arr = self._arr[:self._size] + [None] * (capacity - self._size)
+        self._capacity = capacity
+
+    def reserve(self, Py_ssize_t capacity):
+        """Makes sure the array can hold at least `capacity` strings"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+    def shrink_to_fit(self):
+        """Frees the positions after the last string"""
+        self._resize(self._size)
+
+    def __setitem__(self, Py_ssize_t index, value):
+        if not 0 <= index < self._capacity:
+            raise IndexError("Index out of bounds.")
+        if type(value) is not str:
+            value = value.encode("utf-8").decode("utf-8") #*Same errors as the ctypes version
+        if index >= self._size:
+            self._size = index + 1
+        self._arr[index] = value
+
+    def __getitem__(self, Py_ssize_t index):
+        if not 0 <= index < self._capacity:
+            raise IndexError("Index out of bounds.")
+        value = self._arr[index]
+        return "" if value is None else value
+
+    def append(self, value):
+        """Appends a value to the end of the array, doubling its capacity when full"""
+        if self._size == self._capacity:
+            self._resize(max(2 * self._capacity, 4))
+        self[self._size] = value
+
+    def extend(self, values):
+        """Appends every value of an iterable"""
+        if hasattr(values, "__len__"):
+            self.reserve(self._size + len(values))
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(self._size):
+            value = self._arr[i]
+            yield "" if value is None else value
+
+    def __contains__(self, value):
+        cdef Py_ssize_t i
+        for i in range(self._size):
+            if self._arr[i] is not None and self._arr[i] == value:
+                return True
+        return False
+
+    def __reduce__(self):
+        return (_rebuild_str_arr, (self._capacity, self._arr[:self._size]))
+
+    def __repr__(self):
+        return "[" + ", ".join(["NULL" if value is None else f"'{value}'" for value in self._arr[:self._size]]) + "]"
+
+
+def _rebuild_str_arr(capacity, values):
+    """Rebuilds a pickled StrArr (see `StrArr.__reduce__`)"""
+    arr = StrArr(capacity)
+    for i, value in enumerate(values):
+        if value is not None:
+            arr[i] = value
+    return arr
+
+
+cdef class ObjArr:
+    cdef list _arr #*The elements (None for the empty positions)
+    cdef Py_ssize_t _capacity
+    cdef Py_ssize_t _size
+
+    def __init__(self, Py_ssize_t capacity = 0):
+        """
+        Initializes a new instance of the dynamic array with a specified
+        capacity (see the pure Python `ObjArr`).
+        """
+        if capacity < 0:
+            raise ValueError("Array length must be >= 0")
+        self._arr = [None] * capacity
+        self._capacity = capacity
+        self._size = 0
+
+    @property
+    def capacity(self):
+        """Getter for the number of positions allocated"""
+        return self._capacity
+
+    cdef void _resize(self, Py_ssize_t capacity):
+        cdef Py_ssize_t kept = min(capacity, self._capacity)
+        self._arr = self._arr[:kept] + [None] * (capacity - kept)
+        self._capacity = capacity
+
+    def reserve(self, Py_ssize_t capacity):
+        """Makes sure the array can hold at least `capacity` elements"""
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+    def shrink_to_fit(self):
+        """Frees the positions after the last element"""
+        cdef Py_ssize_t last = self._capacity - 1
+        while last >= 0 and self._arr[last] is None:
+            last -= 1
+        self._resize(last + 1)
+
+    def append(self, value):
+        """
+        Stores an element in the position right after the stored ones,
+        doubling the capacity when the array is full.
+        """
+        if value is None:
+            raise ValueError("None can't be appended, it marks the empty positions")
+        if self._size == self._capacity:
+            self._resize(max(2 * self._capacity, 4))
+        self[self._size] = value
+
+    def extend(self, values):
+        """Appends every element of an iterable"""
+        if hasattr(values, "__len__"):
+            self.reserve(self._size + len(values))
+        for value in values:
+            self.append(value)
+
+    def __setitem__(self, Py_ssize_t index, value):
+        if not 0 <= index < self._capacity:
+            raise IndexError("Index out of range")
+        if self._arr[index] is None:
+            self._size += 1
+        self._arr[index] = value
+
+    def __getitem__(self, Py_ssize_t index):
+        if 0 <= index < self._size:
+            return self._arr[index]
+        raise IndexError("Index out of range")
+
+    def __repr__(self):
+        return "[" + ", ".join([f"{value}" for value in self._arr[:self._size]]) + "]"
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(self._size):
+            value = self._arr[i]
+            if value is not None:
+                yield value
+
+    def __eq__(self, other):
+        if not isinstance(other, ObjArr):
+            return False
+        cdef ObjArr arr = other
+        if self._size != arr._size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self._size):
+            if self._arr[i] != arr._arr[i]:
+                return False
+        return True
+
+    def __len__(self):
+        return self._size
+
+    def __reduce__(self):
+        values = [(i, value) for i, value in enumerate(self._arr) if value is not None]
+        return (_rebuild_obj_arr, (self._capacity, values))
+
+
+def _rebuild_obj_arr(capacity, values):
+    """Rebuilds a pickled ObjArr (see `ObjArr.__reduce__`)"""
+    arr = ObjArr(capacity)
+    for i, value in values:
+        arr[i] = value
+    return arr
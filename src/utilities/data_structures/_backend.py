@@ -0,0 +1,14 @@
+"""
+Chooses the implementation of the arrays: the compiled one (`_arrays.pyx`,
+built with `python setup.py build_ext --inplace`) when it is available, or
+the pure Python one (with `ctypes`) otherwise. Setting the environment
+variable `TRANSMELO_PURE_PYTHON` forces the pure Python one.
+"""
+import os
+
+try:
+    if os.environ.get("TRANSMELO_PURE_PYTHON"):
+        raise ImportError("The pure Python arrays were requested")
+    from . import _arrays as compiled
+except ImportError:
+    compiled = None
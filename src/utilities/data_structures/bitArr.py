@@ -0,0 +1,322 @@
+"""
+Bit-packed boolean array: stores 8 flags per byte (instead of the byte per
+flag of `BoolArr`) and works on all of them at once in the bulk operations,
+which makes it suitable for masks over millions of rows.
+"""
+import ctypes
+import re
+
+#*Positions of the bits set in every possible byte, used to iterate over the
+#*set positions without checking the bits one by one
+_SET_BITS: tuple = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+_NON_ZERO_BYTE: re.Pattern = re.compile(rb"[^\x00]")
+
+
+class BitArr:
+    """
+    A boolean array class that packs the values into the bits of a C array of
+    bytes (the i-th value is the bit `i % 8` of the byte `i // 8`). Besides
+    setting and retrieving single values, it supports bulk operations (`fill`,
+    `count`, `any`, `all`, `&`, `|`, `^` and `~`) and iterating over the
+    positions set to True (`indices`).
+    """
+    def __init__(self, capacity: int = 0):
+        """
+        Initializes a bit-packed boolean array with a given capacity, with every
+        position set to False.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The number of boolean elements the array can hold (default is 0).
+
+        Attributes
+        ----------
+        __capacity : int
+            The maximum number of elements the array can hold, equal to the
+            current number of elements too (default is 0).
+        __buffer : ctypes.Array
+            The (zero-initialized) bytes holding the values. The bits after the
+            last position are always 0.
+
+        Raises
+        ------
+        ValueError
+            If the capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("The capacity can't be negative")
+        self.__capacity: int = capacity
+        self.__buffer: ctypes.Array = (ctypes.c_uint8 * ((capacity + 7) >> 3))()
+
+
+    @classmethod
+    def from_bytes(cls, data, capacity: int = None) -> "BitArr":
+        """
+        Creates an array with a (bulk) copy of packed bytes, in the layout of
+        `as_memoryview`.
+
+        Parameters
+        ----------
+        data : bytes-like
+            The packed values.
+        capacity : int, optional
+            The number of values (default is 8 per byte of `data`).
+
+        Raises
+        ------
+        ValueError
+            If `data` doesn't have the number of bytes the capacity needs.
+        """
+        data = memoryview(data).cast("B")
+        if capacity is None:
+            capacity = 8 * len(data)
+        arr: BitArr = cls(capacity)
+        if len(data) != len(arr.__buffer):
+            raise ValueError("The number of bytes doesn't match the capacity")
+        arr.__from_int(int.from_bytes(data, "little") & ((1 << capacity) - 1))
+        return arr
+
+
+    def resize(self, capacity: int) -> None:
+        """
+        Changes the capacity of the array, keeping the values of the positions
+        that still fit (the new positions are False).
+
+        Raises
+        ------
+        ValueError
+            If the capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("The capacity can't be negative")
+        value: int = self.__to_int() & ((1 << capacity) - 1)
+        self.__capacity = capacity
+        self.__buffer = (ctypes.c_uint8 * ((capacity + 7) >> 3))()
+        self.__from_int(value)
+
+
+    def last(self) -> int:
+        """Returns the last position set to True, or -1 if there is none"""
+        return self.__to_int().bit_length() - 1
+
+
+    def __to_int(self) -> int:
+        """Returns the values as the bits of a (little-endian) integer"""
+        return int.from_bytes(self.__buffer, "little")
+
+
+    def __from_int(self, value: int) -> None:
+        """Replaces the values with the bits of an integer (in bulk)"""
+        ctypes.memmove(self.__buffer, value.to_bytes(len(self.__buffer), "little"), len(self.__buffer))
+
+
+    def __check_operand(self, other: "BitArr") -> None:
+        """Checks that a bitwise operation can be done with another array"""
+        if not isinstance(other, BitArr):
+            raise TypeError("Bitwise operations are only supported between BitArr")
+        if len(other) != self.__capacity:
+            raise ValueError("Both arrays must have the same length")
+
+
+    def __result(self, value: int) -> "BitArr":
+        """Returns a new array holding the bits of an integer"""
+        result: BitArr = BitArr(self.__capacity)
+        result.__from_int(value)
+        return result
+
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        """
+        Sets the value at the specified index in the array. Just like in
+        `BoolArr`, zeros (`0`) and ones (`1`) are cast into their boolean
+        equivalents.
+
+        Parameters
+        ----------
+        index : int
+            The index at which to set the value.
+        value : bool or int
+            The value to set at the specified index.
+
+        Raises
+        ------
+        TypeError
+            If the value is not a boolean, 1 or 0.
+        IndexError
+            If the index is out of range.
+        """
+        if not isinstance(value, int) or value not in (0, 1):
+            raise TypeError("Incorrect type. Only supports booleans")
+        if not 0 <= index < self.__capacity:
+            raise IndexError("Index out of range")
+        if value:
+            self.__buffer[index >> 3] |= 1 << (index & 7)
+        else:
+            self.__buffer[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+
+    def __getitem__(self, index: int) -> bool:
+        """
+        Retrieves the value at the specified index in the array.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range (negative or greater than the array's size).
+        """
+        if 0 <= index < self.__capacity:
+            return bool(self.__buffer[index >> 3] >> (index & 7) & 1)
+        raise IndexError("Index out of range")
+
+
+    def fill(self, value: bool) -> None:
+        """Sets every position of the array to `value` at once"""
+        ctypes.memset(self.__buffer, 0xFF if value else 0, len(self.__buffer))
+        if value and self.__capacity & 7:
+            #*Keep the bits after the last position unset
+            self.__buffer[-1] = (1 << (self.__capacity & 7)) - 1
+
+
+    def set_range(self, start: int, stop: int, value: bool = True) -> None:
+        """
+        Sets the positions from `start` (inclusive) to `stop` (exclusive) to
+        `value` at once.
+
+        Raises
+        ------
+        IndexError
+            If the range is out of the array.
+        """
+        if not 0 <= start <= stop <= self.__capacity:
+            raise IndexError("Index out of range")
+        mask: int = ((1 << (stop - start)) - 1) << start
+        current: int = self.__to_int()
+        self.__from_int(current | mask if value else current & ~mask)
+
+
+    def count(self) -> int:
+        """Returns the number of positions set to True"""
+        return self.__to_int().bit_count()
+
+
+    def any(self) -> bool:
+        """Checks whether at least one position is set to True"""
+        return _NON_ZERO_BYTE.search(bytes(self.__buffer)) is not None
+
+
+    def all(self) -> bool:
+        """Checks whether every position is set to True (True if it's empty)"""
+        return self.count() == self.__capacity
+
+
+    def indices(self):
+        """
+        Returns an iterator over the positions set to True, in increasing
+        order. The bytes without set positions are skipped by a scan done in C.
+
+        Yields
+        ------
+        int
+            The next position set to True.
+        """
+        data: bytes = bytes(self.__buffer)
+        for match in _NON_ZERO_BYTE.finditer(data):
+            position: int = match.start()
+            for bit in _SET_BITS[data[position]]:
+                yield (position << 3) + bit
+
+
+    def __and__(self, other: "BitArr") -> "BitArr":
+        """
+        Returns a new array with the positions set in both arrays.
+
+        Raises
+        ------
+        TypeError
+            If the other operand is not a BitArr.
+        ValueError
+            If the arrays have different lengths (the same holds for `|`
+            and `^`).
+        """
+        self.__check_operand(other)
+        return self.__result(self.__to_int() & other.__to_int())
+
+
+    def __or__(self, other: "BitArr") -> "BitArr":
+        """Returns a new array with the positions set in any of the arrays"""
+        self.__check_operand(other)
+        return self.__result(self.__to_int() | other.__to_int())
+
+
+    def __xor__(self, other: "BitArr") -> "BitArr":
+        """Returns a new array with the positions set in only one of the arrays"""
+        self.__check_operand(other)
+        return self.__result(self.__to_int() ^ other.__to_int())
+
+
+    def __invert__(self) -> "BitArr":
+        """Returns a new array with every position negated"""
+        return self.__result(self.__to_int() ^ ((1 << self.__capacity) - 1))
+
+
+    def __iand__(self, other: "BitArr") -> "BitArr":
+        """Keeps only the positions that are also set in the other array"""
+        self.__check_operand(other)
+        self.__from_int(self.__to_int() & other.__to_int())
+        return self
+
+
+    def __ior__(self, other: "BitArr") -> "BitArr":
+        """Also sets the positions that are set in the other array"""
+        self.__check_operand(other)
+        self.__from_int(self.__to_int() | other.__to_int())
+        return self
+
+
+    def __ixor__(self, other: "BitArr") -> "BitArr":
+        """Toggles the positions that are set in the other array"""
+        self.__check_operand(other)
+        self.__from_int(self.__to_int() ^ other.__to_int())
+        return self
+
+
+    def __eq__(self, other: object) -> bool:
+        """Checks whether both arrays have the same values"""
+        if not isinstance(other, BitArr):
+            return NotImplemented
+        return len(other) == self.__capacity and bytes(other.__buffer) == bytes(self.__buffer)
+
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Returns a memoryview (format `B`) over the packed bytes, without
+        copying them (e.g. for `numpy.unpackbits(..., bitorder="little")`).
+        """
+        return memoryview(self.__buffer).cast("B")
+
+
+    def __repr__(self) -> str:
+        """
+        Prints the array in the conventional notation
+        `[1st element, 2nd element, ..., size-th element]`
+        """
+        return "[" + ", ".join(str(self[i]) for i in range(self.__capacity)) + "]"
+
+
+    def __len__(self) -> int:
+        """
+        Returns the capacity of the array (by default, all positions are
+        set to `False`)
+        """
+        return self.__capacity
+
+
+    def __reduce__(self) -> tuple:
+        """Lets the array be pickled, since its C memory can't be"""
+        return (_rebuild_bit_arr, (self.__capacity, bytes(self.__buffer)))
+
+
+def _rebuild_bit_arr(capacity: int, data: bytes) -> BitArr:
+    """Rebuilds a pickled BitArr (see `BitArr.__reduce__`)"""
+    return BitArr.from_bytes(data, capacity)
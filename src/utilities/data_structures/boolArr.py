@@ -4,12 +4,15 @@ and python in order to create our own data structures
 """
 import ctypes
 
+from ._backend import compiled
+
 
 class BoolArr:
     """
     A boolean array class that uses a C array of booleans to store the values.
     The array can be initialized with a given capacity, and the values can be
     set and retrieved using the `__setitem__` and `__getitem__` methods.
+    It uses a byte per value; see `BitArr` for a bit-packed array.
     """
     def __init__(self, capacity: int = 0):
         """
@@ -33,14 +36,78 @@ class BoolArr:
         __arr: ctypes.POINTER
             A pointer to the allocated memory for the array elements.
         """
+        self.__buffer: ctypes.Array = (ctypes.c_bool * capacity)()
         self.__arr: ctypes.POINTER = ctypes.cast(
-            ctypes.create_string_buffer(capacity * ctypes.sizeof(ctypes.c_bool)),
+            self.__buffer,
             ctypes.POINTER(ctypes.c_bool)
-        ) #*Allocate memory to the array positions and point the pointer
-        #*to the first one
+        ) #*Allocate (zero-initialized, i.e. False) memory to the array
+        #*positions and point the pointer to the first one (the buffer is kept
+        #*to expose it to NumPy)
         self.__capacity: int = capacity
-        for element in range(capacity):
-            self.__arr[element] = False
+
+    @classmethod
+    def from_buffer(cls, buffer, copy: bool = False) -> "BoolArr":
+        """
+        Creates an array over the memory of an object that supports the buffer
+        protocol (e.g. a `bytearray` or a NumPy array of booleans), reading
+        every byte as a boolean.
+
+        Parameters
+        ----------
+        buffer : buffer
+            The object whose memory holds the values (one byte each, 0 or 1).
+        copy : bool, optional
+            If False (default), the array shares the memory of `buffer`
+            (which must be writable), so changes in one are seen in the other.
+            If True, the values are copied in bulk instead.
+
+        Raises
+        ------
+        TypeError
+            If the buffer is read-only and `copy` is False.
+        """
+        array_type: type = ctypes.c_bool * memoryview(buffer).nbytes
+        arr: BoolArr = cls(0)
+        arr.__buffer = array_type.from_buffer_copy(buffer) if copy else array_type.from_buffer(buffer)
+        arr.__arr = ctypes.cast(arr.__buffer, ctypes.POINTER(ctypes.c_bool))
+        arr.__capacity = len(arr.__buffer)
+        return arr
+
+
+    @classmethod
+    def from_numpy(cls, values) -> "BoolArr":
+        """
+        Creates an array with a (bulk) copy of the values of a NumPy array,
+        converted to booleans and flattened.
+        """
+        import numpy #*Optional dependency, only needed for this conversion
+        return cls.from_buffer(numpy.ascontiguousarray(values, dtype=numpy.bool_).ravel(), copy=True)
+
+
+    def as_memoryview(self) -> memoryview:
+        """Returns a memoryview (format `?`) over the array, without copying it"""
+        return memoryview(self.__buffer).cast("B").cast("?")
+
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Buffer protocol (Python 3.12+), so `memoryview(arr)` works"""
+        return self.as_memoryview()
+
+
+    def to_numpy(self):
+        """
+        Returns a NumPy array (of booleans) over the memory of the array,
+        without copying it: writes through the NumPy array are seen in this
+        one and vice versa.
+        """
+        import numpy #*Optional dependency, only needed for this conversion
+        return numpy.frombuffer(self.as_memoryview(), dtype=numpy.bool_)
+
+
+    def fill(self, value: bool) -> None:
+        """Sets every position of the array to `value` at once"""
+        ctypes.memset(self.__buffer, 1 if value else 0, self.__capacity)
+
 
     def __setitem__(self, index: int, value: bool) -> None:
         """
@@ -128,6 +195,12 @@ class BoolArr:
         pass
 
 
+#*The compiled BoolArr (see `_backend.py`) replaces this one when it is built
+PyBoolArr = BoolArr
+if compiled is not None:
+    BoolArr = compiled.BoolArr
+
+
 if __name__ == "__main__":
     empty_arr: BoolArr = BoolArr()
     print("Empty:", empty_arr)
@@ -0,0 +1,273 @@
+"""
+Categorical (dictionary-encoded) array of strings, for columns with a few
+distinct values repeated many times, like the stations, zones and accesses
+of the validation files: every distinct string is stored once and the
+array only keeps its int32 code.
+"""
+import struct
+from array import array
+from collections import Counter
+
+from .bitArr import BitArr
+from .intArr import IntArr
+from .strArena import StrArena
+
+
+class CatArr:
+    def __init__(self, capacity: int = 0):
+        """
+        Initializes an empty categorical array.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The number of values to reserve memory for (default is 0). The
+            array grows when it is full anyway.
+
+        Attributes
+        ----------
+        __codes : IntArr
+            The code of every value, i.e. the index of its category.
+        __categories : StrArena
+            The distinct values, in the order they first appeared.
+        __lookup : dict
+            The code of every category, so that finding it takes constant
+            time.
+        """
+        self.__codes: IntArr = IntArr(capacity)
+        self.__categories: StrArena = StrArena()
+        self.__lookup: dict = {}
+
+
+    @classmethod
+    def from_iterable(cls, values) -> "CatArr":
+        """Creates a categorical array with the strings of an iterable"""
+        arr: CatArr = cls(len(values) if hasattr(values, "__len__") else 0)
+        arr.extend(values)
+        return arr
+
+
+    @classmethod
+    def from_codes(cls, codes, categories) -> "CatArr":
+        """
+        Creates a categorical array from values that are already encoded (e.g.
+        the label columns of a columnar cache), copying the codes in bulk.
+
+        Parameters
+        ----------
+        codes : iterable of int
+            The code of every value.
+        categories : iterable of str
+            The distinct values, indexed by their code.
+
+        Raises
+        ------
+        ValueError
+            If a code isn't the index of a category or a category is repeated.
+        """
+        arr: CatArr = cls()
+        for category in categories:
+            if arr.code_of(category) != -1:
+                raise ValueError(f"Repeated category: {category}")
+            arr.__encode(category)
+        codes = array("i", codes)
+        if codes and not 0 <= min(codes) <= max(codes) < len(arr.__categories):
+            raise ValueError("Every code must be the index of a category")
+        arr.__codes = IntArr.from_buffer(codes, copy=True)
+        return arr
+
+
+    @property
+    def codes(self) -> IntArr:
+        """Getter for the codes of the values (indices into `categories`)"""
+        return self.__codes
+
+
+    @property
+    def categories(self) -> StrArena:
+        """Getter for the distinct values, indexed by their code"""
+        return self.__categories
+
+
+    def code_of(self, value: str) -> int:
+        """Returns the code of a category, or -1 if it isn't in the array"""
+        return self.__lookup.get(value, -1)
+
+
+    def __encode(self, value: str) -> int:
+        """Returns the code of a value, adding it as a category if it's new"""
+        code: int = self.__lookup.get(value, -1)
+        if code == -1:
+            if not isinstance(value, str):
+                raise TypeError("This array only supports strings.")
+            code = len(self.__categories)
+            self.__categories.append(value)
+            self.__lookup[value] = code
+        return code
+
+
+    def append(self, value: str) -> None:
+        """
+        Appends a value to the end of the array.
+
+        Raises
+        ------
+        TypeError
+            If the value is not a string.
+        """
+        self.__codes.append(self.__encode(value))
+
+
+    def extend(self, values) -> None:
+        """Appends every value of an iterable"""
+        for value in values:
+            self.append(value)
+
+
+    def shrink_to_fit(self) -> None:
+        """Frees the memory reserved for the codes after the last value"""
+        self.__codes.shrink_to_fit()
+
+
+    def __setitem__(self, index: int, value: str) -> None:
+        """
+        Replaces the value at the specified index.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        TypeError
+            If the value is not a string.
+        """
+        if not 0 <= index < len(self.__codes):
+            raise IndexError("Index out of range")
+        self.__codes[index] = self.__encode(value)
+
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Retrieves the value at the specified index (decoding its code).
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        """
+        if not 0 <= index < len(self.__codes):
+            raise IndexError("Index out of range")
+        return self.__categories[self.__codes[index]]
+
+
+    def __len__(self) -> int:
+        return len(self.__codes)
+
+
+    def __codes_view(self) -> memoryview:
+        """Returns a memoryview over the codes in use"""
+        return self.__codes.as_memoryview()[:len(self.__codes)]
+
+
+    def __iter__(self):
+        """
+        Iterates over the values of the array, decoding every category only
+        once.
+
+        Yields
+        ------
+        str
+            The next value of the array.
+        """
+        categories: list = list(self.__categories)
+        for code in self.__codes_view():
+            yield categories[code]
+
+
+    def __contains__(self, value: str) -> bool:
+        """
+        Checks if a value is in the array, looking for its code (a category
+        may have no values left after `__setitem__`).
+        """
+        code: int = self.code_of(value)
+        return code != -1 and code in self.__codes_view()
+
+
+    def equals(self, value: str) -> BitArr:
+        """
+        Returns a mask with the positions whose value is `value`, comparing
+        codes instead of strings: the bytes of the code are searched in the
+        codes, so the positions with other values are skipped in C.
+        """
+        mask: BitArr = BitArr(len(self.__codes))
+        code: int = self.code_of(value)
+        if code == -1:
+            return mask
+        data: bytes = self.__codes_view().tobytes()
+        needle: bytes = struct.pack("=i", code)
+        position: int = data.find(needle)
+        while position != -1:
+            if position % 4 == 0:
+                mask[position // 4] = True
+                position = data.find(needle, position + 4)
+            else: #*The bytes span two codes
+                position = data.find(needle, position + 1)
+        return mask
+
+
+    def isin(self, values) -> BitArr:
+        """Returns a mask with the positions whose value is any of `values`"""
+        mask: BitArr = BitArr(len(self.__codes))
+        codes: set = {self.__lookup[value] for value in values if value in self.__lookup}
+        if codes:
+            for i, code in enumerate(self.__codes_view()):
+                if code in codes:
+                    mask[i] = True
+        return mask
+
+
+    def value_counts(self) -> dict:
+        """Returns the number of times every category appears"""
+        counts: Counter = Counter(self.__codes_view())
+        return {self.__categories[code]: count for code, count in sorted(counts.items())}
+
+
+    def groups(self) -> dict:
+        """
+        Returns the positions of every category (e.g. to aggregate the rows
+        of every station), in increasing order.
+
+        Returns
+        -------
+        dict
+            Maps every category (with at least one value) to an IntArr with
+            its positions.
+        """
+        positions: list = [[] for _ in range(len(self.__categories))]
+        for i, code in enumerate(self.__codes_view()):
+            positions[code].append(i)
+        groups: dict = {}
+        for code, indices in enumerate(positions):
+            if not indices:
+                continue #*A category without values left
+            group: IntArr = IntArr(len(indices))
+            group.extend(indices)
+            groups[self.__categories[code]] = group
+        return groups
+
+
+    def __reduce__(self) -> tuple:
+        """Lets the array be pickled, since its C memory can't be"""
+        return (_rebuild_cat_arr, (list(self.__categories), list(self.__codes_view())))
+
+
+    def __repr__(self) -> str:
+        """
+        Returns the values with the format `['str1', 'str2', ..., 'strk']`,
+        just like `StrArr`.
+        """
+        return "[" + ", ".join(f"'{value}'" for value in self) + "]"
+
+
+def _rebuild_cat_arr(categories: list, codes: list) -> CatArr:
+    """Rebuilds a pickled CatArr (see `CatArr.__reduce__`)"""
+    return CatArr.from_codes(codes, categories)
@@ -1,6 +1,14 @@
 import ctypes
+import operator
+import sys
+from array import array
+from itertools import accumulate, repeat
 
-from .boolArr import BoolArr
+from ._backend import compiled
+from .bitArr import BitArr
+
+#*Formats of the buffers whose memory already holds native int32 values
+INT32_FORMATS: tuple = ("i", "@i", "=i", "<i" if sys.byteorder == "little" else ">i")
 
 class IntArr:
     def __init__(self, capacity: int = 0):
@@ -18,8 +26,8 @@ class IntArr:
             The maximum number of elements the array can hold.
         __size : int
             The current number of elements in the array.
-        __assigned : BoolArr
-            An instance of BoolArr to track assigned elements.
+        __assigned : BitArr
+            A (bit-packed) BitArr to track assigned elements.
         __arr : ctypes.POINTER
             A pointer to the allocated memory for the array.
 
@@ -30,23 +38,168 @@ class IntArr:
         """
         self.__capacity: int = capacity
         self.__size: int = 0
-        self.__assigned: BoolArr = BoolArr(capacity)
+        self.__assigned: BitArr = BitArr(capacity)
+        self.__buffer: ctypes.Array = (ctypes.c_int32 * capacity)() #*Zero-initialized
         self.__arr: ctypes.POINTER = ctypes.cast(
-            ctypes.create_string_buffer(capacity * ctypes.sizeof(ctypes.c_int32)),
+            self.__buffer,
             ctypes.POINTER(ctypes.c_int32)
-        ) #* Allocate memory using malloc to avoid using C's built-in arrays        
+        ) #*The buffer is kept (and not only the pointer) to expose it to NumPy
         if not self.__arr:
             raise MemoryError("Failed to allocate memory.")
 
 
+    @property
+    def capacity(self) -> int:
+        """Getter for the number of positions allocated"""
+        return self.__capacity
+
+
+    def __resize(self, capacity: int) -> None:
+        """
+        Moves the values to a new block of memory of the given capacity
+        (large enough to keep every assigned position).
+        """
+        buffer: ctypes.Array = (ctypes.c_int32 * capacity)()
+        ctypes.memmove(buffer, self.__buffer, ctypes.sizeof(ctypes.c_int32) * min(capacity, self.__capacity))
+        self.__buffer = buffer
+        self.__arr = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_int32))
+        self.__capacity = capacity
+        self.__assigned.resize(capacity)
+
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Makes sure the array can hold at least `capacity` values without
+        reallocating its memory. Reallocating stops sharing the memory with
+        the buffer it was created from (see `from_buffer`), if any.
+        """
+        if capacity > self.__capacity:
+            self.__resize(capacity)
+
+
+    def shrink_to_fit(self) -> None:
+        """Frees the positions after the last assigned one"""
+        self.__resize(self.__assigned.last() + 1)
+
+
+    def append(self, value: int) -> None:
+        """
+        Assigns a value to the position right after the assigned ones (i.e.
+        at `len(arr)`, so it is meant for arrays filled in order), doubling
+        the capacity when the array is full, so appending takes amortised
+        constant time.
+
+        Raises
+        ------
+        TypeError
+            If the value is not an integer.
+        """
+        if self.__size == self.__capacity:
+            self.__resize(max(2 * self.__capacity, 4))
+        self[self.__size] = value
+
+
+    def extend(self, values) -> None:
+        """
+        Appends every value of an iterable (reserving the memory for all of
+        them at once if its length is known).
+        """
+        if hasattr(values, "__len__"):
+            self.reserve(self.__size + len(values))
+        for value in values:
+            self.append(value)
+
+
+    @classmethod
+    def from_buffer(cls, buffer, copy: bool = False) -> "IntArr":
+        """
+        Creates an array over the memory of an object that supports the buffer
+        protocol (e.g. a `bytearray`, an `array.array("i")`, a NumPy array or
+        a `memoryview`), reading it as int32 values. Every position is
+        considered assigned.
+
+        Parameters
+        ----------
+        buffer : buffer
+            The object whose memory holds the values.
+        copy : bool, optional
+            If False (default), the array shares the memory of `buffer`
+            (which must be writable), so changes in one are seen in the other.
+            If True, the values are copied in bulk instead.
+
+        Raises
+        ------
+        ValueError
+            If the size of the buffer is not a multiple of 4 bytes.
+        TypeError
+            If the buffer is read-only and `copy` is False.
+        """
+        size: int = memoryview(buffer).nbytes
+        if size % ctypes.sizeof(ctypes.c_int32) != 0:
+            raise ValueError("The size of the buffer must be a multiple of 4 bytes")
+        array_type: type = ctypes.c_int32 * (size // ctypes.sizeof(ctypes.c_int32))
+        arr: IntArr = cls(0)
+        arr.__adopt(array_type.from_buffer_copy(buffer) if copy else array_type.from_buffer(buffer))
+        return arr
+
+
+    @classmethod
+    def from_numpy(cls, values) -> "IntArr":
+        """
+        Creates an array with a (bulk) copy of the values of a NumPy array,
+        converted to int32 and flattened. Every position is considered
+        assigned.
+        """
+        import numpy #*Optional dependency, only needed for this conversion
+        return cls.from_buffer(numpy.ascontiguousarray(values, dtype=numpy.int32).ravel(), copy=True)
+
+
+    def __adopt(self, buffer: ctypes.Array) -> None:
+        """Replaces the memory of the array, marking every position as assigned"""
+        self.__buffer = buffer
+        self.__arr = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_int32))
+        self.__capacity = len(buffer)
+        self.__assigned = BitArr(self.__capacity)
+        self.__assigned.fill(True)
+        self.__size = self.__capacity
+
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Returns a memoryview (format `i`) over the whole capacity of the
+        array, without copying it.
+        """
+        return memoryview(self.__buffer).cast("B").cast("i")
+
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Buffer protocol (Python 3.12+), so `memoryview(arr)` works"""
+        return self.as_memoryview()
+
+
+    def to_numpy(self):
+        """
+        Returns a NumPy array (int32) over the memory of the array, without
+        copying it: writes through the NumPy array are seen in this one and
+        vice versa. Since the NumPy array can write any position, every
+        position of this array is considered assigned from now on.
+        """
+        import numpy #*Optional dependency, only needed for this conversion
+        self.__assigned.fill(True)
+        self.__size = self.__capacity
+        return numpy.frombuffer(self.as_memoryview(), dtype=numpy.int32)
+
+
     def __setitem__(self, index: int, value: int) -> None: #? If index is not given, should we default it to size of the array? Sounds useful
         """
         Sets the value at the specified index in the array.
 
         Parameters
         ----------
-        index : int
-            The index at which to set the value.
+        index : int or slice
+            The index at which to set the value. A slice (with step 1) sets
+            its positions to the values of an IntArr, a buffer or an iterable
+            of the same length, copied in bulk (see `copy_from`).
         value : int
             The value to set at the specified index.
 
@@ -56,7 +209,17 @@ class IntArr:
             If the value is not an integer.
         IndexError
             If the index is out of range.
+        ValueError
+            If the slice has a step other than 1 or a different length than
+            the values.
         """
+        if isinstance(index, slice):
+            start, stop = self.__slice_bounds(index)
+            values: memoryview = _int32_view(value)
+            if len(values) != stop - start:
+                raise ValueError("The number of values must match the length of the slice")
+            self.copy_from(values, start)
+            return
         if not isinstance(value, int):
             raise TypeError("This array only supports integers.")
         if 0 <= index < self.__capacity:
@@ -74,21 +237,195 @@ class IntArr:
 
         Parameters
         ----------
-        index : int
-            The index from which to retrieve the value.
+        index : int or slice
+            The index from which to retrieve the value. A slice (with step 1)
+            of the first `len(arr)` positions returns an IntArr over the same
+            memory (a view, nothing is copied), so writes through it are seen
+            in this array.
 
         Raises
         ------
         IndexError
             If the index is out of range (negative or greater than the array's capacity).
+        ValueError
+            If the slice has a step other than 1.
         """
+        if isinstance(index, slice):
+            start, stop = self.__slice_bounds(index)
+            return type(self).from_buffer(self.as_memoryview()[start:stop])
         if 0 <= index < self.__capacity:
-            if self.__arr[index] is None:
-                raise IndexError("Index has no assigned value")
             return self.__arr[index] #!Make sure this is legal
         raise IndexError("Index out of range")
 
 
+    def __slice_bounds(self, index: slice) -> tuple:
+        """Returns the first and last (exclusive) positions of a slice"""
+        start, stop, step = index.indices(self.__size)
+        if step != 1:
+            raise ValueError("Only slices with step 1 are supported")
+        return start, max(start, stop)
+
+
+    def __values(self) -> memoryview:
+        """Returns a memoryview (format `i`) over the first `len(arr)` positions"""
+        return self.as_memoryview()[:self.__size]
+
+
+    def copy_from(self, source, start: int = 0) -> None:
+        """
+        Copies values into the array in bulk (a single memmove), from the
+        position `start` on, marking their positions as assigned.
+
+        Parameters
+        ----------
+        source : IntArr, buffer or iterable of int
+            The values: the first `len(source)` positions of an IntArr, the
+            memory of a buffer of int32 values, or the integers of any other
+            buffer (e.g. an int64 NumPy array, converted one by one) or of an
+            iterable.
+        start : int, optional
+            The position of the first value (default is 0).
+
+        Raises
+        ------
+        IndexError
+            If the values don't fit in the capacity of the array.
+        TypeError
+            If a value is not an integer.
+        OverflowError
+            If a value doesn't fit in 32 bits.
+        """
+        values: memoryview = _int32_view(source)
+        if not 0 <= start <= self.__capacity - len(values):
+            raise IndexError("Index out of range")
+        self.as_memoryview()[start:start + len(values)] = values
+        self.__assigned.set_range(start, start + len(values))
+        self.__size = self.__assigned.count()
+
+
+    def copy_to(self, destination, start: int = 0) -> None:
+        """
+        Copies the first `len(arr)` values of the array in bulk into another
+        IntArr or a writable buffer (written as int32 values), from its
+        position `start` on. To copy only some of them, copy a slice.
+
+        Raises
+        ------
+        IndexError
+            If the values don't fit in the destination.
+        """
+        if isinstance(destination, (PyIntArr, IntArr)):
+            destination.copy_from(self, start)
+            return
+        target: memoryview = memoryview(destination).cast("B").cast("i")
+        if not 0 <= start <= len(target) - self.__size:
+            raise IndexError("Index out of range")
+        target[start:start + self.__size] = self.__values()
+
+
+    def sum(self) -> int:
+        """Returns the sum of the first `len(arr)` values"""
+        return sum(self.__values())
+
+
+    def min(self) -> int:
+        """
+        Returns the smallest of the first `len(arr)` values.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        """
+        return min(self.__values())
+
+
+    def max(self) -> int:
+        """
+        Returns the largest of the first `len(arr)` values.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        """
+        return max(self.__values())
+
+
+    def argmax(self) -> int:
+        """
+        Returns the (first) position of the largest of the first `len(arr)`
+        values.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        """
+        values: list = self.__values().tolist()
+        return values.index(max(values))
+
+
+    def prefix_sums(self) -> "IntArr":
+        """
+        Returns a new array whose i-th value is the sum of the first i + 1
+        values of this one (e.g. the cumulative boardings along a route).
+
+        Raises
+        ------
+        OverflowError
+            If a sum doesn't fit in 32 bits.
+        """
+        return type(self).from_buffer(array("i", accumulate(self.__values())))
+
+
+    def __elementwise(self, other, operation) -> array:
+        """
+        Applies an operation to every value and a scalar or the value at the
+        same position of another array (the loop runs in C, through `map`).
+
+        Raises
+        ------
+        ValueError
+            If the other array has a different length.
+        OverflowError
+            If a result doesn't fit in 32 bits.
+        """
+        values: memoryview = self.__values()
+        if isinstance(other, int):
+            return array("i", map(operation, values, repeat(other, len(values))))
+        others: memoryview = _int32_view(other)
+        if len(others) != len(values):
+            raise ValueError("Both arrays must have the same length")
+        return array("i", map(operation, values, others))
+
+
+    def __add__(self, other) -> "IntArr":
+        """Returns a new array with the values plus a scalar or another array"""
+        return type(self).from_buffer(self.__elementwise(other, operator.add))
+
+
+    def __mul__(self, other) -> "IntArr":
+        """Returns a new array with the values times a scalar or another array"""
+        return type(self).from_buffer(self.__elementwise(other, operator.mul))
+
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+
+    def __iadd__(self, other) -> "IntArr":
+        """Adds a scalar or another array to the values, in place"""
+        self.__values()[:] = self.__elementwise(other, operator.add)
+        return self
+
+
+    def __imul__(self, other) -> "IntArr":
+        """Multiplies the values by a scalar or another array, in place"""
+        self.__values()[:] = self.__elementwise(other, operator.mul)
+        return self
+
+
     def __repr__(self) -> str:
         """
         Prints the array in the conventional notation
@@ -112,9 +449,8 @@ class IntArr:
         int
             The next value in the array.
         """
-        for i in range(self.__capacity):
-            if self.__assigned[i]:
-                yield self.__arr[i]
+        for i in self.__assigned.indices():
+            yield self.__arr[i]
 
 
     def __contains__(self, value: int) -> bool:
@@ -131,8 +467,8 @@ class IntArr:
         bool
             True if the value is found in the array, False otherwise.
         """
-        for i in range(self.__capacity):
-            if self.__assigned[i] and self.__arr[i] == value:
+        for i in self.__assigned.indices():
+            if self.__arr[i] == value:
                 return True
         return False
 
@@ -142,10 +478,59 @@ class IntArr:
         return self.__size
 
 
+    def __reduce__(self) -> tuple:
+        """
+        Lets the array be pickled (e.g. to send it to another process), since
+        the pointer to its memory can't be.
+        """
+        values: list = [(i, self.__arr[i]) for i in self.__assigned.indices()]
+        return (_rebuild_int_arr, (self.__capacity, values))
+
+
     def __del__(self) -> None:
         """
         Frees the memory of the head pointer, since Python's garbage collector
         doesn't free C's pointers allocated in the heap
         """
         pass
-        # ctypes.CDLL(None).free(self.__arr)
\ No newline at end of file
+        # ctypes.CDLL(None).free(self.__arr)
+
+
+def _int32_view(values) -> memoryview:
+    """
+    Returns a memoryview (format `i`) over the first `len(values)` positions
+    of an IntArr, over the memory of a buffer of int32 values, or over a copy
+    of the integers of any other buffer (e.g. an int64 NumPy array) or of an
+    iterable.
+
+    Raises
+    ------
+    TypeError
+        If a value is not an integer.
+    OverflowError
+        If a value doesn't fit in 32 bits.
+    """
+    if isinstance(values, (PyIntArr, IntArr)):
+        return values.as_memoryview()[:len(values)]
+    try:
+        view: memoryview = memoryview(values)
+    except TypeError:
+        return memoryview(array("i", values))
+    if view.format in INT32_FORMATS or (view.itemsize == 4 and view.format in ("l", "@l")):
+        return view.cast("B").cast("i")
+    #*Any other format is converted value by value instead of reinterpreting its bytes
+    return memoryview(array("i", view.tolist()))
+
+
+def _rebuild_int_arr(capacity: int, values: list) -> IntArr:
+    """Rebuilds a pickled IntArr (see `IntArr.__reduce__`)"""
+    arr: IntArr = IntArr(capacity)
+    for i, value in values:
+        arr[i] = value
+    return arr
+
+
+#*The compiled IntArr (see `_backend.py`) replaces this one when it is built
+PyIntArr = IntArr
+if compiled is not None:
+    IntArr = compiled.IntArr
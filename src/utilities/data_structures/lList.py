@@ -1,45 +1,173 @@
-"""Module that stores a LinkedList DS."""
+"""
+Module that stores a LinkedList DS.
+
+The list is "unrolled": every node holds a chunk of up to `node_capacity`
+values, so there are `node_capacity` times fewer nodes to allocate and walk.
+It also remembers the last node it accessed (the cursor), so accessing the
+positions in order (`for i in range(len(llist)): llist[i]`) takes constant
+time per access instead of walking from the head every time.
+"""
+from itertools import islice
+
+#*Values stored in every node (by default)
+NODE_CAPACITY: int = 64
+#*Marks the end of an iterable in `LList.extend`
+_END: object = object()
 
 
 class Node:
-    def __init__(self, value: any = None):
-        self.value: any = value
+    def __init__(self, values: list = None):
+        """
+        Initializes a node of an unrolled linked list.
+
+        Attributes
+        ----------
+        values : list
+            The values of the node, in order.
+        next : Node
+            The following node, or None if this is the last one.
+        """
+        self.values: list = [] if values is None else values
         self.next: Node = None
 
 
 class LList:
-    def __init__(self):
+    def __init__(self, node_capacity: int = NODE_CAPACITY):
+        """
+        Initializes an empty linked list.
+
+        Parameters
+        ----------
+        node_capacity : int, optional
+            The number of values stored in every node (default is 64).
+
+        Attributes
+        ----------
+        __head_offset : int
+            The number of values already removed (see `pop_front`) from the
+            beginning of the first node.
+        __cursor : Node
+            The last node accessed by index.
+        __cursor_start : int
+            The index of the first value of the cursor's node (negative for
+            the first node if values were removed from it).
+
+        Raises
+        ------
+        ValueError
+            If the capacity of the nodes is not positive.
+        """
+        if node_capacity <= 0:
+            raise ValueError("The capacity of the nodes must be positive")
+        self.__node_capacity: int = node_capacity
         self.__head: Node = None
         self.__tail: Node = None
         self.__size: int = 0
+        self.__head_offset: int = 0
+        self.__cursor: Node = None
+        self.__cursor_start: int = 0
 
 
     def add(self, value):
-        new_node: Node = Node(value)
+        """Appends a value to the end of the list"""
+        if self.__tail is None or len(self.__tail.values) == self.__node_capacity:
+            self.__add_node()
+        self.__tail.values.append(value)
+        self.__size += 1
+
+
+    def extend(self, values) -> None:
+        """Appends every value of an iterable, filling the nodes a chunk at a time"""
+        values = iter(values)
+        while True:
+            if self.__tail is None or len(self.__tail.values) == self.__node_capacity:
+                first: any = next(values, _END)
+                if first is _END:
+                    return
+                self.add(first) #*Only links a new node if there are values left
+            chunk: list = self.__tail.values
+            size: int = len(chunk)
+            chunk.extend(islice(values, self.__node_capacity - size))
+            self.__size += len(chunk) - size
+            if len(chunk) < self.__node_capacity:
+                return #*The iterable is exhausted
+
+
+    def __add_node(self) -> None:
+        """Links a new (empty) node after the last one"""
+        new_node: Node = Node()
         if self.__tail is not None:
             self.__tail.next = new_node
         else:
             self.__head = new_node
+            self.__cursor = new_node
+            self.__cursor_start = 0
         self.__tail = new_node
-        self.__size += 1
+
+
+    def pop_front(self) -> any:
+        """
+        Removes and returns the first value of the list in constant time.
+
+        Raises
+        ------
+        IndexError
+            If the list is empty.
+        """
+        if self.__size == 0:
+            raise IndexError("Pop from an empty list")
+        head: Node = self.__head
+        value: any = head.values[self.__head_offset]
+        head.values[self.__head_offset] = None #*Don't keep it alive
+        self.__head_offset += 1
+        self.__size -= 1
+        self.__cursor_start -= 1 #*Every index moves one position down
+        if self.__head_offset == len(head.values):
+            self.__head = head.next
+            self.__head_offset = 0
+            if self.__head is None:
+                self.__tail = None
+            if self.__cursor is head:
+                self.__cursor, self.__cursor_start = self.__head, 0
+        return value
+
+
+    def __locate(self, index: int) -> tuple:
+        """
+        Returns the node of a position and the position of the value in the
+        node, walking from the cursor (or from the head if the position is
+        before it) and moving the cursor there.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        """
+        if not 0 <= index < self.__size:
+            raise IndexError("Index out of range")
+        node: Node = self.__cursor
+        start: int = self.__cursor_start
+        tail_start: int = self.__size - len(self.__tail.values)
+        if index >= tail_start:
+            node, start = self.__tail, tail_start
+        elif index < start:
+            node, start = self.__head, -self.__head_offset
+        while index >= start + len(node.values):
+            start += len(node.values)
+            node = node.next
+        self.__cursor = node
+        self.__cursor_start = start
+        return node, index - start
 
 
     def __getitem__(self, index: int) -> any:
-        current = self.__head
-        if 0 <= index < self.__size:
-            for _ in range(index):
-                current = current.next
-        return current.value
+        node, position = self.__locate(index)
+        return node.values[position]
 
 
     def __setitem__(self, index, value) -> None:
-        current = self.__head
-        if 0 <= index < self.__size:
-            for _ in range(index):
-                current = current.next
-            current.value = value
-        else:
-            raise IndexError("Index out of range")
+        node, position = self.__locate(index)
+        node.values[position] = value
 
 
     def __len__(self):
@@ -47,18 +175,12 @@ class LList:
 
 
     def __repr__(self):
-        repr: str = "["
-        current: Node = self.__head
-        while current != self.__tail and current is not None:
-            repr += f"{current.value} -> "
-            current = current.next
-        if self.__tail is not None:
-            repr += f"{self.__tail.value}"
-        repr += "]"
-        return repr
+        return "[" + " -> ".join(f"{value}" for value in self) + "]"
 
     def __iter__(self):
         current = self.__head
+        offset: int = self.__head_offset
         while current:
-            yield current.value
-            current = current.next
\ No newline at end of file
+            yield from islice(current.values, offset, None)
+            current = current.next
+            offset = 0
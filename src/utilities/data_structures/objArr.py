@@ -1,5 +1,7 @@
 import ctypes
 
+from ._backend import compiled
+
 class ObjArr:
     def __init__(self, capacity: int = 0):
         """
@@ -28,10 +30,11 @@ class ObjArr:
 
         self.__capacity: int = capacity
         self.__size: int = 0
+        self.__buffer: ctypes.Array = (ctypes.py_object * capacity)()
         self.__arr = ctypes.cast(
-            (ctypes.py_object * capacity)(),
+            self.__buffer,
             ctypes.POINTER(ctypes.py_object)
-        )
+        ) #*The buffer is kept (and not only the pointer) to copy it when growing
         #? py_obj is about 7 times the capacity of a c_int
         #? stores any type of object, so it can be treated as a list
         if not self.__arr:
@@ -39,10 +42,76 @@ class ObjArr:
 
         #*Initialize all elements to None (required due to ctypes.py_object
         #*not being handled by ctypes by default, and for the reference
-        #*handling implementation)
-        for i in range(capacity):
-            #* To check if there's a 
-            self.__arr[i] = None 
+        #*handling implementation), all at once through a slice
+        self.__buffer[:] = [None] * capacity
+
+
+    @property
+    def capacity(self) -> int:
+        """Getter for the number of positions allocated"""
+        return self.__capacity
+
+
+    def __resize(self, capacity: int) -> None:
+        """
+        Moves the elements to a new block of memory of the given capacity
+        (large enough to keep every element). The slices are copied by ctypes,
+        which also takes the references to the elements.
+        """
+        kept: int = min(capacity, self.__capacity)
+        buffer: ctypes.Array = (ctypes.py_object * capacity)()
+        buffer[:kept] = self.__buffer[:kept]
+        buffer[kept:] = [None] * (capacity - kept)
+        self.__buffer = buffer
+        self.__arr = ctypes.cast(buffer, ctypes.POINTER(ctypes.py_object))
+        self.__capacity = capacity
+
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Makes sure the array can hold at least `capacity` elements without
+        reallocating its memory.
+        """
+        if capacity > self.__capacity:
+            self.__resize(capacity)
+
+
+    def shrink_to_fit(self) -> None:
+        """Frees the positions after the last element"""
+        last: int = self.__capacity - 1
+        while last >= 0 and self.__arr[last] is None:
+            last -= 1
+        self.__resize(last + 1)
+
+
+    def append(self, value: any) -> None:
+        """
+        Stores an element in the position right after the stored ones (i.e.
+        at `len(arr)`, so it is meant for arrays filled in order), doubling
+        the capacity when the array is full, so appending takes amortised
+        constant time.
+
+        Raises:
+        -------
+        ValueError
+            If the element is None, which marks the empty positions.
+        """
+        if value is None:
+            raise ValueError("None can't be appended, it marks the empty positions")
+        if self.__size == self.__capacity:
+            self.__resize(max(2 * self.__capacity, 4))
+        self[self.__size] = value
+
+
+    def extend(self, values) -> None:
+        """
+        Appends every element of an iterable (reserving the memory for all of
+        them at once if its length is known).
+        """
+        if hasattr(values, "__len__"):
+            self.reserve(self.__size + len(values))
+        for value in values:
+            self.append(value)
 
 
     def __setitem__(self, index: int, value: any) -> None:
@@ -62,10 +131,9 @@ class ObjArr:
             If the index is out of range.
         """
         if 0 <= index < self.__capacity:
-            #*Decrease reference count for the old object before replacing (not managed by Python's garbage collector)
-            if self.__arr[index] is not None:
-                ctypes.pythonapi.Py_DecRef(ctypes.py_object(self.__arr[index]))
-            else:
+            #*The old object is released by ctypes itself when its slot is
+            #*replaced (the pointer keeps a reference to every stored object)
+            if self.__arr[index] is None:
                 self.__size += 1
             self.__arr[index] = ctypes.py_object(value) #!Make sure this is legal (arguably it is, since it's just an operator and how Python manages pointer dereferencing and arithmetic)
         else:
@@ -128,7 +196,7 @@ class ObjArr:
         bool
             True if the arrays are equal, False otherwise.
         """
-        if not isinstance(other, ObjArr):
+        if not isinstance(other, type(self)):
             return False
         if self.__size != other.__size:
             return False
@@ -143,14 +211,33 @@ class ObjArr:
         return self.__size
 
 
+    def __reduce__(self) -> tuple:
+        """
+        Lets the array be pickled (e.g. to send it to another process), as
+        long as its elements can be pickled too.
+        """
+        values: list = [(i, self.__arr[i]) for i in range(self.__capacity) if self.__arr[i] is not None]
+        return (_rebuild_obj_arr, (self.__capacity, values))
+
+
     def __del__(self) -> None:
         """
-        Frees the memory of the head pointer (since it's a C type) and
-        decreases the reference count of all the elements in the array to let
-        the garbage collector free their memory.
+        Nothing to free: the references to the elements are owned by the
+        pointer, so they are released along with it. Decreasing them by hand
+        would free the elements while they are still in use.
         """
-        for i in range(self.__capacity):
-            if self.__arr[i] is not None:
-                ctypes.pythonapi.Py_DecRef(ctypes.py_object(self.__arr[i]))
-    
-    
\ No newline at end of file
+        pass
+
+
+def _rebuild_obj_arr(capacity: int, values: list) -> ObjArr:
+    """Rebuilds a pickled ObjArr (see `ObjArr.__reduce__`)"""
+    arr: ObjArr = ObjArr(capacity)
+    for i, value in values:
+        arr[i] = value
+    return arr
+
+
+#*The compiled ObjArr (see `_backend.py`) replaces this one when it is built
+PyObjArr = ObjArr
+if compiled is not None:
+    ObjArr = compiled.ObjArr
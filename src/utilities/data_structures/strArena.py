@@ -0,0 +1,271 @@
+"""
+Array of strings stored in an arena: a single growable block of UTF-8 bytes
+(instead of a buffer per string, like `StrArr`) and an int32 array with the
+offsets where every string begins and ends in it.
+"""
+import ctypes
+from array import array
+from collections import Counter
+from itertools import accumulate
+
+
+class StrArena:
+    def __init__(self, nbytes: int = 0, intern: bool = False):
+        """
+        Initializes an empty array of strings stored in an arena.
+
+        Parameters
+        ----------
+        nbytes : int, optional
+            The number of bytes to reserve for the strings (default is 0).
+            The arena grows when it is full anyway.
+        intern : bool, optional
+            If True, the bytes of repeated strings (like station names or
+            zone labels) are stored only once and shared by all of them
+            (default is False).
+
+        Attributes
+        ----------
+        __buffer : ctypes.Array
+            The block of memory holding the UTF-8 bytes of the strings, one
+            after the other.
+        __used : int
+            The number of bytes of the buffer in use.
+        __offsets : array
+            The (int32) position where the i-th string begins (at `2 * i`)
+            and ends (at `2 * i + 1`) in the buffer. A standard `array` is
+            used instead of an `IntArr` since it grows on its own and is
+            cheaper to create, which matters for the millions of rows of the
+            loaders.
+        __interned : dict
+            The bytes of every distinct string and the positions where they
+            are stored (only if `intern` is True). They are kept even after
+            every string with them is replaced, so they can be reused.
+        __counts : dict
+            The number of strings of the array with every distinct bytes
+            (only if `intern` is True), so `in` doesn't find the replaced
+            ones.
+        """
+        self.__size: int = 0
+        self.__used: int = 0
+        self.__buffer: ctypes.Array = (ctypes.c_char * nbytes)()
+        self.__offsets: array = array("i")
+        self.__interned: dict = {} if intern else None
+        self.__counts: dict = {} if intern else None
+
+
+    @classmethod
+    def from_iterable(cls, values, intern: bool = False) -> "StrArena":
+        """
+        Creates an array with the strings of an iterable, encoding them and
+        copying their bytes into the arena at once.
+
+        Parameters
+        ----------
+        values : iterable of str
+            The strings to store.
+        intern : bool, optional
+            If True, the repeated strings are stored only once (default is
+            False).
+        """
+        encoded: list = [value.encode("utf-8") for value in values]
+        arena: StrArena = cls(0, intern)
+        if intern:
+            distinct: dict = dict.fromkeys(encoded)
+            ends: list = list(accumulate(len(value) for value in distinct))
+            for value, end in zip(distinct, ends):
+                arena.__interned[value] = (end - len(value), end)
+            arena.__counts = dict(Counter(encoded))
+            positions: list = [arena.__interned[value] for value in encoded]
+            arena.__set_contents(b"".join(distinct), [offset for position in positions for offset in position])
+        else:
+            ends: list = list(accumulate(len(value) for value in encoded))
+            offsets: list = [0] * (2 * len(encoded))
+            offsets[1::2] = ends
+            offsets[2::2] = ends[:-1]
+            arena.__set_contents(b"".join(encoded), offsets)
+        return arena
+
+
+    @classmethod
+    def from_delimited(cls, data: bytes, separator: bytes = b",", maxsplit: int = -1) -> "StrArena":
+        """
+        Creates an array with the fields of a delimited UTF-8 line (e.g. a row
+        of a validation file), without decoding nor copying every field on its
+        own: the line becomes the arena and only the positions of the
+        separators are stored.
+
+        Parameters
+        ----------
+        data : bytes
+            The line to split.
+        separator : bytes, optional
+            The separator of the fields (default is a comma).
+        maxsplit : int, optional
+            The maximum number of splits, as in `bytes.split` (default is -1,
+            no limit). The last field keeps the rest of the line.
+        """
+        offsets: list = [0]
+        position: int = data.find(separator)
+        while position != -1 and maxsplit != 0:
+            offsets.append(position)
+            offsets.append(position + len(separator))
+            position = data.find(separator, position + len(separator))
+            maxsplit -= 1
+        offsets.append(len(data))
+        arena: StrArena = cls()
+        arena.__set_contents(data, offsets)
+        return arena
+
+
+    def __set_contents(self, data: bytes, offsets: list) -> None:
+        """Replaces the arena and the offsets of an empty array in bulk"""
+        self.__buffer = (ctypes.c_char * len(data)).from_buffer_copy(data)
+        self.__used = len(data)
+        self.__offsets = array("i", offsets)
+        self.__size = len(offsets) // 2
+
+
+    @property
+    def nbytes(self) -> int:
+        """Getter for the number of bytes of the arena in use"""
+        return self.__used
+
+
+    def __store(self, value: str) -> tuple:
+        """
+        Copies the bytes of a string to the end of the arena (doubling its
+        size when it is full), unless it is interned already.
+
+        Returns
+        -------
+        tuple
+            The positions where the string begins and ends in the arena.
+        """
+        encoded: bytes = value.encode("utf-8")
+        if self.__interned is not None:
+            self.__counts[encoded] = self.__counts.get(encoded, 0) + 1
+            if encoded in self.__interned:
+                return self.__interned[encoded]
+        start: int = self.__used
+        end: int = start + len(encoded)
+        if end > len(self.__buffer):
+            buffer: ctypes.Array = (ctypes.c_char * max(2 * len(self.__buffer), end, 64))()
+            ctypes.memmove(buffer, self.__buffer, self.__used)
+            self.__buffer = buffer
+        ctypes.memmove(ctypes.addressof(self.__buffer) + start, encoded, len(encoded))
+        self.__used = end
+        if self.__interned is not None:
+            self.__interned[encoded] = (start, end)
+        return start, end
+
+
+    def append(self, value: str) -> None:
+        """Appends a string to the end of the array"""
+        start, end = self.__store(value)
+        self.__offsets.append(start)
+        self.__offsets.append(end)
+        self.__size += 1
+
+
+    def extend(self, values) -> None:
+        """Appends every string of an iterable"""
+        for value in values:
+            self.append(value)
+
+
+    def shrink_to_fit(self) -> None:
+        """Frees the unused memory at the end of the arena"""
+        buffer: ctypes.Array = (ctypes.c_char * self.__used)()
+        ctypes.memmove(buffer, self.__buffer, self.__used)
+        self.__buffer = buffer
+
+
+    def __setitem__(self, index: int, value: str) -> None:
+        """
+        Replaces the string at the specified index. The new bytes are added to
+        the end of the arena (the old ones are not reused).
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+        """
+        if not 0 <= index < self.__size:
+            raise IndexError("Index out of bounds.")
+        if self.__counts is not None:
+            replaced: bytes = self.__buffer[self.__offsets[2 * index]: self.__offsets[2 * index + 1]]
+            self.__counts[replaced] -= 1
+            if self.__counts[replaced] == 0:
+                del self.__counts[replaced]
+        start, end = self.__store(value)
+        self.__offsets[2 * index] = start
+        self.__offsets[2 * index + 1] = end
+
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Retrieves the string at the specified index in constant time.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+        """
+        if not 0 <= index < self.__size:
+            raise IndexError("Index out of bounds.")
+        return self.__buffer[self.__offsets[2 * index]: self.__offsets[2 * index + 1]].decode("utf-8")
+
+
+    def __len__(self) -> int:
+        return self.__size
+
+
+    def __iter__(self):
+        """
+        Iterates over the strings of the array.
+
+        Yields
+        ------
+        str
+            The next string of the array.
+        """
+        data: bytes = self.__buffer[:self.__used] #*A single copy of the arena
+        offsets: array = self.__offsets
+        for i in range(self.__size):
+            yield data[offsets[2 * i]: offsets[2 * i + 1]].decode("utf-8")
+
+
+    def __contains__(self, value: str) -> bool:
+        """
+        Checks if the given string is in the array, comparing bytes (the
+        strings of the array are not decoded). If the array interns its
+        strings it only takes a dictionary lookup.
+        """
+        encoded: bytes = value.encode("utf-8")
+        if self.__counts is not None:
+            return encoded in self.__counts
+        data: bytes = self.__buffer[:self.__used]
+        offsets: array = self.__offsets
+        for i in range(self.__size):
+            if data[offsets[2 * i]: offsets[2 * i + 1]] == encoded:
+                return True
+        return False
+
+
+    def __reduce__(self) -> tuple:
+        """Lets the array be pickled, since its C memory can't be"""
+        return (_rebuild_str_arena, (list(self), self.__interned is not None))
+
+
+    def __repr__(self) -> str:
+        """
+        Returns the strings with the format `['str1', 'str2', ..., 'strk']`,
+        just like `StrArr`.
+        """
+        return "[" + ", ".join(f"'{value}'" for value in self) + "]"
+
+
+def _rebuild_str_arena(values: list, intern: bool) -> StrArena:
+    """Rebuilds a pickled StrArena (see `StrArena.__reduce__`)"""
+    return StrArena.from_iterable(values, intern)
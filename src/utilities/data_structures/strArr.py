@@ -1,5 +1,7 @@
 import ctypes
 
+from ._backend import compiled
+
 class StrArr:
     def __init__(self, capacity: int):
         """
@@ -15,12 +17,41 @@ class StrArr:
         self.__capacity: int = capacity
         self.__size: int = 0
         
-        #*Allocate a capacity-long block of memory to hold char pointers
+        #*Allocate a capacity-long block of memory to hold char pointers (all
+        #*of them are initialized to NULL by ctypes)
         self.__arr = (ctypes.POINTER(ctypes.c_char) * capacity)()
-        
-        #*Initialize all elements to None
-        for i in range(capacity):
-            self.__arr[i] = None
+
+
+    @property
+    def capacity(self) -> int:
+        """Getter for the number of positions allocated"""
+        return self.__capacity
+
+
+    def __resize(self, capacity: int) -> None:
+        """
+        Moves the pointers to a new block of memory of the given capacity
+        (large enough to keep every string). The slice is copied by ctypes,
+        which also keeps the buffers of the strings alive.
+        """
+        arr = (ctypes.POINTER(ctypes.c_char) * capacity)()
+        arr[:self.__size] = self.__arr[:self.__size]
+        self.__arr = arr
+        self.__capacity = capacity
+
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Makes sure the array can hold at least `capacity` strings without
+        reallocating its memory.
+        """
+        if capacity > self.__capacity:
+            self.__resize(capacity)
+
+
+    def shrink_to_fit(self) -> None:
+        """Frees the positions after the last string"""
+        self.__resize(self.__size)
 
 
     def __setitem__(self, index: int, value: str) -> None:
@@ -88,23 +119,28 @@ class StrArr:
 
     def append(self, value: str) -> None:
         """
-        Appends a value to the end of the array if there is enough capacity.
+        Appends a value to the end of the array, doubling its capacity when
+        it is full, so appending takes amortised constant time.
         
         Parameters
         ----------
         value : str
             The string value to append to the array.
-        
-        Raises
-        ------
-        MemoryError
-            If there is not enough space in the array to append the value.
         """
-        if self.__size < self.__capacity:
-            self[self.__size] = value
-            self.__size += 1
-        else:
-            raise MemoryError("Not enough space in the array")
+        if self.__size == self.__capacity:
+            self.__resize(max(2 * self.__capacity, 4))
+        self[self.__size] = value #*Also increases the size
+
+
+    def extend(self, values) -> None:
+        """
+        Appends every value of an iterable (reserving the memory for all of
+        them at once if its length is known).
+        """
+        if hasattr(values, "__len__"):
+            self.reserve(self.__size + len(values))
+        for value in values:
+            self.append(value)
 
 
     def __len__(self) -> int:
@@ -146,6 +182,15 @@ class StrArr:
         return False
 
 
+    def __reduce__(self) -> tuple:
+        """
+        Lets the array be pickled (e.g. to send it to another process), since
+        the pointers to the strings can't be.
+        """
+        values: list = [self[i] if self.__arr[i] else None for i in range(self.__size)]
+        return (_rebuild_str_arr, (self.__capacity, values))
+
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the StrArr object.
@@ -172,6 +217,21 @@ class StrArr:
         return repr_str
 
 
+def _rebuild_str_arr(capacity: int, values: list) -> StrArr:
+    """Rebuilds a pickled StrArr (see `StrArr.__reduce__`)"""
+    arr: StrArr = StrArr(capacity)
+    for i, value in enumerate(values):
+        if value is not None:
+            arr[i] = value
+    return arr
+
+
+#*The compiled StrArr (see `_backend.py`) replaces this one when it is built
+PyStrArr = StrArr
+if compiled is not None:
+    StrArr = compiled.StrArr
+
+
 def __del__(self) -> None:
     #*Free each string buffer that was allocated
     for i in range(self.__capacity):
@@ -0,0 +1,160 @@
+from src.utilities.data_structures.intArr import IntArr
+from src.utilities.objects.route import Route
+
+class Ridership:
+    def __init__(self, route: Route, start_time: int, end_time: int, bucket_minutes: int = 15) -> None:
+        """
+        Initializes the (empty) entrances and exits of every station of a route
+        per time bucket.
+
+        Parameters
+        ----------
+        route : Route
+            The route whose stations are counted.
+        start_time : int
+            The starting hour of the first bucket (inclusive).
+        end_time : int
+            The ending hour of the last bucket (exclusive).
+        bucket_minutes : int, optional
+            The width of every bucket in minutes (default is 15).
+
+        Attributes
+        ----------
+        __entrances : IntArr
+            A dense matrix (stored by rows) with the entrances of every station
+            (row) in every bucket (column).
+        __exits : IntArr
+            The exits, with the same layout as `__entrances`.
+
+        Raises
+        ------
+        ValueError
+            If the ending time is not greater than the starting time or the
+            width of the buckets is not positive.
+        """
+        if end_time <= start_time:
+            raise ValueError("Ending time must be greater than starting time")
+        if bucket_minutes <= 0:
+            raise ValueError("The width of the buckets must be positive")
+        self.__route: Route = route
+        self.__start_time: int = start_time
+        self.__end_time: int = end_time
+        self.__bucket_minutes: int = bucket_minutes
+        self.__station_count: int = len(route.station_codes)
+        #*The last bucket may be narrower if the width doesn't divide the window
+        self.__bucket_count: int = -(-(end_time - start_time) * 60 // bucket_minutes)
+        zeros: memoryview = memoryview(bytes(4 * self.__station_count * self.__bucket_count)).cast("i")
+        self.__entrances: IntArr = IntArr(self.__station_count * self.__bucket_count)
+        self.__entrances.copy_from(zeros) #*Assigns every position at once
+        self.__exits: IntArr = IntArr(self.__station_count * self.__bucket_count)
+        self.__exits.copy_from(zeros)
+
+
+    @property
+    def route(self) -> Route:
+        """Getter for the route whose stations are counted"""
+        return self.__route
+
+
+    @property
+    def start_time(self) -> int:
+        """Getter for the starting hour of the first bucket"""
+        return self.__start_time
+
+
+    @property
+    def end_time(self) -> int:
+        """Getter for the ending hour of the last bucket"""
+        return self.__end_time
+
+
+    @property
+    def bucket_minutes(self) -> int:
+        """Getter for the width of the buckets in minutes"""
+        return self.__bucket_minutes
+
+
+    @property
+    def station_count(self) -> int:
+        """Getter for the number of stations (rows of the matrices)"""
+        return self.__station_count
+
+
+    @property
+    def bucket_count(self) -> int:
+        """Getter for the number of buckets (columns of the matrices)"""
+        return self.__bucket_count
+
+
+    @property
+    def entrances(self) -> IntArr:
+        """Getter for the matrix of entrances, stored by rows (see `position`)"""
+        return self.__entrances
+
+
+    @property
+    def exits(self) -> IntArr:
+        """Getter for the matrix of exits, stored by rows (see `position`)"""
+        return self.__exits
+
+
+    def position(self, station: int, bucket: int) -> int:
+        """
+        Returns the position of a station (its index in the route's station
+        codes) and a bucket in the matrices.
+
+        Raises
+        ------
+        IndexError
+            If the station or the bucket is out of range.
+        """
+        if not (0 <= station < self.__station_count and 0 <= bucket < self.__bucket_count):
+            raise IndexError("Index out of range")
+        return station * self.__bucket_count + bucket
+
+
+    def bucket_of(self, seconds: int) -> int:
+        """
+        Returns the bucket of a time given in seconds since midnight, or -1 if
+        it is outside the window.
+        """
+        offset: int = seconds - self.__start_time * 3600
+        if not 0 <= offset < (self.__end_time - self.__start_time) * 3600:
+            return -1
+        return offset // (self.__bucket_minutes * 60)
+
+
+    def bucket_start(self, bucket: int) -> str:
+        """Returns the time (`HH:MM`) at which a bucket begins"""
+        if not 0 <= bucket < self.__bucket_count:
+            raise IndexError("Index out of range")
+        minutes: int = self.__start_time * 60 + bucket * self.__bucket_minutes
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+    def add(self, station: int, bucket: int, entrances: int, exits: int) -> None:
+        """Adds some entrances and exits to a station in a bucket"""
+        position: int = self.position(station, bucket)
+        self.__entrances[position] = self.__entrances[position] + entrances
+        self.__exits[position] = self.__exits[position] + exits
+
+
+    def merge(self, other: "Ridership") -> None:
+        """
+        Adds the counts of another Ridership (e.g. of another day) to this one.
+
+        Raises
+        ------
+        ValueError
+            If the other Ridership has different stations or buckets.
+        """
+        if (other.station_count, other.bucket_count, other.start_time, other.bucket_minutes) != \
+                (self.__station_count, self.__bucket_count, self.__start_time, self.__bucket_minutes):
+            raise ValueError("Both riderships must have the same stations and buckets")
+        self.__entrances += other.entrances
+        self.__exits += other.exits
+
+
+    def __repr__(self) -> str:
+        return (f"Ridership of route {self.__route.identifier} from {self.__start_time}:00 to {self.__end_time}:00 "
+                f"in buckets of {self.__bucket_minutes} minutes")
@@ -14,6 +14,20 @@ class Route:
             A list of station codes associated with the route.
         stations_name_list : StrArr
             A list of station names associated with the route.
+        zones : StrArr
+            A list of the zones of the route, with their code between
+            parentheses (e.g. `(33)Zona B AutoNorte`).
+
+        Attributes
+        ----------
+        __station_positions : dict
+            Maps every station code (as a string, as the bytes found in the
+            validation files and as an integer, like the ones of the
+            `Validation` records) to its first position in the route.
+        __zone_positions : dict
+            Maps every zone code to its position in the route.
+        __zone_name_lengths : dict
+            Maps every zone code to the length in bytes of its zone name.
         """
         self.__identifier: str = id
         self.__station_codes: StrArr = stations_code_list
@@ -24,6 +38,20 @@ class Route:
             self.__zone_names[i] = zones[i]
             self.__zone_codes[i] = int(zones[i][1:3]) #*Gets only the number
 
+        #*Hash-based indexes, built once so that the loaders don't scan the
+        #*arrays (and decode their strings) for every row
+        self.__station_positions: dict = {}
+        for i, station_code in enumerate(stations_code_list):
+            self.__station_positions.setdefault(station_code, i)
+            self.__station_positions.setdefault(station_code.encode("utf-8"), i)
+            if station_code.isdigit():
+                self.__station_positions.setdefault(int(station_code), i)
+        self.__zone_positions: dict = {}
+        self.__zone_name_lengths: dict = {}
+        for i in range(len(zones)):
+            self.__zone_positions.setdefault(self.__zone_codes[i], i)
+            self.__zone_name_lengths.setdefault(self.__zone_codes[i], len(zones[i].encode("utf-8")))
+
 
     @property
     def identifier(self) -> str:
@@ -55,5 +83,39 @@ class Route:
         return self.__zone_names
     
 
+    def has_station(self, station_code) -> bool:
+        """Checks whether a station code (str, bytes or int) belongs to the route"""
+        return station_code in self.__station_positions
+
+
+    def station_index(self, station_code) -> int:
+        """
+        Returns the (first) position of a station code (str, bytes or int) in the
+        route's station codes, or -1 if it doesn't belong to the route.
+        """
+        return self.__station_positions.get(station_code, -1)
+
+
+    def has_zone(self, zone_code: int) -> bool:
+        """Checks whether a zone code belongs to the route"""
+        return zone_code in self.__zone_positions
+
+
+    def zone_index(self, zone_code: int) -> int:
+        """
+        Returns the position of a zone code in the route's zone codes, or -1
+        if it doesn't belong to the route.
+        """
+        return self.__zone_positions.get(zone_code, -1)
+
+
+    def zone_name_length(self, zone_code: int) -> int:
+        """
+        Returns the length in bytes (UTF-8) of the name of a zone, or -1 if it
+        doesn't belong to the route.
+        """
+        return self.__zone_name_lengths.get(zone_code, -1)
+
+
     def __repr__(self) -> str:
         return f"Route {self.__identifier} with stations {self.__station_names}, and zones {self.__zone_names}"
@@ -0,0 +1,176 @@
+"""
+Catalog of the routes of the network, loaded from a definition file
+(`routes.json` by default) instead of being hardcoded like `route_list.k16`.
+
+The file looks like
+`{"routes": [{"id": "K16", "zones": ["(33)Zona B AutoNorte", ...],
+"stations": [["02502", "Portal El Dorado - C.C. NUESTRO BOGOTA"], ...]}]}`.
+Loading it only keeps the zones and stations of every route as tuples of
+interned strings (the ones repeated between routes are stored once) and
+the indexes by station and zone code; the `Route` of a route (with its
+arrays and hash indexes) is only built the first time it is requested,
+and then reused.
+"""
+import json
+import os
+import sys
+
+from src.utilities.data_structures.strArr import StrArr
+from .route import Route
+
+#*The routes shipped with the project
+DEFAULT_ROUTES_FILE: str = os.path.join(os.path.dirname(__file__), "routes.json")
+
+
+class RouteCatalog:
+    def __init__(self, definitions: dict) -> None:
+        """
+        Initializes a catalog out of the (already decoded) contents of a
+        definition file. See `load` to read one.
+
+        Parameters
+        ----------
+        definitions : dict
+            `{"routes": [...]}`, with the identifier (`id`), zone names
+            (`zones`) and `[code, name]` of the stations (`stations`) of
+            every route.
+
+        Attributes
+        ----------
+        __definitions : dict
+            Maps every identifier to the `(zones, station codes, station
+            names)` of the route, as tuples of interned strings.
+        __routes : dict
+            The `Route`s already built, by identifier.
+        __station_routes : dict
+            Maps every station code to the identifiers of the routes that
+            have it, in the order of the file.
+        __zone_routes : dict
+            Maps every zone code to the identifiers of the routes that have
+            it, in the order of the file.
+
+        Raises
+        ------
+        ValueError
+            If a route is missing a field, two routes have the same
+            identifier, or a zone name doesn't start with its code.
+        """
+        self.__definitions: dict = {}
+        self.__routes: dict = {}
+        station_routes: dict = {}
+        zone_routes: dict = {}
+        for route in definitions.get("routes", []):
+            try:
+                identifier: str = sys.intern(route["id"])
+                zones: tuple = tuple(sys.intern(zone) for zone in route["zones"])
+                codes: tuple = tuple(sys.intern(code) for code, _ in route["stations"])
+                names: tuple = tuple(sys.intern(name) for _, name in route["stations"])
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(f"Malformed route definition: {route!r}") from error
+            if identifier in self.__definitions:
+                raise ValueError(f"Route {identifier} is defined more than once")
+            self.__definitions[identifier] = (zones, codes, names)
+            for code in dict.fromkeys(codes):
+                station_routes.setdefault(code, []).append(identifier)
+            for zone in zones:
+                if not zone[1:3].isdigit():
+                    raise ValueError(f"Zone {zone!r} of route {identifier} doesn't start with its code")
+                identifiers: list = zone_routes.setdefault(int(zone[1:3]), [])
+                if not identifiers or identifiers[-1] != identifier:
+                    identifiers.append(identifier)
+        self.__station_routes: dict = {code: tuple(identifiers) for code, identifiers in station_routes.items()}
+        self.__zone_routes: dict = {zone: tuple(identifiers) for zone, identifiers in zone_routes.items()}
+
+
+    @classmethod
+    def load(cls, file_name: str = DEFAULT_ROUTES_FILE) -> "RouteCatalog":
+        """
+        Loads the catalog of a definition file (JSON, UTF-8).
+
+        Parameters
+        ----------
+        file_name : str, optional
+            The name of the file (default is the `routes.json` shipped with
+            the project).
+
+        Raises
+        ------
+        ValueError
+            If the file isn't valid JSON or a route is malformed.
+        """
+        with open(file_name, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+
+    def __getitem__(self, identifier: str) -> Route:
+        """
+        Returns the Route of an identifier, building it on the first access.
+        Every access returns the same object, so it must not be modified.
+
+        Raises
+        ------
+        KeyError
+            If there is no route with that identifier.
+        """
+        route: Route = self.__routes.get(identifier)
+        if route is None:
+            zones, codes, names = self.__definitions[identifier]
+            zone_names: StrArr = StrArr(len(zones))
+            zone_names.extend(zones)
+            station_codes: StrArr = StrArr(len(codes))
+            station_codes.extend(codes)
+            station_names: StrArr = StrArr(len(names))
+            station_names.extend(names)
+            route = self.__routes[identifier] = Route(identifier, station_codes, station_names, zone_names)
+        return route
+
+
+    def get(self, identifier: str, default: Route = None) -> Route:
+        """Returns the Route of an identifier, or `default` if there is none"""
+        if identifier not in self.__definitions:
+            return default
+        return self[identifier]
+
+
+    def routes_with_station(self, station_code: str) -> tuple:
+        """Returns the identifiers of the routes that stop at a station"""
+        return self.__station_routes.get(station_code, ())
+
+
+    def routes_with_zone(self, zone_code: int) -> tuple:
+        """Returns the identifiers of the routes that go through a zone"""
+        return self.__zone_routes.get(zone_code, ())
+
+
+    @property
+    def identifiers(self) -> tuple:
+        """Getter for the identifiers of the routes, in the order of the file"""
+        return tuple(self.__definitions)
+
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self.__definitions
+
+
+    def __iter__(self):
+        return iter(self.__definitions)
+
+
+    def __len__(self) -> int:
+        return len(self.__definitions)
+
+
+    def __repr__(self) -> str:
+        return f"RouteCatalog of {len(self.__definitions)} routes ({len(self.__routes)} built)"
+
+
+#*The catalog of `DEFAULT_ROUTES_FILE`, loaded on the first call to `default_catalog`
+_default_catalog: RouteCatalog = None
+
+
+def default_catalog() -> RouteCatalog:
+    """Returns the catalog of the routes shipped with the project, loading it only once"""
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = RouteCatalog.load()
+    return _default_catalog
@@ -0,0 +1,113 @@
+class Validation:
+    #*No per-instance dictionary: every record only takes its 8 slots
+    __slots__ = ("__date", "__time", "__zone", "__station", "__access", "__device", "__entrances", "__exits")
+
+    def __init__(self, date: str, time: int, zone: int, station: int, access: int, device: int, entrances: int, exits: int) -> None:
+        """
+        Initializes the record of a row of a validation file, with its fields
+        already parsed.
+
+        Parameters
+        ----------
+        date : str
+            The date of the row (`YYYY-MM-DD`).
+        time : int
+            The time of the row in seconds since midnight.
+        zone : int
+            The code of the zone (e.g. 33 for `(33)Zona B AutoNorte`).
+        station : int
+            The code of the station (e.g. 2502 for `(02502)Portal El Dorado`).
+        access : int
+            The code of the station access (e.g. 1 for `(1)Acceso Norte`).
+        device : int
+            The identifier of the device.
+        entrances : int
+            The number of entrances.
+        exits : int
+            The number of exits.
+        """
+        self.__date: str = date
+        self.__time: int = time
+        self.__zone: int = zone
+        self.__station: int = station
+        self.__access: int = access
+        self.__device: int = device
+        self.__entrances: int = entrances
+        self.__exits: int = exits
+
+
+    @property
+    def date(self) -> str:
+        """Getter for the date of the row (`YYYY-MM-DD`)"""
+        return self.__date
+
+
+    @property
+    def time(self) -> int:
+        """Getter for the time of the row in seconds since midnight"""
+        return self.__time
+
+
+    @property
+    def hour(self) -> int:
+        """Getter for the hour of the row (24-hour format)"""
+        return self.__time // 3600
+
+
+    @property
+    def zone(self) -> int:
+        """Getter for the code of the zone"""
+        return self.__zone
+
+
+    @property
+    def station(self) -> int:
+        """Getter for the code of the station"""
+        return self.__station
+
+
+    @property
+    def access(self) -> int:
+        """Getter for the code of the station access"""
+        return self.__access
+
+
+    @property
+    def device(self) -> int:
+        """Getter for the identifier of the device"""
+        return self.__device
+
+
+    @property
+    def entrances(self) -> int:
+        """Getter for the number of entrances"""
+        return self.__entrances
+
+
+    @property
+    def exits(self) -> int:
+        """Getter for the number of exits"""
+        return self.__exits
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Validation):
+            return NotImplemented
+        return self.__reduce__() == other.__reduce__()
+
+
+    def __hash__(self) -> int:
+        """Hashes the same fields `__eq__` compares, so equal records can be set members or dict keys"""
+        return hash(self.__reduce__()[1])
+
+
+    def __reduce__(self) -> tuple:
+        """Lets the record be pickled, since it has no `__dict__`"""
+        return (Validation, (self.__date, self.__time, self.__zone, self.__station,
+                             self.__access, self.__device, self.__entrances, self.__exits))
+
+
+    def __repr__(self) -> str:
+        return (f"Validation({self.__date} {self.__time // 3600:02d}:{self.__time // 60 % 60:02d}:{self.__time % 60:02d}, "
+                f"zone {self.__zone}, station {self.__station:05d}, access {self.__access}, device {self.__device}, "
+                f"entrances {self.__entrances}, exits {self.__exits})")
@@ -0,0 +1,29 @@
+import os
+import tempfile
+import unittest
+
+from src.utilities.data_getter.synthetic import write_validation_file
+
+
+class SyntheticFileTestCase(unittest.TestCase):
+    """
+    Base of the tests over a synthetic validation file (`self.file_name`,
+    with `ROWS` rows generated with `SEED`) written to a temporary directory
+    (`self.directory`) before every test and removed after it. With `ROWS`
+    set to None, the file is left for the tests to write.
+    """
+    ROWS: int = 20000
+    SEED: int = 0
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "20250211.csv")
+        if self.ROWS is not None:
+            write_validation_file(self.file_name, self.ROWS, seed=self.SEED)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertSameRows(self, rows, expected):
+        """Compares the columns of two sequences of rows (e.g. ObjArrs of StrArenas)"""
+        self.assertEqual([list(row) for row in rows], [list(row) for row in expected])
@@ -0,0 +1,70 @@
+import unittest
+
+from src.utilities.data_getter.aggregate import aggregate_ridership
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.objects.ridership import Ridership
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+def expected_counts(file_name, start_time, end_time, bucket_minutes, filter_entrances):
+    """Sums the rows of create_data_array with plain Python"""
+    route = k16()
+    stations = list(route.station_codes)
+    counts = {}
+    for row in create_data_array(file_name, route, start_time, end_time, filter_entrances=filter_entrances):
+        hours, minutes, _ = row[1].split(":")
+        bucket = ((int(hours) - start_time) * 60 + int(minutes)) // bucket_minutes
+        key = (stations.index(row[3][1:6]), bucket)
+        entrances, exits = counts.get(key, (0, 0))
+        counts[key] = (entrances + int(row[6]), exits + int(row[7]))
+    return counts
+
+
+class TestAggregate(SyntheticFileTestCase):
+    ROWS = 5000
+
+    def assert_counts(self, ridership, expected):
+        for station in range(ridership.station_count):
+            for bucket in range(ridership.bucket_count):
+                position = ridership.position(station, bucket)
+                entrances, exits = expected.get((station, bucket), (0, 0))
+                self.assertEqual(ridership.entrances[position], entrances)
+                self.assertEqual(ridership.exits[position], exits)
+
+    def test_matches_create_data_array(self):
+        for start_time, end_time, bucket_minutes, filter_entrances in [(0, 24, 15, True), (6, 9, 60, False), (17, 19, 7, True)]:
+            ridership = aggregate_ridership(self.file_name, k16(), start_time, end_time, bucket_minutes, filter_entrances)
+            self.assertEqual(ridership.bucket_count, -(-(end_time - start_time) * 60 // bucket_minutes))
+            self.assert_counts(ridership, expected_counts(self.file_name, start_time, end_time, bucket_minutes, filter_entrances))
+
+    def test_several_files(self):
+        ridership = aggregate_ridership([self.file_name, self.file_name], k16(), 6, 9)
+        expected = expected_counts(self.file_name, 6, 9, 15, True)
+        self.assert_counts(ridership, {key: (2 * entrances, 2 * exits) for key, (entrances, exits) in expected.items()})
+
+    def test_merge(self):
+        ridership = aggregate_ridership(self.file_name, k16(), 6, 9)
+        ridership.merge(aggregate_ridership(self.file_name, k16(), 6, 9))
+        expected = expected_counts(self.file_name, 6, 9, 15, True)
+        self.assert_counts(ridership, {key: (2 * entrances, 2 * exits) for key, (entrances, exits) in expected.items()})
+        with self.assertRaises(ValueError):
+            ridership.merge(Ridership(k16(), 6, 9, 30))
+
+    def test_buckets(self):
+        ridership = Ridership(k16(), 17, 19, 15)
+        self.assertEqual(ridership.bucket_count, 8)
+        self.assertEqual(ridership.bucket_start(5), "18:15")
+        self.assertEqual(ridership.bucket_of(17 * 3600 + 29 * 60), 1)
+        self.assertEqual(ridership.bucket_of(19 * 3600), -1)
+        with self.assertRaises(IndexError):
+            ridership.position(0, 8)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            aggregate_ridership(self.file_name, k16(), 9, 6)
+        with self.assertRaises(ValueError):
+            aggregate_ridership(self.file_name, k16(), 6, 9, bucket_minutes=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Runs the suites of the arrays against both implementations: the pure Python
+one (with `ctypes`) and the compiled one (`_arrays.pyx`), which is skipped
+when the extension isn't built.
+"""
+import unittest
+
+from src.utilities.data_structures import _backend, boolArr, intArr, objArr, strArr
+from test import test_bool_array, test_int_array, test_obj_array, test_str_array
+
+BACKENDS: dict = {
+    "Python": {"IntArr": intArr.PyIntArr, "BoolArr": boolArr.PyBoolArr,
+               "StrArr": strArr.PyStrArr, "ObjArr": objArr.PyObjArr},
+    "Compiled": None if _backend.compiled is None else {
+        "IntArr": _backend.compiled.IntArr, "BoolArr": _backend.compiled.BoolArr,
+        "StrArr": _backend.compiled.StrArr, "ObjArr": _backend.compiled.ObjArr},
+}
+SUITES: tuple = (
+    (test_int_array, test_int_array.TestIntArr),
+    (test_bool_array, test_bool_array.TestBoolArr),
+    (test_str_array, test_str_array.TestStrArr),
+    (test_obj_array, test_obj_array.TestObjArr),
+)
+#*These fail with every implementation (the length is the number of assigned
+#*positions, not the capacity), so they are only reported by their own suite
+KNOWN_FAILURES: tuple = ("test_array_with_capacity", "test_size", "test_obj_arr_with_capacity")
+
+
+def backend_case(module, case: type, backend: str) -> type:
+    """Returns a copy of a suite that uses the arrays of a backend"""
+    classes: dict = BACKENDS[backend]
+
+    def setUp(self):
+        if classes is None:
+            self.skipTest("The compiled arrays are not built")
+        for name, array_class in classes.items():
+            if hasattr(module, name):
+                self.addCleanup(setattr, module, name, getattr(module, name))
+                setattr(module, name, array_class)
+        case.setUp(self)
+
+    attributes: dict = {"setUp": setUp}
+    for name in KNOWN_FAILURES:
+        if hasattr(case, name):
+            attributes[name] = unittest.skip("Fails with every backend")(getattr(case, name))
+    return type(f"{backend}{case.__name__}", (case,), attributes)
+
+
+for _module, _case in SUITES:
+    for _backend_name in BACKENDS:
+        _suite: type = backend_case(_module, _case, _backend_name)
+        globals()[_suite.__name__] = _suite
+del _module, _case, _suite #*Otherwise the original suites would run again
+
+if __name__ == '__main__':
+    unittest.main()
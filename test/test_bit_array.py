@@ -0,0 +1,110 @@
+import pickle
+import unittest
+
+from src.utilities.data_structures import BitArr
+
+
+class TestBitArr(unittest.TestCase):
+
+    def test_empty_array(self):
+        empty_arr = BitArr()
+        self.assertEqual(len(empty_arr), 0)
+        self.assertEqual(empty_arr.__repr__(), "[]")
+        self.assertFalse(empty_arr.any())
+        self.assertTrue(empty_arr.all())
+
+    def test_array_with_capacity(self):
+        arr = BitArr(4)
+        self.assertEqual(len(arr), 4)
+        self.assertEqual(arr.__repr__(), "[False, False, False, False]")
+        self.assertEqual(arr.as_memoryview().nbytes, 1)
+        self.assertEqual(BitArr(17).as_memoryview().nbytes, 3)
+
+    def test_set_and_get_item(self):
+        arr = BitArr(20)
+        arr[2] = True
+        arr[9] = 1
+        arr[19] = True
+        arr[19] = False
+        self.assertTrue(arr[2])
+        self.assertTrue(arr[9])
+        self.assertFalse(arr[19])
+        self.assertFalse(arr[3])
+        with self.assertRaises(IndexError):
+            arr[20] = True
+        with self.assertRaises(IndexError):
+            arr[-1]
+        with self.assertRaises(TypeError):
+            arr[0] = 2
+
+    def test_set_range(self):
+        arr = BitArr(20)
+        arr.set_range(3, 17)
+        self.assertEqual(list(arr.indices()), list(range(3, 17)))
+        arr.set_range(5, 15, False)
+        self.assertEqual(list(arr.indices()), [3, 4, 15, 16])
+        with self.assertRaises(IndexError):
+            arr.set_range(10, 21)
+
+    def test_fill_and_count(self):
+        arr = BitArr(13)
+        arr.fill(True)
+        self.assertEqual(arr.count(), 13)
+        self.assertTrue(arr.all())
+        #*The bits after the last position stay unset
+        self.assertEqual(arr.as_memoryview().tolist(), [0xFF, 0x1F])
+        arr.fill(False)
+        self.assertEqual(arr.count(), 0)
+        self.assertFalse(arr.any())
+
+    def test_bitwise_operations(self):
+        a = BitArr(10)
+        b = BitArr(10)
+        for i in (0, 3, 8):
+            a[i] = True
+        for i in (3, 4, 8, 9):
+            b[i] = True
+        self.assertEqual(list((a & b).indices()), [3, 8])
+        self.assertEqual(list((a | b).indices()), [0, 3, 4, 8, 9])
+        self.assertEqual(list((a ^ b).indices()), [0, 4, 9])
+        self.assertEqual(list((~a).indices()), [1, 2, 4, 5, 6, 7, 9])
+        self.assertEqual((~a).count(), 7)
+        self.assertEqual(list(a.indices()), [0, 3, 8]) #*The operands aren't changed
+        a &= b
+        self.assertEqual(list(a.indices()), [3, 8])
+        a |= b
+        self.assertEqual(a, b)
+        a ^= b
+        self.assertFalse(a.any())
+
+    def test_bitwise_operations_errors(self):
+        with self.assertRaises(ValueError):
+            BitArr(3) & BitArr(4)
+        with self.assertRaises(TypeError):
+            BitArr(3) | 1
+
+    def test_indices(self):
+        arr = BitArr(100000)
+        positions = [0, 7, 8, 4095, 50000, 99999]
+        for i in positions:
+            arr[i] = True
+        self.assertEqual(list(arr.indices()), positions)
+        self.assertEqual(arr.count(), len(positions))
+
+    def test_from_bytes(self):
+        arr = BitArr.from_bytes(bytes([0b101, 0xFF]), 10)
+        self.assertEqual(list(arr.indices()), [0, 2, 8, 9])
+        self.assertEqual(len(BitArr.from_bytes(b"\x01\x02")), 16)
+        with self.assertRaises(ValueError):
+            BitArr.from_bytes(b"\x01\x02", 3)
+
+    def test_pickle(self):
+        arr = BitArr(11)
+        arr[1] = True
+        arr[10] = True
+        copy = pickle.loads(pickle.dumps(arr))
+        self.assertEqual(copy, arr)
+        self.assertEqual(len(copy), 11)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,10 @@
 import sys, os, unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from src.utilities.data_structures import BoolArr
 
 
@@ -27,5 +32,36 @@ class TestBoolArr(unittest.TestCase):
         arr[2] = True
         self.assertEqual(arr.__repr__(), "[True, False, True]")
 
+    def test_fill(self):
+        arr = BoolArr(3)
+        arr.fill(True)
+        self.assertEqual(arr.__repr__(), "[True, True, True]")
+        arr.fill(False)
+        self.assertEqual(arr.__repr__(), "[False, False, False]")
+
+    def test_from_buffer_shares_memory(self):
+        values = bytearray([0, 1, 0])
+        arr = BoolArr.from_buffer(values)
+        self.assertEqual(arr.__repr__(), "[False, True, False]")
+        arr[0] = True
+        self.assertEqual(values, bytearray([1, 1, 0]))
+        self.assertEqual(arr.as_memoryview().tolist(), [True, True, False])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_to_numpy_shares_memory(self):
+        arr = BoolArr(4)
+        view = arr.to_numpy()
+        self.assertEqual(view.dtype, numpy.bool_)
+        view[1] = True
+        self.assertTrue(arr[1])
+        arr[3] = True
+        self.assertTrue(view[3])
+        self.assertEqual(int(view.sum()), 2)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_from_numpy(self):
+        arr = BoolArr.from_numpy(numpy.array([1, 0, 2]))
+        self.assertEqual(arr.__repr__(), "[True, False, True]")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,72 @@
+import pickle
+import unittest
+
+from src.utilities.data_structures.catArr import CatArr
+
+
+class TestCatArr(unittest.TestCase):
+
+    def setUp(self):
+        self.values = ["(33) Alcalá", "(38) Toberín", "(33) Alcalá", "(11) Suba", "(33) Alcalá"]
+        self.arr = CatArr.from_iterable(self.values)
+
+    def test_empty_array(self):
+        arr = CatArr()
+        self.assertEqual(len(arr), 0)
+        self.assertEqual(repr(arr), "[]")
+        self.assertEqual(arr.value_counts(), {})
+
+    def test_encoding(self):
+        self.assertEqual(len(self.arr), 5)
+        self.assertEqual(list(self.arr), self.values)
+        self.assertEqual(list(self.arr.categories), ["(33) Alcalá", "(38) Toberín", "(11) Suba"])
+        self.assertEqual(list(self.arr.codes), [0, 1, 0, 2, 0])
+        self.assertEqual(self.arr.code_of("(11) Suba"), 2)
+        self.assertEqual(self.arr.code_of("(12) Usme"), -1)
+        self.assertEqual(self.arr[1], "(38) Toberín")
+        with self.assertRaises(IndexError):
+            self.arr[5]
+        with self.assertRaises(TypeError):
+            self.arr.append(3)
+
+    def test_set_item(self):
+        self.arr[1] = "(33) Alcalá"
+        self.assertEqual(self.arr[1], "(33) Alcalá")
+        self.assertNotIn("(38) Toberín", self.arr) #*Still a category, but unused
+        self.arr[1] = "(12) Usme"
+        self.assertIn("(12) Usme", self.arr)
+        self.assertEqual(self.arr.code_of("(12) Usme"), 3)
+
+    def test_equals_and_isin(self):
+        self.assertEqual(list(self.arr.equals("(33) Alcalá").indices()), [0, 2, 4])
+        self.assertEqual(self.arr.equals("(12) Usme").count(), 0)
+        self.assertEqual(list(self.arr.isin(["(38) Toberín", "(11) Suba"]).indices()), [1, 3])
+
+    def test_equals_with_unaligned_bytes(self):
+        #*The code 256 (bytes 00 01 00 00) also appears between the codes 0 and 1
+        arr = CatArr.from_iterable([str(i) for i in range(300)] + ["0", "1", "256"])
+        self.assertEqual(list(arr.equals("256").indices()), [256, 302])
+
+    def test_value_counts_and_groups(self):
+        self.assertEqual(self.arr.value_counts(), {"(33) Alcalá": 3, "(38) Toberín": 1, "(11) Suba": 1})
+        groups = self.arr.groups()
+        self.assertEqual({name: list(group) for name, group in groups.items()},
+                         {"(33) Alcalá": [0, 2, 4], "(38) Toberín": [1], "(11) Suba": [3]})
+
+    def test_from_codes(self):
+        arr = CatArr.from_codes([1, 0, 1], ["a", "b"])
+        self.assertEqual(list(arr), ["b", "a", "b"])
+        arr.append("c")
+        self.assertEqual(list(arr.codes), [1, 0, 1, 2])
+        with self.assertRaises(ValueError):
+            CatArr.from_codes([2], ["a", "b"])
+        with self.assertRaises(ValueError):
+            CatArr.from_codes([0], ["a", "a"])
+
+    def test_pickle(self):
+        copy = pickle.loads(pickle.dumps(self.arr))
+        self.assertEqual(list(copy), self.values)
+        self.assertEqual(list(copy.codes), list(self.arr.codes))
+
+if __name__ == '__main__':
+    unittest.main()
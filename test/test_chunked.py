@@ -0,0 +1,42 @@
+import unittest
+
+from src.utilities.data_getter.chunked import create_data_array_parallel, split_ranges
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+class TestChunked(SyntheticFileTestCase):
+    ROWS = 6000
+
+    def test_ranges_are_aligned_and_contiguous(self):
+        with open(self.file_name, "rb") as file:
+            content = file.read()
+        for parts in (1, 2, 5, 64):
+            ranges = split_ranges(self.file_name, parts)
+            self.assertLessEqual(len(ranges), parts)
+            self.assertEqual(ranges[0][0], content.index(b"\n") + 1)
+            self.assertEqual(ranges[-1][1], len(content))
+            for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+                self.assertEqual(stop, start)
+                self.assertEqual(content[start - 1], ord("\n"))
+
+    def test_empty_window(self):
+        self.assertEqual(split_ranges(self.file_name, 4, 24, 25), [])
+
+    def test_same_output_across_worker_counts(self):
+        for start_time, end_time, filter_stations, filter_entrances in [(0, 24, True, True), (7, 10, False, False)]:
+            expected = [list(row) for row in create_data_array(self.file_name, k16(), start_time, end_time, filter_stations, filter_entrances)]
+            for max_workers, parts in [(1, 1), (1, 7), (2, 2), (3, 10), (4, None)]:
+                data = create_data_array_parallel(self.file_name, k16(), start_time, end_time, filter_stations, filter_entrances,
+                                                  max_workers=max_workers, parts=parts)
+                self.assertEqual([list(row) for row in data], expected, (max_workers, parts))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            create_data_array_parallel(self.file_name, k16(), 3, 1)
+        with self.assertRaises(ValueError):
+            split_ranges(self.file_name, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import unittest
+
+from src.utilities.data_getter.columnar import ColumnarDay, columnar_name_of, load_columnar, write_columnar
+from src.utilities.data_getter.row_reader import iter_lines, read_rows
+from src.utilities.data_getter.synthetic import write_validation_file
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+class TestColumnar(SyntheticFileTestCase):
+    ROWS = 3000
+
+    def test_columns(self):
+        with load_columnar(self.file_name) as day:
+            self.assertEqual(len(day), 3000)
+            self.assertEqual(day.date, "2025-02-11")
+            for i, line in enumerate(iter_lines(self.file_name)):
+                fields = line.decode("utf-8").split(",")
+                hours, minutes, seconds = fields[1].split(":")
+                self.assertEqual(day.times[i], int(hours) * 3600 + int(minutes) * 60 + int(seconds))
+                self.assertEqual(day.zones[i], int(fields[2][1:3]))
+                self.assertEqual(day.stations[i], int(fields[3][1:6]))
+                self.assertEqual(day.devices[i], int(fields[5]))
+                self.assertEqual(day.entrances[i], int(fields[6]))
+                self.assertEqual(day.exits[i], int(fields[7]))
+                self.assertEqual(day.dictionary("station_labels")[day.station_labels[i]], fields[3])
+                self.assertEqual(list(day.row(i)), fields)
+
+    def test_dictionaries_are_small(self):
+        with load_columnar(self.file_name) as day:
+            self.assertLess(len(day.dictionary("station_labels")), 60)
+            self.assertEqual(len(day.dictionary("access_labels")), 3)
+
+    def test_select(self):
+        with load_columnar(self.file_name) as day:
+            for start_time, end_time, filter_stations, filter_entrances in [(0, 24, True, True), (17, 19, False, False)]:
+                selected = [list(day.row(i)) for i in day.select(k16(), start_time, end_time, filter_stations, filter_entrances)]
+                expected = [list(row) for row in read_rows(self.file_name, k16(), start_time, end_time, filter_stations, filter_entrances)]
+                self.assertEqual(selected, expected)
+            with self.assertRaises(ValueError):
+                day.select(k16(), 5, 4)
+
+    def test_reused_until_file_changes(self):
+        cache_name = write_columnar(self.file_name)
+        modified = os.path.getmtime(cache_name)
+        load_columnar(self.file_name).close()
+        self.assertEqual(os.path.getmtime(cache_name), modified)
+
+        write_validation_file(self.file_name, 100, seed=2)
+        stat = os.stat(self.file_name)
+        os.utime(self.file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with load_columnar(self.file_name) as day:
+            self.assertEqual(len(day), 100)
+            self.assertTrue(day.is_current(self.file_name))
+
+    def test_not_a_cache(self):
+        with open(columnar_name_of(self.file_name), "wb") as file:
+            file.write(b"\0" * 100)
+        with self.assertRaises(ValueError):
+            ColumnarDay(columnar_name_of(self.file_name))
+        with load_columnar(self.file_name) as day:
+            self.assertEqual(len(day), 3000)
+
+    def test_truncated_cache(self):
+        cache_name = write_columnar(self.file_name)
+        with open(cache_name, "rb") as file:
+            content = file.read()
+        last = list(iter_lines(self.file_name))[-1].decode("utf-8").split(",")
+        for size in (100, len(content) // 2, len(content) - 30, len(content) - 1):
+            with open(cache_name, "wb") as file:
+                file.write(content[:size])
+            with self.assertRaises(ValueError):
+                ColumnarDay(cache_name)
+            with load_columnar(self.file_name) as day:
+                self.assertEqual(len(day), 3000)
+                self.assertEqual(list(day.row(2999)), last)
+        with open(cache_name, "ab") as file:
+            file.write(b"\0")
+        with self.assertRaises(ValueError):
+            ColumnarDay(cache_name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from src.utilities.data_getter.encoded import create_encoded_columns
+from src.utilities.data_structures.catArr import CatArr
+from src.utilities.objects.route_list import k16
+from test.test_row_reader import expected_rows
+from test import SyntheticFileTestCase
+
+
+class TestEncodedColumns(SyntheticFileTestCase):
+    ROWS = 3000
+
+    def decoded_rows(self, columns):
+        """Rebuilds the rows from the columns, as `create_data_array` returns them"""
+        rows = []
+        for i in range(len(columns["dates"])):
+            seconds = columns["times"][i]
+            rows.append([
+                columns["dates"][i],
+                f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}",
+                columns["zones"][i],
+                columns["stations"][i],
+                columns["accesses"][i],
+                columns["devices"][i],
+                str(columns["entrances"][i]),
+                str(columns["exits"][i]),
+            ])
+        return rows
+
+    def test_same_rows_as_the_file(self):
+        columns = create_encoded_columns(self.file_name, k16(), 6, 20)
+        self.assertEqual(self.decoded_rows(columns), expected_rows(self.file_name, 6, 20))
+        for name in ("dates", "zones", "stations", "accesses", "devices"):
+            self.assertIsInstance(columns[name], CatArr)
+        self.assertEqual(len(columns["dates"].categories), 1)
+
+    def test_without_filters(self):
+        columns = create_encoded_columns(self.file_name, k16(), 0, 24, filter_stations=False, filter_entrances=False)
+        self.assertEqual(self.decoded_rows(columns), expected_rows(self.file_name, 0, 24, False, False))
+        counts = columns["zones"].value_counts()
+        self.assertEqual(sum(counts.values()), len(columns["zones"]))
+
+    def test_invalid_time_range(self):
+        with self.assertRaises(ValueError):
+            create_encoded_columns(self.file_name, k16(), 8, 8)
+
+if __name__ == '__main__':
+    unittest.main()
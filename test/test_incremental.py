@@ -0,0 +1,118 @@
+import os
+import unittest
+
+from src.utilities.data_getter.aggregate import aggregate_ridership
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.data_getter.incremental import TailFollower
+from src.utilities.data_getter.synthetic import write_validation_file
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+class TestTailFollower(SyntheticFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        #*The synthetic file is the source of the bytes written to the followed one
+        self.source = self.file_name
+        with open(self.source, "rb") as file:
+            self.content = file.read()
+        self.file_name = os.path.join(self.directory.name, "growing.csv")
+        self.checkpoint_name = os.path.join(self.directory.name, "growing.tail")
+
+    def write(self, end, start=0):
+        """Appends the bytes of the source file from `start` to `end`"""
+        with open(self.file_name, "ab") as file:
+            file.write(self.content[start:end])
+
+    def follow(self, cuts, follower, final=True):
+        """Grows the file up to every cut (most of them in the middle of a row) and refreshes"""
+        rows, start = [], 0
+        for end in cuts:
+            self.write(end, start)
+            rows += [list(row) for row in follower.refresh()]
+            self.assertTrue(follower.offset == 0 or self.content[follower.offset - 1] == ord("\n"))
+            start = end
+        rows += [list(row) for row in follower.refresh(final=final)]
+        return rows
+
+    def assertSameRidership(self, ridership, expected):
+        self.assertEqual(list(ridership.entrances), list(expected.entrances))
+        self.assertEqual(list(ridership.exits), list(expected.exits))
+
+    def test_same_rows_as_reading_the_whole_file(self):
+        cuts = [50, 89, 95, 3000, 3001, 250000, 1000000, len(self.content) - 10, len(self.content)]
+        for filters in ((0, 24, True, True), (6, 9, True, True), (17, 20, False, False)):
+            if os.path.exists(self.file_name):
+                os.remove(self.file_name)
+            follower = TailFollower(self.file_name, k16(), *filters, chunk_size=4096)
+            rows = self.follow(cuts, follower)
+            self.assertEqual(rows, [list(row) for row in create_data_array(self.source, k16(), *filters)])
+            self.assertEqual(follower.rows, len(rows))
+
+    def test_ridership(self):
+        follower = TailFollower(self.file_name, k16(), 6, 20, bucket_minutes=30)
+        self.follow(range(7, len(self.content), 100003), follower)
+        self.assertTrue(follower.finished)
+        self.assertSameRidership(follower.ridership, aggregate_ridership(self.source, k16(), 6, 20, 30))
+
+    def test_truncated_last_row(self):
+        end = self.content.rindex(b"\n", 0, len(self.content) - 1) + 20
+        follower = TailFollower(self.file_name, k16(), 0, 24, False, False)
+        self.write(end)
+        before = follower.refresh()
+        self.assertEqual(follower.offset, end - 19)
+        self.assertEqual(len(follower.refresh()), 0) # Nothing new yet
+        self.write(len(self.content), end)
+        last = follower.refresh()
+        self.assertEqual(len(before) + len(last), len(create_data_array(self.source, k16(), 0, 24, False, False)))
+        self.assertEqual(follower.offset, len(self.content))
+
+    def test_last_row_without_breakline(self):
+        self.write(len(self.content) - 1)
+        follower = TailFollower(self.file_name, k16(), 0, 24, False, False)
+        total = len(follower.refresh())
+        total += len(follower.refresh(final=True))
+        self.assertEqual(total, len(create_data_array(self.source, k16(), 0, 24, False, False)))
+        self.assertEqual(follower.offset, len(self.content) - 1)
+
+    def test_checkpoint(self):
+        half = len(self.content) // 2
+        first = TailFollower(self.file_name, k16(), 0, 24, checkpoint_name=self.checkpoint_name)
+        self.write(half)
+        rows = [list(row) for row in first.refresh()]
+        # Another process continues where the first one left it
+        second = TailFollower(self.file_name, k16(), 0, 24, checkpoint_name=self.checkpoint_name)
+        self.assertEqual((second.offset, second.rows), (first.offset, first.rows))
+        self.write(len(self.content), half)
+        rows += [list(row) for row in second.refresh()]
+        self.assertEqual(rows, [list(row) for row in create_data_array(self.source, k16(), 0, 24)])
+        self.assertSameRidership(second.ridership, aggregate_ridership(self.source, k16(), 0, 24))
+        # A checkpoint of another query is ignored
+        other = TailFollower(self.file_name, k16(), 6, 9, checkpoint_name=self.checkpoint_name)
+        self.assertEqual(other.offset, 0)
+
+    def test_replaced_file(self):
+        self.write(len(self.content))
+        follower = TailFollower(self.file_name, k16(), 0, 24)
+        follower.refresh()
+        # The next day starts in the same file
+        write_validation_file(self.file_name, 3000, date="2025-02-12", seed=5)
+        rows = follower.refresh()
+        self.assertSameRows(rows, create_data_array(self.file_name, k16(), 0, 24))
+        self.assertEqual(follower.rows, len(rows))
+        self.assertSameRidership(follower.ridership, aggregate_ridership(self.file_name, k16(), 0, 24))
+
+    def test_partial_header(self):
+        self.write(40)
+        follower = TailFollower(self.file_name, k16())
+        self.assertEqual((len(follower.refresh()), follower.offset), (0, 0))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            TailFollower(self.file_name, k16(), 9, 6)
+        with self.assertRaises(ValueError):
+            TailFollower(self.file_name, k16(), chunk_size=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,14 @@
+import pickle
 import unittest
+from array import array
 
 from src.utilities.data_structures import IntArr
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class TestIntArr(unittest.TestCase):
 
     def test_empty_array(self):
@@ -47,5 +54,171 @@ class TestIntArr(unittest.TestCase):
         self.assertIn(30, arr)  # Assert 30 is in the array
         self.assertNotIn(25, arr)  # Assert 25 is not in the array
 
+    def test_pickle(self):
+        # Test that the assigned values survive being pickled
+        arr = IntArr(4)
+        arr[0] = -7
+        arr[2] = 2**31 - 1
+        copy = pickle.loads(pickle.dumps(arr))
+        self.assertEqual(len(copy), 2)
+        self.assertEqual(list(copy), [-7, 2**31 - 1])
+        self.assertEqual(copy[2], 2**31 - 1)
+
+    def test_from_buffer_shares_memory(self):
+        # Test that the array and the buffer see each other's writes
+        values = array("i", [1, 2, 3])
+        arr = IntArr.from_buffer(values)
+        self.assertEqual(len(arr), 3)
+        arr[0] = 10
+        values[2] = 30
+        self.assertEqual(values.tolist(), [10, 2, 30])
+        self.assertEqual(arr.__repr__(), "[10, 2, 30]")
+
+    def test_from_buffer_copy(self):
+        values = array("i", [4, 5])
+        arr = IntArr.from_buffer(bytes(values), copy=True)
+        arr[0] = 0
+        self.assertEqual(list(arr), [0, 5])
+        with self.assertRaises(TypeError):
+            IntArr.from_buffer(bytes(values))
+        with self.assertRaises(ValueError):
+            IntArr.from_buffer(bytearray(3))
+
+    def test_as_memoryview(self):
+        arr = IntArr(3)
+        arr[1] = 7
+        view = arr.as_memoryview()
+        self.assertEqual(view.tolist(), [0, 7, 0])
+        view[2] = 9
+        self.assertEqual(arr[2], 9)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_to_numpy_shares_memory(self):
+        arr = IntArr(4)
+        arr[0] = 1
+        view = arr.to_numpy()
+        self.assertEqual(view.dtype, numpy.int32)
+        view[2] = 42
+        self.assertEqual(arr[2], 42)
+        arr[3] = -5
+        self.assertEqual(view[3], -5)
+        self.assertEqual(list(arr), [1, 0, 42, -5])
+        self.assertEqual(int(view.sum()), 38)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_from_numpy(self):
+        values = numpy.arange(6, dtype=numpy.int64).reshape(2, 3)
+        arr = IntArr.from_numpy(values)
+        self.assertEqual(len(arr), 6)
+        self.assertEqual(list(arr), [0, 1, 2, 3, 4, 5])
+        arr[0] = 100
+        self.assertEqual(int(values[0, 0]), 0)
+
+    def test_append_grows(self):
+        arr = IntArr()
+        for i in range(100):
+            arr.append(i * i)
+        self.assertEqual(len(arr), 100)
+        self.assertGreaterEqual(arr.capacity, 100)
+        self.assertEqual(list(arr), [i * i for i in range(100)])
+        arr.shrink_to_fit()
+        self.assertEqual(arr.capacity, 100)
+        self.assertEqual(arr[99], 9801)
+
+    def test_extend_reserve_and_shrink(self):
+        arr = IntArr(10)
+        arr.extend([1, 2, 3])
+        arr.reserve(64)
+        self.assertEqual(arr.capacity, 64)
+        self.assertEqual(list(arr), [1, 2, 3])
+        arr.shrink_to_fit()
+        self.assertEqual(arr.capacity, 3)
+        self.assertIn(3, arr)
+        with self.assertRaises(TypeError):
+            arr.append("4")
+
+    def test_slice_is_a_view(self):
+        arr = IntArr()
+        arr.extend([3, 1, 4, 1, 5, 9])
+        view = arr[2:5]
+        self.assertEqual(list(view), [4, 1, 5])
+        view[0] = 40
+        self.assertEqual(arr[2], 40)
+        self.assertEqual(list(arr[-2:]), [5, 9])
+        self.assertEqual(len(arr[4:2]), 0)
+        with self.assertRaises(ValueError):
+            arr[::2]
+
+    def test_slice_assignment(self):
+        arr = IntArr()
+        arr.extend([0, 0, 0, 0])
+        arr[1:3] = array("i", [7, 8])
+        self.assertEqual(list(arr), [0, 7, 8, 0])
+        with self.assertRaises(ValueError):
+            arr[0:2] = [1, 2, 3]
+
+    def test_copy_from_and_copy_to(self):
+        arr = IntArr(6)
+        arr.copy_from([1, 2, 3], 2)
+        self.assertEqual(len(arr), 3)
+        self.assertEqual(list(arr), [1, 2, 3])
+        with self.assertRaises(IndexError):
+            arr.copy_from([1, 2, 3], 4)
+        source = IntArr()
+        source.extend([5, 6])
+        arr.copy_from(source)
+        self.assertEqual(list(arr), [5, 6, 1, 2, 3])
+        destination = array("i", [0] * 4)
+        source.copy_to(destination, 1)
+        self.assertEqual(list(destination), [0, 5, 6, 0])
+        other = IntArr(3)
+        source.copy_to(other, 1)
+        self.assertEqual(list(other), [5, 6])
+        with self.assertRaises(IndexError):
+            source.copy_to(destination, 3)
+
+    def test_copy_from_other_integer_buffers(self):
+        arr = IntArr(4)
+        arr.copy_from(array("q", [1, 2, 3]))
+        self.assertEqual(list(arr), [1, 2, 3])
+        arr[0:2] = array("h", [-4, 5])
+        self.assertEqual(list(arr + array("q", [1, 1, 1])), [-3, 6, 4])
+        with self.assertRaises(OverflowError):
+            arr.copy_from(array("q", [2 ** 40]))
+        with self.assertRaises(TypeError):
+            arr.copy_from(array("d", [1.5]))
+        if numpy is not None:
+            arr.copy_from(numpy.array([7, 8, 9]), 1) #*int64 by default
+            self.assertEqual(list(arr), [-4, 7, 8, 9])
+
+    def test_aggregates(self):
+        arr = IntArr()
+        arr.extend([4, -2, 9, 9, 0])
+        self.assertEqual(arr.sum(), 20)
+        self.assertEqual(arr.min(), -2)
+        self.assertEqual(arr.max(), 9)
+        self.assertEqual(arr.argmax(), 2)
+        self.assertEqual(list(arr.prefix_sums()), [4, 2, 11, 20, 20])
+        self.assertEqual(IntArr().sum(), 0)
+        with self.assertRaises(ValueError):
+            IntArr().max()
+
+    def test_elementwise(self):
+        arr = IntArr()
+        arr.extend([1, 2, 3])
+        other = IntArr()
+        other.extend([10, 20, 30])
+        self.assertEqual(list(arr + 1), [2, 3, 4])
+        self.assertEqual(list(2 * arr), [2, 4, 6])
+        self.assertEqual(list(arr + other), [11, 22, 33])
+        self.assertEqual(list(arr * [3, 2, 1]), [3, 4, 3])
+        arr += other
+        arr *= 2
+        self.assertEqual(list(arr), [22, 44, 66])
+        with self.assertRaises(ValueError):
+            arr + [1, 2]
+        with self.assertRaises(OverflowError):
+            IntArr.from_buffer(array("i", [2 ** 30]), copy=True) * 4
+
 if __name__ == '__main__':
     unittest.main()
@@ -38,5 +38,52 @@ class TestLinkedList(unittest.TestCase):
             test_llist.add(i)
         self.assertEqual(str(test_llist), "[0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9]")
 
+    def test_get_item_out_of_range(self):
+        test_llist = LList()
+        with self.assertRaises(IndexError):
+            test_llist[0]
+        test_llist.add(1)
+        with self.assertRaises(IndexError):
+            test_llist[1]
+
+    def test_sequential_and_backward_access(self):
+        # Small nodes, so the cursor has to move between many of them
+        test_llist = LList(node_capacity=3)
+        test_llist.extend(range(50))
+        self.assertEqual([test_llist[i] for i in range(50)], list(range(50)))
+        self.assertEqual([test_llist[i] for i in reversed(range(50))], list(reversed(range(50))))
+        self.assertEqual(test_llist[49], 49)
+        self.assertEqual(test_llist[7], 7)
+
+    def test_extend(self):
+        test_llist = LList(node_capacity=4)
+        test_llist.extend(range(8))
+        test_llist.extend([])
+        test_llist.extend(iter(range(8, 11)))
+        test_llist.add(11)
+        self.assertEqual(len(test_llist), 12)
+        self.assertEqual(list(test_llist), list(range(12)))
+
+    def test_pop_front(self):
+        test_llist = LList(node_capacity=4)
+        test_llist.extend(range(10))
+        self.assertEqual(test_llist[6], 6)
+        self.assertEqual([test_llist.pop_front() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertEqual(len(test_llist), 5)
+        self.assertEqual(test_llist[0], 5)
+        self.assertEqual(test_llist[1], 6)
+        self.assertEqual(list(test_llist), [5, 6, 7, 8, 9])
+        for _ in range(5):
+            test_llist.pop_front()
+        self.assertEqual(str(test_llist), "[]")
+        with self.assertRaises(IndexError):
+            test_llist.pop_front()
+        test_llist.add(1)
+        self.assertEqual(test_llist[0], 1)
+
+    def test_invalid_node_capacity(self):
+        with self.assertRaises(ValueError):
+            LList(node_capacity=0)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+import os
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.data_getter.mmap_reader import read_rows_mmap
+from src.utilities.data_getter.row_reader import read_rows
+from src.utilities.objects.route_list import k16
+from test.test_row_reader import expected_rows
+from test import SyntheticFileTestCase
+
+
+class TestMmapReader(SyntheticFileTestCase):
+    ROWS = 5000
+
+    def test_same_rows_as_stream(self):
+        for start_time, end_time in [(0, 24), (6, 9), (17, 19), (23, 24)]:
+            mapped = [list(row) for row in read_rows_mmap(self.file_name, k16(), start_time, end_time)]
+            streamed = [list(row) for row in read_rows(self.file_name, k16(), start_time, end_time)]
+            self.assertEqual(mapped, streamed)
+
+    def test_without_filters(self):
+        rows = [list(row) for row in read_rows_mmap(self.file_name, k16(), 5, 8, filter_stations=False, filter_entrances=False)]
+        self.assertEqual(rows, expected_rows(self.file_name, 5, 8, False, False))
+
+    def test_without_final_breakline(self):
+        with open(self.file_name, "rb+") as file:
+            file.truncate(os.path.getsize(self.file_name) - 1)
+        rows = [list(row) for row in read_rows_mmap(self.file_name, k16(), 0, 24, filter_entrances=False)]
+        self.assertEqual(rows, expected_rows(self.file_name, 0, 24, filter_entrances=False))
+
+    def test_empty_file(self):
+        open(self.file_name, "w").close()
+        self.assertEqual(list(read_rows_mmap(self.file_name, k16(), 0, 24)), [])
+
+    def test_invalid_time_range(self):
+        with self.assertRaises(ValueError):
+            read_rows_mmap(self.file_name, k16(), 10, 2)
+
+    def test_create_data_array(self):
+        data = create_data_array(self.file_name, k16(), 6, 9, use_mmap=True)
+        self.assertEqual([list(row) for row in data], expected_rows(self.file_name, 6, 9))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.data_getter.multi_day import create_data_arrays, resolve_files
+from src.utilities.data_getter.synthetic import write_validation_file
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+class TestMultiDay(SyntheticFileTestCase):
+    ROWS = None #*The files of three days are written instead
+
+    def setUp(self):
+        super().setUp()
+        self.file_names = []
+        #*Written out of order on purpose
+        for day in (12, 10, 11):
+            file_name = os.path.join(self.directory.name, f"202502{day}.csv")
+            write_validation_file(file_name, 2000, date=f"2025-02-{day}", seed=day)
+            self.file_names.append(file_name)
+
+    def expected(self, start_time, end_time):
+        rows = []
+        for file_name in sorted(self.file_names):
+            rows.extend(list(row) for row in create_data_array(file_name, k16(), start_time, end_time))
+        return rows
+
+    def test_resolve_glob(self):
+        self.assertEqual(resolve_files(os.path.join(self.directory.name, "202502*.csv")), sorted(self.file_names))
+
+    def test_parallel(self):
+        data = create_data_arrays(self.file_names, k16(), 6, 20, max_workers=3)
+        self.assertEqual([list(row) for row in data], self.expected(6, 20))
+
+    def test_sequential(self):
+        data = create_data_arrays(os.path.join(self.directory.name, "*.csv"), k16(), 0, 24, max_workers=1)
+        self.assertEqual([list(row) for row in data], self.expected(0, 24))
+        dates = [row[0] for row in data]
+        self.assertEqual(dates, sorted(dates))
+
+    def test_no_files(self):
+        self.assertEqual(len(create_data_arrays([], k16(), 0, 24)), 0)
+
+    def test_invalid_time_range(self):
+        with self.assertRaises(ValueError):
+            create_data_arrays(self.file_names, k16(), 8, 8)
+
+if __name__ == '__main__':
+    unittest.main()
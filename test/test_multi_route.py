@@ -0,0 +1,92 @@
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array, create_validations
+from src.utilities.data_getter.multi_route import RouteIndex, create_route_data_arrays
+from src.utilities.data_getter.offset_index import build_index
+from src.utilities.data_getter.rows import parse_validation
+from src.utilities.data_structures.strArr import StrArr
+from src.utilities.objects.route import Route
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+def make_route(identifier, stations, zones):
+    """Builds a Route out of plain lists of `(code, name)` and zone names"""
+    codes, names, zone_names = StrArr(len(stations)), StrArr(len(stations)), StrArr(len(zones))
+    for i, (code, name) in enumerate(stations):
+        codes[i], names[i] = code, name
+    for i, zone in enumerate(zones):
+        zone_names[i] = zone
+    return Route(identifier, codes, names, zone_names)
+
+
+def routes():
+    """K16 plus two routes that share some of its zones and stations"""
+    return [
+        k16(),
+        make_route("B10", [("02101", "Toberin"), ("02103", "Calle 161"), ("09000", "Cabecera"), ("02004", "Calle 63")],
+                   ["(33)Zona B AutoNorte", "(02)Zona A Caracas"]),
+        make_route("G43", [("08000", "Portal Sur"), ("08101", "Alquería"), ("07110", "Campín"), ("02502", "Portal El Dorado")],
+                   ["(36)Zona G NQS Sur", "(38)Zona E NQS Central", "(11)Zona K Calle 26"]),
+    ]
+
+
+class TestMultiRoute(SyntheticFileTestCase):
+
+    def test_same_rows_as_one_route_at_a_time(self):
+        for filters in ((0, 24, True, True), (6, 9, True, False), (17, 20, False, True)):
+            result = create_route_data_arrays(self.file_name, routes(), *filters)
+            self.assertEqual(list(result), ["K16", "B10", "G43"])
+            for route in routes():
+                self.assertSameRows(result[route.identifier], create_data_array(self.file_name, route, *filters))
+
+    def test_memory_map_and_index(self):
+        expected = create_route_data_arrays(self.file_name, routes(), 5, 10)
+        mapped = create_route_data_arrays(self.file_name, routes(), 5, 10, use_mmap=True)
+        build_index(self.file_name)
+        indexed = create_route_data_arrays(self.file_name, routes(), 5, 10)
+        for identifier in expected:
+            self.assertSameRows(mapped[identifier], expected[identifier])
+            self.assertSameRows(indexed[identifier], expected[identifier])
+
+    def test_rows_are_shared(self):
+        result = create_route_data_arrays(self.file_name, routes(), 0, 24, parse=parse_validation)
+        self.assertEqual(list(result["K16"]), list(create_validations(self.file_name, k16(), 0, 24)))
+        # Portal El Dorado belongs to K16 and G43, so its rows are the same objects in both
+        shared = [validation for validation in result["G43"] if validation.station == 2502]
+        self.assertTrue(shared)
+        k16_ids = {id(validation) for validation in result["K16"]}
+        self.assertTrue(all(id(validation) in k16_ids for validation in shared))
+
+    def test_zone_with_different_names(self):
+        renamed = make_route("K16b", [("02502", "Portal El Dorado")], ["(11)Zona K Calle 26 Bis"])
+        index = RouteIndex([k16(), renamed])
+        self.assertFalse(index.consistent_zone_names)
+        expected = {"K16": create_data_array(self.file_name, k16(), 0, 24), "K16b": create_data_array(self.file_name, renamed, 0, 24)}
+        for routes in ([k16(), renamed], [renamed, k16()]):
+            for use_mmap in (False, True):
+                result = create_route_data_arrays(self.file_name, routes, 0, 24, use_mmap=use_mmap)
+                for identifier, rows in expected.items():
+                    self.assertSameRows(result[identifier], rows)
+
+    def test_routes_of(self):
+        index = RouteIndex(routes())
+        row = b"2025-02-11,17:03:09,(11)Zona K Calle 26,(02502)Portal El Dorado,(1)Acceso Norte,4010663,8,16"
+        self.assertEqual(index.routes_of(row), (0, 2))
+        self.assertEqual(index.routes_of(row.replace(b"02502", b"06001")), (0,))
+        self.assertEqual(index.routes_of(row.replace(b"02502", b"06107")), ())
+        self.assertEqual(index.routes_of(row.replace(b"02502", b"06107"), filter_stations=False), (0, 2))
+        self.assertEqual(index.routes_of(b"x" + row, start=1), (0, 2))
+        self.assertTrue(index.union_route.has_station("09000"))
+        self.assertEqual(len(index.union_route.zone_codes), 5)
+
+    def test_invalid_routes(self):
+        with self.assertRaises(ValueError):
+            RouteIndex([])
+        with self.assertRaises(ValueError):
+            RouteIndex([k16(), k16()])
+        with self.assertRaises(ValueError):
+            create_route_data_arrays(self.file_name, routes(), 10, 10)
+
+if __name__ == '__main__':
+    unittest.main()
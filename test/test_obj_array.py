@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from src.utilities.data_structures import ObjArr, IntArr
@@ -61,5 +62,41 @@ class TestObjArr(unittest.TestCase):
         self.assertEqual(collected_elements[1].__repr__(), "[1, 2, 3]")
         self.assertEqual(collected_elements[2].__repr__(), "[2, 3, 4]")
 
+    def test_obj_arr_pickle(self):
+        # Test that nested arrays survive being pickled
+        arr_of_arrs = ObjArr(2)
+        for i in range(2):
+            temp = IntArr(2)
+            temp[0] = i
+            temp[1] = i + 1
+            arr_of_arrs[i] = temp
+        copy = pickle.loads(pickle.dumps(arr_of_arrs))
+        self.assertEqual(len(copy), 2)
+        self.assertEqual(copy.__repr__(), "[[0, 1], [1, 2]]")
+
+    def test_obj_arr_append_grows(self):
+        arr = ObjArr()
+        for i in range(100):
+            arr.append([i])
+        self.assertEqual(len(arr), 100)
+        self.assertGreaterEqual(arr.capacity, 100)
+        self.assertEqual([value[0] for value in arr], list(range(100)))
+        arr.shrink_to_fit()
+        self.assertEqual(arr.capacity, 100)
+        self.assertEqual(arr[99], [99])
+        with self.assertRaises(ValueError):
+            arr.append(None)
+
+    def test_obj_arr_extend_and_reserve(self):
+        arr = ObjArr(2)
+        arr.extend(["a", "b", "c"])
+        self.assertEqual(arr.__repr__(), "[a, b, c]")
+        arr.reserve(10)
+        self.assertEqual(arr.capacity, 10)
+        self.assertEqual(len(arr), 3)
+        arr.shrink_to_fit()
+        self.assertEqual(arr.capacity, 3)
+        self.assertEqual(list(arr), ["a", "b", "c"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import os
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.data_getter.offset_index import OffsetIndex, build_index, index_name_of, load_index, read_rows_indexed
+from src.utilities.data_getter.row_reader import read_rows
+from src.utilities.data_getter.synthetic import write_validation_file
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+class TestOffsetIndex(SyntheticFileTestCase):
+    ROWS = 5000
+
+    def test_no_index(self):
+        self.assertIsNone(load_index(self.file_name))
+
+    def test_build_and_load(self):
+        built = build_index(self.file_name)
+        self.assertTrue(os.path.exists(index_name_of(self.file_name)))
+        loaded = load_index(self.file_name)
+        self.assertEqual(len(loaded), len(built))
+        self.assertEqual(loaded.ranges(k16(), 0, 24), built.ranges(k16(), 0, 24))
+
+    def test_loaded_once(self):
+        build_index(self.file_name)
+        loaded = load_index(self.file_name)
+        self.assertIs(load_index(self.file_name), loaded)
+        with open(index_name_of(self.file_name), "r+b") as file:
+            file.write(b"XXXX") # The sidecar file isn't read again while the file is the same
+        self.assertIs(load_index(self.file_name), loaded)
+        stat = os.stat(self.file_name)
+        os.utime(self.file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        rebuilt = load_index(self.file_name)
+        self.assertIsNot(rebuilt, loaded)
+        self.assertTrue(rebuilt.is_current(self.file_name))
+        os.remove(index_name_of(self.file_name))
+        self.assertIsNone(load_index(self.file_name))
+
+    def test_same_rows_as_scan(self):
+        index = build_index(self.file_name)
+        for start_time, end_time, filter_stations, filter_entrances in [(0, 24, True, True), (17, 19, True, False), (5, 6, False, True)]:
+            indexed = [list(row) for row in read_rows_indexed(self.file_name, index, k16(), start_time, end_time, filter_stations, filter_entrances)]
+            scanned = [list(row) for row in read_rows(self.file_name, k16(), start_time, end_time, filter_stations, filter_entrances)]
+            self.assertEqual(indexed, scanned)
+
+    def test_ranges_only_cover_the_query(self):
+        index = build_index(self.file_name)
+        window = sum(end - start for start, end in index.ranges(k16(), 17, 19))
+        self.assertLess(window, os.path.getsize(self.file_name) / 10)
+
+    def test_rebuilt_when_file_changes(self):
+        build_index(self.file_name)
+        write_validation_file(self.file_name, 2000, seed=1)
+        stat = os.stat(self.file_name)
+        os.utime(self.file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        index = load_index(self.file_name)
+        self.assertTrue(index.is_current(self.file_name))
+        self.assertTrue(OffsetIndex.load(index_name_of(self.file_name)).is_current(self.file_name))
+        indexed = [list(row) for row in read_rows_indexed(self.file_name, index, k16(), 0, 24)]
+        scanned = [list(row) for row in read_rows(self.file_name, k16(), 0, 24)]
+        self.assertEqual(indexed, scanned)
+
+    def test_corrupted_index_is_rebuilt(self):
+        with open(index_name_of(self.file_name), "wb") as file:
+            file.write(b"not an index")
+        self.assertTrue(load_index(self.file_name).is_current(self.file_name))
+
+    def test_create_data_array_uses_index(self):
+        expected = [list(row) for row in create_data_array(self.file_name, k16(), 6, 9)]
+        build_index(self.file_name)
+        self.assertEqual([list(row) for row in create_data_array(self.file_name, k16(), 6, 9)], expected)
+
+if __name__ == '__main__':
+    unittest.main()
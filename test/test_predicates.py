@@ -0,0 +1,121 @@
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array, create_data_array_where, select_where
+from src.utilities.data_getter.offset_index import build_index
+from src.utilities.data_getter.predicates import (Accesses, And, Devices, MinEntrances, MinExits, OnRoute, Or, Predicate,
+                                                  Stations, TimeRange, Zones, plan_scan)
+from src.utilities.data_getter.row_reader import iter_lines
+from src.utilities.data_getter.rows import parse_time, parse_validation
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+ROW = b"2025-02-11,17:03:09,(36)Zona G NQS Sur,(08102)NQS - Calle 38A Sur,(1)Acceso Norte,4010663,8,16"
+
+
+def reference(file_name, check):
+    """The rows of a file whose fields pass `check`, filtered with plain Python"""
+    rows = []
+    for line in iter_lines(file_name):
+        fields = line.decode("utf-8").split(",")
+        if check(parse_time(fields[1]), int(fields[2][1:3]), fields[3][1:6], int(fields[4][1:fields[4].index(")")]),
+                 int(fields[5]), int(fields[6]), int(fields[7])):
+            rows.append(fields)
+    return rows
+
+
+class TestPredicates(SyntheticFileTestCase):
+
+    def assertMatches(self, predicate, check, **kwargs):
+        """Compares the rows of a predicate with the ones whose fields pass `check`"""
+        rows = [list(row) for row in create_data_array_where(self.file_name, predicate, **kwargs)]
+        self.assertEqual(rows, reference(self.file_name, check))
+
+    def test_single_row(self):
+        self.assertTrue(TimeRange(17 * 3600 + 189, 17 * 3600 + 190).matches(ROW))
+        self.assertFalse(TimeRange.hours(6, 17).matches(ROW))
+        self.assertTrue(Zones({36}).matches(ROW))
+        self.assertTrue(Stations({"08102"}).matches(ROW) and Stations({8102}).matches(ROW))
+        self.assertFalse(Stations({"08101"}).matches(ROW))
+        self.assertTrue(Accesses({1, 2}).matches(ROW))
+        self.assertTrue(Devices({4010663}).matches(ROW))
+        self.assertTrue(MinEntrances(8).matches(ROW) and not MinEntrances(9).matches(ROW))
+        self.assertTrue(MinExits(16).matches(ROW) and not MinExits(17).matches(ROW))
+        self.assertTrue((Zones({1}) | Devices({4010663})).matches(ROW))
+        self.assertFalse((Zones({36}) & Devices({1})).matches(ROW))
+
+    def test_cheapest_first(self):
+        predicate = Devices({1}) & (MinExits(1) & Stations({1})) & TimeRange(0, 10)
+        self.assertEqual([type(member) for member in predicate.predicates], [TimeRange, MinExits, Stations, Devices])
+        self.assertEqual(len((Zones({1}) | Zones({2}) | Devices({3})).predicates), 3)
+        with self.assertRaises(TypeError):
+            And(Zones({1}), 3)
+        with self.assertRaises(TypeError):
+            Predicate() # Abstract
+
+    def test_or_cheapest_first(self):
+        predicate = Or(Devices({1}), Or(MinExits(17), Zones({36})), Stations({1}))
+        self.assertEqual([type(member) for member in predicate.predicates], [Zones, MinExits, Stations, Devices])
+        self.assertEqual(predicate.cost, sum(member.cost for member in predicate.predicates))
+        self.assertTrue(predicate.matches(ROW)) #*Only the zone matches
+        self.assertFalse(Or(Zones({1}), MinExits(17), Devices({1})).matches(ROW))
+        with self.assertRaises(TypeError):
+            Or(Zones({1}), 3)
+
+    def test_seconds_and_zones(self):
+        predicate = TimeRange(6 * 3600 + 1234, 9 * 3600 + 15) & Zones({33, 2})
+        self.assertMatches(predicate, lambda t, z, s, a, d, e, x: 6 * 3600 + 1234 <= t < 9 * 3600 + 15 and z in (33, 2))
+
+    def test_stations_and_counts(self):
+        predicate = Stations({"02502", "08000"}) & MinEntrances(5) & MinExits(1)
+        self.assertMatches(predicate, lambda t, z, s, a, d, e, x: s in ("02502", "08000") and e >= 5 and x >= 1)
+
+    def test_or(self):
+        predicate = TimeRange.hours(17, 19) & (Zones({11}) | Accesses({2}) | Devices({4010663}))
+        self.assertMatches(predicate, lambda t, z, s, a, d, e, x: 17 * 3600 <= t < 19 * 3600 and (z == 11 or a == 2 or d == 4010663))
+
+    def test_route_and_zone(self):
+        stations = set(k16().station_codes)
+        predicate = Zones({11}) & OnRoute(k16()) & MinEntrances(1) & TimeRange.hours(5, 22)
+        check = lambda t, z, s, a, d, e, x: 5 * 3600 <= t < 22 * 3600 and z == 11 and s in stations and e >= 1
+        self.assertMatches(predicate, check)
+        self.assertMatches(predicate, check, use_mmap=True)
+        build_index(self.file_name)
+        self.assertMatches(predicate, check)
+        self.assertMatches(Zones({2, 5}) & MinEntrances(1), lambda t, z, s, a, d, e, x: z in (2, 5) and e >= 1)
+
+    def test_same_rows_with_every_reader(self):
+        predicates = [
+            TimeRange.hours(6, 9), TimeRange(6 * 3600 + 1234, 9 * 3600), Zones({33, 2}), Stations({"02502", "08000"}),
+            Accesses({2}), Devices({4010663}), MinEntrances(5), MinExits(10), OnRoute(k16()), OnRoute(k16(), False),
+            Zones({11}) | Devices({4010663}), TimeRange.hours(17, 19) & (Zones({11}) | Accesses({2})),
+        ]
+        chunked = [[list(row) for row in create_data_array_where(self.file_name, predicate)] for predicate in predicates]
+        self.assertTrue(all(chunked))
+        for rows, predicate in zip(chunked, predicates):
+            with self.subTest(predicate=predicate):
+                self.assertSameRows(create_data_array_where(self.file_name, predicate, use_mmap=True), rows)
+        build_index(self.file_name)
+        for rows, predicate in zip(chunked, predicates):
+            with self.subTest(predicate=predicate, index=True):
+                self.assertSameRows(create_data_array_where(self.file_name, predicate), rows)
+
+    def test_create_data_array_is_a_wrapper(self):
+        route, _, _, filter_stations, filter_entrances, residual = plan_scan(And(TimeRange.hours(6, 9), OnRoute(k16(), False)))
+        self.assertEqual((route.identifier, filter_stations, filter_entrances, residual), ("K16", False, False, None))
+        rows = create_data_array(self.file_name, k16(), 6, 9)
+        self.assertSameRows(rows, create_data_array_where(self.file_name, TimeRange.hours(6, 9) & OnRoute(k16()) & MinEntrances(1)))
+
+    def test_plan(self):
+        _, start_time, end_time, _, filter_entrances, residual = plan_scan(TimeRange(3600 + 5, 7200 + 1) & MinEntrances(3))
+        self.assertEqual((start_time, end_time, filter_entrances), (1, 3, True))
+        self.assertEqual({type(member) for member in residual.predicates}, {TimeRange, MinEntrances})
+        self.assertIsNone(plan_scan(TimeRange.hours(6, 7) & TimeRange.hours(8, 9)))
+        self.assertEqual(list(select_where(self.file_name, TimeRange.hours(6, 7) & TimeRange.hours(8, 9))), [])
+
+    def test_parse(self):
+        validations = list(select_where(self.file_name, Zones({33}) & MinExits(10), parse=parse_validation))
+        self.assertTrue(validations)
+        self.assertTrue(all(validation.zone == 33 and validation.exits >= 10 for validation in validations))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.data_getter.offset_index import build_index
+from src.utilities.data_getter.result_cache import CACHE_SUFFIX, ROW_OVERHEAD, ResultCache
+from src.utilities.data_getter.synthetic import write_validation_file
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+class TestResultCache(SyntheticFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache_directory = os.path.join(self.directory.name, "cache")
+
+    def test_same_rows_as_create_data_array(self):
+        cache = ResultCache()
+        for filters in ((0, 24, True, True), (6, 9, False, False), (23, 24, True, True)):
+            expected = create_data_array(self.file_name, k16(), *filters)
+            self.assertSameRows(cache.create_data_array(self.file_name, k16(), *filters), expected)
+            self.assertSameRows(cache.create_data_array(self.file_name, k16(), *filters), expected)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (3, 3, 3))
+
+    def test_hit_does_not_read_the_file(self):
+        cache = ResultCache()
+        first = cache.create_data_array(self.file_name, k16(), 6, 9)
+        # Same size and modification time, but the rows can't be read anymore
+        stat = os.stat(self.file_name)
+        with open(self.file_name, "r+b") as file:
+            file.write(b"x" * 200)
+        os.utime(self.file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = cache.create_data_array(self.file_name, k16(), 6, 9, use_mmap=True)
+        self.assertSameRows(second, first)
+        self.assertIsNot(second, first)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_changed_file_is_read_again(self):
+        cache = ResultCache()
+        cache.create_data_array(self.file_name, k16(), 0, 24)
+        write_validation_file(self.file_name, 5000, seed=3)
+        os.utime(self.file_name, ns=(1, 1))
+        self.assertSameRows(cache.create_data_array(self.file_name, k16(), 0, 24), create_data_array(self.file_name, k16(), 0, 24))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_lru_eviction(self):
+        rows = create_data_array(self.file_name, k16(), 6, 7)
+        size = sum(len(",".join(row).encode("utf-8")) + ROW_OVERHEAD for row in rows)
+        cache = ResultCache(max_bytes=size * 2)
+        cache.create_data_array(self.file_name, k16(), 6, 7)
+        cache.create_data_array(self.file_name, k16(), 6, 7, False, False) # Bigger, so the first one is evicted
+        self.assertEqual((len(cache), cache.evictions), (1, 1))
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+        cache.create_data_array(self.file_name, k16(), 6, 7)
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+    def test_result_bigger_than_the_cache(self):
+        cache = ResultCache(max_bytes=100)
+        cache.create_data_array(self.file_name, k16(), 0, 24)
+        self.assertEqual((len(cache), cache.nbytes, cache.evictions), (0, 0, 0))
+
+    def test_disk_tier(self):
+        expected = create_data_array(self.file_name, k16(), 6, 9)
+        cache = ResultCache(directory=self.cache_directory)
+        cache.create_data_array(self.file_name, k16(), 6, 9)
+        files = [name for name in os.listdir(self.cache_directory) if name.endswith(CACHE_SUFFIX)]
+        self.assertEqual(len(files), 1)
+        self.assertLess(os.path.getsize(os.path.join(self.cache_directory, files[0])), cache.nbytes / 2)
+
+        other = ResultCache(directory=self.cache_directory)
+        self.assertSameRows(other.create_data_array(self.file_name, k16(), 6, 9), expected)
+        self.assertSameRows(other.create_data_array(self.file_name, k16(), 6, 9), expected)
+        self.assertEqual((other.disk_hits, other.hits, other.misses), (1, 1, 0))
+
+        other.clear(disk=True)
+        self.assertEqual((len(other), os.listdir(self.cache_directory)), (0, []))
+
+    def test_corrupted_disk_entry(self):
+        cache = ResultCache(directory=self.cache_directory)
+        cache.create_data_array(self.file_name, k16(), 6, 9)
+        name = os.path.join(self.cache_directory, os.listdir(self.cache_directory)[0])
+        with open(name, "r+b") as file:
+            file.seek(30)
+            file.write(b"garbage")
+        other = ResultCache(directory=self.cache_directory)
+        self.assertSameRows(other.create_data_array(self.file_name, k16(), 6, 9), create_data_array(self.file_name, k16(), 6, 9))
+        self.assertEqual(other.misses, 1)
+
+    def test_indexed_file(self):
+        build_index(self.file_name)
+        cache = ResultCache()
+        self.assertSameRows(cache.create_data_array(self.file_name, k16(), 6, 9), create_data_array(self.file_name, k16(), 6, 9))
+
+    def test_empty_result(self):
+        empty = os.path.join(self.directory.name, "empty.csv")
+        write_validation_file(empty, 0)
+        cache = ResultCache(directory=self.cache_directory)
+        for _ in range(2):
+            self.assertEqual(len(cache.create_data_array(empty, k16(), 0, 24)), 0)
+        other = ResultCache(directory=self.cache_directory)
+        self.assertEqual(len(other.create_data_array(empty, k16(), 0, 24)), 0)
+        self.assertEqual((cache.hits, other.disk_hits), (1, 1))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            ResultCache(max_bytes=-1)
+        with self.assertRaises(ValueError):
+            ResultCache().create_data_array(self.file_name, k16(), 9, 6)
+        with self.assertRaises(FileNotFoundError):
+            ResultCache().create_data_array(self.file_name + ".missing", k16(), 6, 9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import pickle
+import unittest
+
+from src.utilities.data_getter.rows import get_zone_name
+from src.utilities.objects.route_list import k16
+
+
+class TestRoute(unittest.TestCase):
+
+    def setUp(self):
+        self.route = k16()
+
+    def test_station_index(self):
+        self.assertEqual(self.route.station_index("02502"), 0)
+        self.assertEqual(self.route.station_index(b"06101"), 3)
+        self.assertEqual(self.route.station_index("02101"), 11)
+        self.assertEqual(self.route.station_index("99999"), -1)
+        self.assertEqual(self.route.station_index(6101), 3)
+
+    def test_has_station(self):
+        for station_code in self.route.station_codes:
+            self.assertTrue(self.route.has_station(station_code))
+            self.assertTrue(self.route.has_station(station_code.encode("utf-8")))
+        self.assertFalse(self.route.has_station("02103"))
+
+    def test_zones(self):
+        self.assertTrue(self.route.has_zone(38))
+        self.assertFalse(self.route.has_zone(2))
+        self.assertEqual(self.route.zone_index(11), 2)
+        self.assertEqual(self.route.zone_index(2), -1)
+        self.assertEqual(self.route.zone_name_length(33), len("(33)Zona B AutoNorte"))
+        self.assertEqual(self.route.zone_name_length(2), -1)
+
+    def test_get_zone_name(self):
+        self.assertEqual(get_zone_name("38", self.route), 1)
+        with self.assertRaises(ValueError):
+            get_zone_name("02", self.route)
+
+    def test_pickle(self):
+        copy = pickle.loads(pickle.dumps(self.route))
+        self.assertEqual(copy.identifier, "K16")
+        self.assertEqual(copy.station_index(b"07103"), 8)
+        self.assertEqual(list(copy.zone_codes), [33, 38, 11])
+
+if __name__ == '__main__':
+    unittest.main()
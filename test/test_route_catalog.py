@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.objects.route_catalog import RouteCatalog, default_catalog
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+def network(routes):
+    """A catalog of `routes` routes over 40 zones and 2000 stations"""
+    return {"routes": [
+        {
+            "id": f"R{i}",
+            "zones": [f"({(i + j) % 40 + 10})Zona {(i + j) % 40}" for j in range(3)],
+            "stations": [[f"{(i * 7 + j) % 2000:05d}", f"Estación {(i * 7 + j) % 2000}"] for j in range(25)],
+        }
+        for i in range(routes)
+    ]}
+
+
+class TestRouteCatalog(unittest.TestCase):
+
+    def test_default_catalog_has_k16(self):
+        catalog = default_catalog()
+        self.assertIs(catalog, default_catalog())
+        self.assertIn("K16", catalog)
+        route, expected = catalog["K16"], k16()
+        self.assertEqual(route.identifier, "K16")
+        self.assertEqual(list(route.station_codes), list(expected.station_codes))
+        self.assertEqual(list(route.station_names), list(expected.station_names))
+        self.assertEqual(list(route.zone_names), list(expected.zone_names))
+        self.assertEqual(list(route.zone_codes), list(expected.zone_codes))
+
+    def test_routes_are_built_once(self):
+        catalog = RouteCatalog(network(10))
+        self.assertIn("0 built", repr(catalog))
+        route = catalog["R3"]
+        self.assertIs(catalog["R3"], route)
+        self.assertIs(catalog.get("R3"), route)
+        self.assertIsNone(catalog.get("R99"))
+        self.assertIn("1 built", repr(catalog))
+        with self.assertRaises(KeyError):
+            catalog["R99"]
+
+    def test_lookups(self):
+        catalog = RouteCatalog(network(300))
+        self.assertEqual(len(catalog), 300)
+        self.assertEqual(catalog.identifiers[:2], ("R0", "R1"))
+        self.assertEqual(list(catalog)[-1], "R299")
+        self.assertEqual(catalog.routes_with_station("00030"), ("R1", "R2", "R3", "R4", "R287", "R288", "R289", "R290"))
+        for identifier in catalog.routes_with_station("00030"):
+            self.assertTrue(catalog[identifier].has_station("00030"))
+        self.assertEqual(catalog.routes_with_station("99999"), ())
+        self.assertEqual(len(catalog.routes_with_zone(10)), 22)
+        for identifier in catalog.routes_with_zone(10):
+            self.assertTrue(catalog[identifier].has_zone(10))
+        self.assertEqual(catalog.routes_with_zone(99), ())
+
+    def test_load_is_fast(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "routes.json")
+            with open(file_name, "w", encoding="utf-8") as file:
+                json.dump(network(500), file, ensure_ascii=False)
+            start = time.perf_counter()
+            catalog = RouteCatalog.load(file_name)
+            self.assertLess(time.perf_counter() - start, 0.5)
+            self.assertEqual(len(catalog), 500)
+
+    def test_malformed_definitions(self):
+        routes = network(2)["routes"]
+        with self.assertRaises(ValueError):
+            RouteCatalog({"routes": [routes[0], routes[0]]})
+        with self.assertRaises(ValueError):
+            RouteCatalog({"routes": [{"id": "X", "zones": []}]})
+        with self.assertRaises(ValueError):
+            RouteCatalog({"routes": [{"id": "X", "zones": ["Zona B"], "stations": []}]})
+
+
+class TestCatalogRoutes(SyntheticFileTestCase):
+    ROWS = 5000
+
+    def test_same_rows_as_k16(self):
+        rows = create_data_array(self.file_name, default_catalog()["K16"], 6, 20)
+        self.assertSameRows(rows, create_data_array(self.file_name, k16(), 6, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import unittest
+
+from src.utilities.data_getter.data_array import create_data_array
+from src.utilities.data_getter.row_reader import iter_lines, read_rows
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+
+
+def expected_rows(file_name, start_time, end_time, filter_stations=True, filter_entrances=True):
+    """Filters the file with plain Python, to compare it with the readers"""
+    route = k16()
+    station_codes = list(route.station_codes)
+    zone_codes = list(route.zone_codes)
+    rows = []
+    with open(file_name, encoding="utf-8") as file:
+        next(file)
+        for line in file:
+            fields = line.rstrip("\n").split(",")
+            if not start_time <= int(fields[1][:2]) < end_time:
+                continue
+            if int(fields[2][1:3]) not in zone_codes:
+                continue
+            if filter_stations and fields[3][1:6] not in station_codes:
+                continue
+            if filter_entrances and fields[6] == "0":
+                continue
+            rows.append(fields)
+    return rows
+
+
+class TestRowReader(SyntheticFileTestCase):
+    ROWS = 5000
+
+    def test_iter_lines_skips_header(self):
+        lines = list(iter_lines(self.file_name))
+        self.assertEqual(len(lines), 5000)
+        self.assertTrue(lines[0].startswith(b"2025-02-11,00:00:00,"))
+
+    def test_iter_lines_chunk_size(self):
+        # Rows cut in half between chunks must be put back together
+        self.assertEqual(list(iter_lines(self.file_name, chunk_size=7)), list(iter_lines(self.file_name)))
+
+    def test_iter_lines_without_final_breakline(self):
+        with open(self.file_name, "rb+") as file:
+            file.truncate(os.path.getsize(self.file_name) - 1)
+        lines = list(iter_lines(self.file_name, chunk_size=64))
+        self.assertEqual(len(lines), 5000)
+
+    def test_read_rows(self):
+        rows = [list(row) for row in read_rows(self.file_name, k16(), 6, 9)]
+        self.assertGreater(len(rows), 0)
+        self.assertEqual(rows, expected_rows(self.file_name, 6, 9))
+
+    def test_read_rows_without_filters(self):
+        rows = [list(row) for row in read_rows(self.file_name, k16(), 17, 19, filter_stations=False, filter_entrances=False, chunk_size=100)]
+        self.assertEqual(rows, expected_rows(self.file_name, 17, 19, False, False))
+
+    def test_read_rows_until_end_of_file(self):
+        rows = [list(row) for row in read_rows(self.file_name, k16(), 20, 24)]
+        self.assertEqual(rows, expected_rows(self.file_name, 20, 24))
+
+    def test_invalid_time_range(self):
+        with self.assertRaises(ValueError):
+            read_rows(self.file_name, k16(), 9, 9)
+
+    def test_create_data_array(self):
+        data = create_data_array(self.file_name, k16(), 6, 9, chunk_size=4096)
+        self.assertEqual([list(row) for row in data], expected_rows(self.file_name, 6, 9))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import pickle
+import unittest
+
+from src.utilities.data_structures import StrArena
+
+
+class TestStrArena(unittest.TestCase):
+
+    def test_empty_arena(self):
+        arena = StrArena()
+        self.assertEqual(len(arena), 0)
+        self.assertEqual(repr(arena), "[]")
+        self.assertEqual(list(StrArena.from_iterable([])), [])
+
+    def test_append_and_get_item(self):
+        arena = StrArena()
+        values = [f"(0{i:04d}) Estación {i}" for i in range(200)]
+        for value in values:
+            arena.append(value)
+        self.assertEqual(len(arena), 200)
+        self.assertEqual(arena[0], values[0])
+        self.assertEqual(arena[199], values[199])
+        self.assertEqual(list(arena), values)
+        with self.assertRaises(IndexError):
+            arena[200]
+
+    def test_set_item(self):
+        arena = StrArena.from_iterable(["a", "bb", "ccc"])
+        arena[1] = "Alcalá"
+        self.assertEqual(list(arena), ["a", "Alcalá", "ccc"])
+        with self.assertRaises(IndexError):
+            arena[3] = "d"
+
+    def test_from_iterable(self):
+        values = ["", "alpha", "", "Toberín"]
+        arena = StrArena.from_iterable(values)
+        self.assertEqual(list(arena), values)
+        self.assertEqual(arena.nbytes, len("alphaToberín".encode("utf-8")))
+        arena.append("gamma")
+        self.assertEqual(arena[4], "gamma")
+
+    def test_interning(self):
+        labels = ["(33) Alcalá", "(38) Toberín", "(33) Alcalá", "(33) Alcalá"]
+        interned = StrArena.from_iterable(labels, intern=True)
+        self.assertEqual(list(interned), labels)
+        self.assertEqual(interned.nbytes, len("(33) Alcalá(38) Toberín".encode("utf-8")))
+        used = interned.nbytes
+        interned.append("(38) Toberín")
+        self.assertEqual(interned.nbytes, used) #*Already stored
+        interned.append("(11) Suba")
+        self.assertEqual(interned[5], "(11) Suba")
+        self.assertIn("(11) Suba", interned)
+        self.assertNotIn("(12) Usme", interned)
+
+    def test_from_delimited(self):
+        row = "2025-02-11,17:03:12,(33) Alcalá,(04106) Calle 187,Acceso Norte,4011,3,1".encode("utf-8")
+        arena = StrArena.from_delimited(row)
+        self.assertEqual(list(arena), row.decode("utf-8").split(","))
+        self.assertEqual(list(StrArena.from_delimited(b"a,b,c,d", maxsplit=2)), ["a", "b", "c,d"])
+        self.assertEqual(list(StrArena.from_delimited(b"a,,b,")), ["a", "", "b", ""])
+
+    def test_contains(self):
+        arena = StrArena.from_iterable(["alpha", "beta"])
+        self.assertIn("beta", arena)
+        self.assertNotIn("bet", arena)
+
+    def test_contains_after_set_item(self):
+        arena = StrArena(intern=True)
+        arena.append("a")
+        arena[0] = "b"
+        self.assertNotIn("a", arena)
+        self.assertIn("b", arena)
+        labels = StrArena.from_iterable(["x", "y", "x"], intern=True)
+        labels[0] = "y"
+        self.assertIn("x", labels) #*Still at the last position
+        labels[2] = "z"
+        self.assertNotIn("x", labels)
+        labels[1] = "x"
+        self.assertIn("x", labels)
+        self.assertEqual(list(labels), ["y", "x", "z"])
+
+    def test_shrink_to_fit(self):
+        arena = StrArena(1024)
+        arena.append("alpha")
+        arena.shrink_to_fit()
+        self.assertEqual(arena.nbytes, 5)
+        arena.append("beta")
+        self.assertEqual(list(arena), ["alpha", "beta"])
+
+    def test_pickle(self):
+        arena = StrArena.from_iterable(["Alcalá", "", "Alcalá"], intern=True)
+        copy = pickle.loads(pickle.dumps(arena))
+        self.assertEqual(list(copy), ["Alcalá", "", "Alcalá"])
+        self.assertEqual(copy.nbytes, arena.nbytes)
+
+if __name__ == '__main__':
+    unittest.main()
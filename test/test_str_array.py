@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from src.utilities.data_structures.strArr import StrArr
@@ -96,5 +97,38 @@ class TestStrArr(unittest.TestCase):
         self.assertNotIn("delta", self.str_arr)
     
 
+    def test_pickle(self):
+        """Test that the array survives being pickled"""
+        self.str_arr[0] = "alpha"
+        self.str_arr[2] = ""
+        self.str_arr[3] = "Alcalá"
+        copy = pickle.loads(pickle.dumps(self.str_arr))
+        self.assertEqual(repr(copy), "['alpha', NULL, '', 'Alcalá']")
+        self.assertEqual(len(copy), 4)
+        copy.append("delta")
+        self.assertEqual(copy[4], "delta")
+
+    def test_append_grows(self):
+        """Test that appending past the capacity reallocates the array"""
+        arr = StrArr(0)
+        for i in range(100):
+            arr.append(f"s{i}")
+        self.assertEqual(len(arr), 100)
+        self.assertGreaterEqual(arr.capacity, 100)
+        self.assertEqual(list(arr), [f"s{i}" for i in range(100)])
+        arr.shrink_to_fit()
+        self.assertEqual(arr.capacity, 100)
+        self.assertEqual(arr[99], "s99")
+
+    def test_extend_and_reserve(self):
+        self.str_arr[1] = "beta"
+        self.str_arr.extend(["gamma", "Alcalá"])
+        self.assertEqual(repr(self.str_arr), "[NULL, 'beta', 'gamma', 'Alcalá']")
+        self.str_arr.reserve(50)
+        self.assertEqual(self.str_arr.capacity, 50)
+        self.assertEqual(self.str_arr[3], "Alcalá")
+        self.str_arr.reserve(5) #*Never shrinks
+        self.assertEqual(self.str_arr.capacity, 50)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import os
+import unittest
+
+from src.utilities.data_getter.row_reader import iter_lines
+from src.utilities.data_getter.synthetic import HEADER, write_validation_file
+from src.utilities.data_getter.time_seek import find_time_offset, seek_time
+from test import SyntheticFileTestCase
+
+
+def linear_offset(file_name, start_time):
+    """Finds the first row of the window walking the file row by row"""
+    with open(file_name, "rb") as file:
+        file.readline()
+        position = file.tell()
+        for line in file:
+            if int(line[11:13]) >= start_time:
+                return position
+            position += len(line)
+        return position
+
+
+class TestTimeSeek(SyntheticFileTestCase):
+    ROWS = None
+
+    def write_hours(self, hours, final_breakline=True):
+        rows = [f"2025-02-11,{hour:02d}:15:00,(33)Zona B AutoNorte,(02204)Pepe Sierra,(0)Acceso Principal,4010001,{i},0"
+                for i, hour in enumerate(hours)]
+        with open(self.file_name, "w", encoding="utf-8", newline="") as file:
+            file.write(HEADER + "\n" + "".join(row + "\n" for row in rows))
+        if not final_breakline:
+            with open(self.file_name, "rb+") as file:
+                file.truncate(os.path.getsize(self.file_name) - 1)
+
+    def test_same_offset_as_linear_scan(self):
+        write_validation_file(self.file_name, 3000)
+        for start_time in range(26):
+            self.assertEqual(find_time_offset(self.file_name, start_time), linear_offset(self.file_name, start_time))
+
+    def test_missing_hours(self):
+        self.write_hours([0, 0, 3, 3, 3, 7, 20, 20])
+        for start_time in range(25):
+            self.assertEqual(find_time_offset(self.file_name, start_time), linear_offset(self.file_name, start_time))
+
+    def test_without_final_breakline(self):
+        self.write_hours([1, 2, 5, 9], final_breakline=False)
+        for start_time in range(12):
+            self.assertEqual(find_time_offset(self.file_name, start_time), linear_offset(self.file_name, start_time))
+
+    def test_only_header(self):
+        self.write_hours([])
+        self.assertEqual(find_time_offset(self.file_name, 5), os.path.getsize(self.file_name))
+
+    def test_seek_time_leaves_rows_untouched(self):
+        write_validation_file(self.file_name, 1000)
+        with open(self.file_name, "rb") as file:
+            file.seek(seek_time(file, 17))
+            self.assertTrue(file.readline().startswith(b"2025-02-11,17:"))
+
+    def test_iter_lines_from_start_time(self):
+        write_validation_file(self.file_name, 1000)
+        lines = list(iter_lines(self.file_name, chunk_size=50, start_time=12))
+        self.assertEqual(lines, [line for line in iter_lines(self.file_name) if int(line[11:13]) >= 12])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import mmap
+import os
+import unittest
+
+from src.utilities.data_getter import tokenizer
+from src.utilities.data_getter.row_reader import filter_rows, iter_lines, read_rows
+from src.utilities.data_getter.tokenizer import py_scan_rows
+from src.utilities.objects.route_list import k16
+from test import SyntheticFileTestCase
+from test.test_row_reader import expected_rows
+
+try:
+    from src.utilities.data_getter._tokenizer import scan_rows as compiled_scan_rows
+except ImportError:
+    compiled_scan_rows = None
+
+#*(start_time, end_time, filter_stations, filter_entrances)
+FILTERS: tuple = ((0, 24, True, True), (6, 9, True, True), (17, 19, False, False), (0, 24, False, True), (20, 24, True, False))
+
+
+class TestTokenizer(SyntheticFileTestCase):
+
+    def setUp(self):
+        super().setUp()
+        with open(self.file_name, "rb") as file:
+            self.content = file.read()
+        self.first_row = self.content.index(b"\n") + 1
+
+    def rows(self, scan, *filters, **kwargs):
+        offsets, _, _ = scan(self.content, k16(), *filters, start=self.first_row, **kwargs)
+        return [self.content[offsets[i]:offsets[i + 1]].decode("utf-8").split(",") for i in range(0, len(offsets), 2)]
+
+    def test_reference_matches_expected_rows(self):
+        for filters in FILTERS:
+            self.assertEqual(self.rows(py_scan_rows, *filters), expected_rows(self.file_name, *filters))
+
+    def test_stops_at_end_time(self):
+        offsets, position, finished = py_scan_rows(self.content, k16(), 6, 9, start=self.first_row)
+        self.assertTrue(finished)
+        self.assertTrue(self.content.startswith(b"2025-02-11,09:", position))
+        self.assertLess(offsets[-1], position)
+
+    def test_leaves_last_row_when_not_final(self):
+        stop = self.content.index(b"\n", self.first_row + 1000) - 3
+        offsets, position, finished = py_scan_rows(self.content, k16(), 0, 24, False, False, start=self.first_row, stop=stop, final=False)
+        self.assertFalse(finished)
+        self.assertEqual(position, self.content.rindex(b"\n", 0, stop) + 1)
+        self.assertLess(offsets[-1], position)
+
+    def test_file_without_final_breakline(self):
+        content = self.content.rstrip(b"\n")
+        offsets, position, _ = py_scan_rows(content, k16(), 0, 24, False, False, start=self.first_row)
+        self.assertEqual(offsets, py_scan_rows(self.content, k16(), 0, 24, False, False, start=self.first_row)[0])
+        self.assertEqual(position, len(content))
+
+    def test_scan_file_matches_filter_rows(self):
+        for start_time, end_time, filter_stations, filter_entrances in FILTERS:
+            lines = iter_lines(self.file_name, start_time=start_time)
+            expected = [list(row) for row in filter_rows(lines, k16(), start_time, end_time, filter_stations, filter_entrances)]
+            for chunk_size in (100, 4096, 1 << 20):
+                rows = [list(row) for row in read_rows(self.file_name, k16(), start_time, end_time, filter_stations, filter_entrances, chunk_size)]
+                self.assertEqual(rows, expected)
+
+    def test_default_is_compiled_when_built(self):
+        if compiled_scan_rows is None or os.environ.get("TRANSMELO_PURE_PYTHON"):
+            self.assertIs(tokenizer.scan_rows, py_scan_rows)
+        else:
+            self.assertIs(tokenizer.scan_rows, compiled_scan_rows)
+
+
+@unittest.skipIf(compiled_scan_rows is None, "The compiled tokenizer is not built")
+class TestCompiledTokenizer(SyntheticFileTestCase):
+    """Differential test: the compiled tokenizer against the reference one"""
+    SEED = 7
+
+    def setUp(self):
+        super().setUp()
+        with open(self.file_name, "rb") as file:
+            self.content = file.read()
+        self.first_row = self.content.index(b"\n") + 1
+
+    def assertSameScan(self, content, *filters, **kwargs):
+        expected = py_scan_rows(content, k16(), *filters, **kwargs)
+        self.assertEqual(compiled_scan_rows(content, k16(), *filters, **kwargs), expected)
+
+    def test_same_offsets(self):
+        for filters in FILTERS:
+            self.assertSameScan(self.content, *filters, start=self.first_row)
+
+    def test_same_offsets_in_chunks(self):
+        # Every call starts where the previous one left the cut row
+        for filters in FILTERS:
+            position, finished = self.first_row, False
+            while not finished and position < len(self.content):
+                stop = position + 4093
+                offsets, position, finished = py_scan_rows(self.content, k16(), *filters, start=position, stop=stop, final=False)
+                self.assertEqual(compiled_scan_rows(self.content, k16(), *filters, start=stop - 4093, stop=stop, final=False), (offsets, position, finished))
+
+    def test_same_offsets_without_final_breakline(self):
+        content = self.content.rstrip(b"\n")
+        for filters in FILTERS:
+            self.assertSameScan(content, *filters, start=self.first_row)
+
+    def test_memory_map(self):
+        with open(self.file_name, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                self.assertSameScan(content, 6, 9, start=self.first_row)
+
+    def test_malformed_row(self):
+        with self.assertRaises(ValueError):
+            compiled_scan_rows(b"2025-02-11,xx:00:00,(33)Zona B AutoNorte\n", k16(), 0, 24)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import pickle
+import unittest
+
+from src.utilities.data_getter.aggregate import aggregate_ridership, aggregate_validations
+from src.utilities.data_getter.data_array import create_validations
+from src.utilities.data_getter.offset_index import build_index
+from src.utilities.data_getter.rows import parse_time, parse_validation
+from src.utilities.objects.route_list import k16
+from src.utilities.objects.validation import Validation
+from test import SyntheticFileTestCase
+from test.test_row_reader import expected_rows
+
+ROW = b"2025-02-11,17:03:09,(36)Zona G NQS Sur,(08102)NQS - Calle 38A Sur,(1)Acceso Norte,4010663,8,16"
+
+
+def expected_validations(file_name, start_time, end_time):
+    """Parses the rows of expected_rows with plain Python"""
+    return [
+        Validation(fields[0], parse_time(fields[1]), int(fields[2][1:3]), int(fields[3][1:6]),
+                   int(fields[4][1:fields[4].index(")")]), int(fields[5]), int(fields[6]), int(fields[7]))
+        for fields in expected_rows(file_name, start_time, end_time)
+    ]
+
+
+class TestValidation(unittest.TestCase):
+
+    def test_parse_validation(self):
+        validation = parse_validation(ROW)
+        self.assertEqual(validation.date, "2025-02-11")
+        self.assertEqual(validation.time, 17 * 3600 + 3 * 60 + 9)
+        self.assertEqual(validation.hour, 17)
+        self.assertEqual(validation.zone, 36)
+        self.assertEqual(validation.station, 8102)
+        self.assertEqual(validation.access, 1)
+        self.assertEqual(validation.device, 4010663)
+        self.assertEqual((validation.entrances, validation.exits), (8, 16))
+        self.assertIn("station 08102", repr(validation))
+
+    def test_record_is_compact(self):
+        validation = parse_validation(ROW)
+        self.assertFalse(hasattr(validation, "__dict__"))
+        with self.assertRaises(AttributeError):
+            validation.entrances = 0
+
+    def test_equality_and_pickle(self):
+        validation = parse_validation(ROW)
+        self.assertEqual(validation, parse_validation(ROW))
+        self.assertNotEqual(validation, parse_validation(ROW.replace(b",8,", b",9,")))
+        self.assertEqual(pickle.loads(pickle.dumps(validation)), validation)
+
+    def test_hash(self):
+        validation = parse_validation(ROW)
+        self.assertEqual(hash(validation), hash(parse_validation(ROW)))
+        records = {validation, parse_validation(ROW), parse_validation(ROW.replace(b",8,", b",9,"))}
+        self.assertEqual(len(records), 2)
+        self.assertIn(pickle.loads(pickle.dumps(validation)), records)
+
+
+class TestCreateValidations(SyntheticFileTestCase):
+    ROWS = 5000
+
+    def test_readers(self):
+        expected = expected_validations(self.file_name, 6, 9)
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(list(create_validations(self.file_name, k16(), 6, 9)), expected)
+        self.assertEqual(list(create_validations(self.file_name, k16(), 6, 9, use_mmap=True)), expected)
+        build_index(self.file_name)
+        self.assertEqual(list(create_validations(self.file_name, k16(), 6, 9)), expected)
+
+    def test_aggregate_validations(self):
+        validations = create_validations(self.file_name, k16(), 5, 11)
+        ridership = aggregate_validations(validations, k16(), 5, 11, 30)
+        expected = aggregate_ridership(self.file_name, k16(), 5, 11, 30)
+        self.assertEqual(list(ridership.entrances), list(expected.entrances))
+        self.assertEqual(list(ridership.exits), list(expected.exits))
+
+if __name__ == '__main__':
+    unittest.main()